@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the benchmark import hmloader from the repository root.
+import hmloader
+
+#Purpose: Compares the NumPy column loader against the original per-line parsing loop of readFile.
+#Usage: python benchmarks/bench_loader.py --rows 1000000 10000000 --step 1 10
+
+def writeEnergyFile(filename: str, rows: int, seed: int = 0, uneven: bool = False): # Writes a synthetic energy#.sph file with 7 columns and Fortran 'D' exponents.
+    """Writes 'rows' lines of 7 random columns in the same format Starsmasher uses for energy#.sph.
+    With uneven the values are written with '%g' instead, so the lines differ in length."""
+    rng = np.random.default_rng(seed)
+    block = 200000 # Rows are written in blocks so the 10M row file never needs to be held in memory.
+    with open(filename, 'w') as out:
+        for start in range(0, rows, block):
+            data = rng.random((min(block, rows - start), 7)) * 1e5
+            lines = np.char.mod('%g' if uneven else '%.14E', data) # Formats every value with the same width as the Fortran output, unless uneven.
+            text = '\n'.join(' '.join(row) for row in lines.tolist()) + '\n'
+            out.write(text.replace('E', 'D'))
+
+def legacyLoop(filename: str, columns: list, stepsize: int = 1): # A copy of the per-line loop readFile used before hmloader.loadColumns.
+    """Reads the selected columns the same way the original readFile did, one line at a time."""
+    cols = [[] for i in columns]
+    j: int = 0
+    with open(filename) as Data:
+        for line in Data:
+            if j % stepsize == 0:
+                row = line.split()
+                for k, c in enumerate(columns):
+                    cols[k].append(float(row[c].replace('D', 'E')))
+            j += 1
+    return cols
+
+def timeIt(func, *args) -> float: # Returns the wall time in seconds of a single call.
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark hmloader.loadColumns against the original readFile loop.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000000, 10000000], help="number of rows in each synthetic file")
+    parser.add_argument('--step', type=int, nargs='+', default=[1, 10], help="stepsize values to test")
+    parser.add_argument('--columns', type=int, nargs='+', default=[0, 1, 2, 3], help="0-based columns to read")
+    parser.add_argument('--skip-legacy', action='store_true', help="only time the NumPy loader")
+    parser.add_argument('--uneven', action='store_true', help="write lines of different lengths instead of fixed width Fortran output")
+    parser.add_argument('--sidecar', action='store_true', help="let the loader write and reuse sidecar files between the timed steps")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'rows':>10} {'step':>5} {'legacy (s)':>11} {'numpy (s)':>10} {'speedup':>8}")
+        for rows in args.rows:
+            filename = os.path.join(tmp, f'energy{rows}.sph')
+            writeEnergyFile(filename, rows, uneven = args.uneven)
+            for step in args.step:
+                new = timeIt(hmloader.loadColumns, filename, args.columns, step, 0, None, args.sidecar) # Without sidecars every step parses the text instead of reading the columns saved by the step before.
+                if args.skip_legacy:
+                    print(f"{rows:>10} {step:>5} {'-':>11} {new:>10.3f} {'-':>8}")
+                    continue
+                old = timeIt(legacyLoop, filename, args.columns, step)
+                print(f"{rows:>10} {step:>5} {old:>11.3f} {new:>10.3f} {old/new:>7.1f}x")
+            os.remove(filename)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import numpy as np
+import matplotlib
+matplotlib.use('Agg') # Renders without a display, has to be chosen before pyplot is imported.
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the benchmark import hmloader and hmplot from the repository root.
+import hmloader
+import hmplot
+from bench_loader import writeEnergyFile, timeIt
+
+#Purpose: Times header detection, column loading, trendline fits and headless rendering on synthetic Starsmasher data.
+#Usage: python benchmarks/bench_suite.py --rows 100000 1000000 --save before.json
+#       python benchmarks/bench_suite.py --rows 100000 1000000 --baseline before.json
+
+#------------------------------------------------------------------------------------------------#
+# Every file is generated from a fixed seed, so two runs of the suite time the same bytes:       #
+# energy#.sph (7 columns), col####.sph (16 columns) both with Fortran 'D' exponents, and a wide  #
+# user table with a header line. Every benchmark is run --repeat times from a cold loader (no    #
+# schema, row index or sidecar left over from the run before) and the fastest run is kept, the   #
+# one least disturbed by the rest of the machine. The files stay in the OS page cache, so the   #
+# loads time parsing rather than the disk.                                                       #
+#                                                                                                #
+# --save stores the times with the versions and commit they were measured on. --baseline        #
+# compares against a saved run and exits with 1 if anything got slower than --threshold allows. #
+#------------------------------------------------------------------------------------------------#
+
+def writeColFile(filename: str, rows: int, seed: int = 0): # Writes a synthetic col####.sph file with 16 columns and Fortran 'D' exponents.
+    """Writes 'rows' lines of 16 columns spanning many decades, like the radius, density and energies of a snapshot."""
+    rng = np.random.default_rng(seed)
+    block = 200000
+    with open(filename, 'w') as out:
+        for start in range(0, rows, block):
+            data = rng.random((min(block, rows - start), 16)) * 10.0 ** rng.integers(-20, 35, 16) # Every column gets its own order of magnitude.
+            lines = np.char.mod('%.14E', data)
+            text = '\n'.join(' '.join(row) for row in lines.tolist()) + '\n'
+            out.write(text.replace('E', 'D'))
+
+def writeUserTable(filename: str, rows: int, columns: int, seed: int = 0): # Writes a wide user file: a header line of names and 'columns' values per row.
+    """Writes a header line 't c1 c2 ...' followed by 'rows' lines of plain E formatted numbers."""
+    rng = np.random.default_rng(seed)
+    block = max(2000000 // columns, 1000) # About the same amount of text per block as the other files.
+    with open(filename, 'w') as out:
+        out.write(' '.join(['t'] + [f'c{i}' for i in range(1, columns)]) + '\n')
+        for start in range(0, rows, block):
+            data = rng.standard_normal((min(block, rows - start), columns))
+            data[:, 0] = np.arange(start, start + len(data)) # Increasing time column, like a real run.
+            lines = np.char.mod('%.8e', data)
+            out.write('\n'.join(' '.join(row) for row in lines.tolist()) + '\n')
+
+def coldStart(sidecars: str): # Forgets everything the loader remembers about the files, so each run starts from the text.
+    hmloader._SCHEMAS.clear()
+    hmloader._TABLES.clear()
+    shutil.rmtree(sidecars, ignore_errors = True)
+
+def render(graph, *args, **kwargs): # Builds a figure with show=False, draws it with Agg and closes it.
+    fig = graph(*args, show = False, **kwargs)
+    fig.canvas.draw()
+    plt.close(fig)
+
+def benchmarks(tmp: str, args: argparse.Namespace) -> list: # (name, function, arguments) of every benchmark, generating the files on the way.
+    tasks = []
+    for rows in args.rows:
+        files = {'energy': (os.path.join(tmp, f'energy{rows}.sph'), [0, 1, 2, 3], 0),
+                 'col': (os.path.join(tmp, f'col{rows}.sph'), [0, 1, 2], 0),
+                 'wide': (os.path.join(tmp, f'wide{rows}.dat'), [0, 5, 17, 42 % args.wide], 1)} # file, columns read, header lines
+        writeEnergyFile(files['energy'][0], rows)
+        writeColFile(files['col'][0], rows)
+        writeUserTable(files['wide'][0], rows, args.wide)
+        for kind, (filename, columns, skiprows) in files.items():
+            tasks.append((f'header {kind} {rows}', hmloader.readSchema, (filename,)))
+            for step in args.step:
+                tasks.append((f'load {kind} {rows} step {step}', lambda f, c, s, k: hmloader.loadColumns(f, c, s, k, sidecar = False), (filename, columns, step, skiprows)))
+            tasks.append((f'load {kind} {rows} mapped', lambda f, c, k: hmloader.loadColumns(f, c, 1, k, mapped = True), (filename, columns, skiprows)))
+        data = hmloader.loadColumns(files['energy'][0], list(range(7)), sidecar = False)
+        labels = list(hmloader.ENERGY_NAMES)
+        for degree in args.degree:
+            tasks.append((f'fit {rows} degree {degree}', hmplot.fitTrendlines, (data[0], data[1:], degree)))
+        tasks.append((f'grph {rows}', lambda: render(hmplot.grph, labels, data, 'bench', 6, downsample = args.downsample), ()))
+        tasks.append((f'onePlot2D {rows}', lambda: render(hmplot.onePlot2D, labels, data, 'bench', 6, downsample = args.downsample), ()))
+        tasks.append((f'threeDGrph {rows}', lambda: render(hmplot.threeDGrph, data[:3], labels[:3], False, 'bench', 1), ()))
+    return tasks
+
+def environment() -> dict: # What the times were measured on, stored with them.
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output = True, text = True, cwd = os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ''
+    return {'date': datetime.datetime.now().isoformat(timespec = 'seconds'), 'commit': commit, 'python': platform.python_version(),
+            'numpy': np.__version__, 'matplotlib': matplotlib.__version__, 'machine': platform.platform(), 'cpus': os.cpu_count()}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark parsing, fitting and rendering of Hypermongo on synthetic Starsmasher data.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000, 1000000], help="number of rows in each synthetic file")
+    parser.add_argument('--step', type=int, nargs='+', default=[1, 10], help="stepsize values to load with")
+    parser.add_argument('--wide', type=int, default=60, help="number of columns of the wide user table")
+    parser.add_argument('--degree', type=int, nargs='+', default=[1, 5], help="trendline degrees to fit")
+    parser.add_argument('--downsample', choices=hmplot.DOWNSAMPLE_METHODS, default='minmax', help="downsampling of the rendered line plots")
+    parser.add_argument('--repeat', type=int, default=3, help="runs of every benchmark, the fastest is kept")
+    parser.add_argument('--only', default='', help="regular expression, only the benchmarks whose name matches are run")
+    parser.add_argument('--save', help="JSON file to store the results in")
+    parser.add_argument('--baseline', help="JSON file of an earlier --save to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10, help="slowdown that counts as a regression, 0.10 is 10%%")
+    args = parser.parse_args(argv)
+
+    baseline: dict = {}
+    if args.baseline:
+        with open(args.baseline) as saved:
+            baseline = json.load(saved)['results']
+    results: dict = {}
+    regressions: int = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        sidecars = os.path.join(tmp, 'sidecars')
+        hmloader.SIDECAR_DIR = sidecars # Row indexes of the mapped loads go here, never next to real data.
+        print(f"{'benchmark':<32} {'time (s)':>9} {'baseline':>9} {'ratio':>7}")
+        for name, func, arguments in benchmarks(tmp, args):
+            if args.only and not re.search(args.only, name):
+                continue
+            times = []
+            for run in range(args.repeat):
+                coldStart(sidecars)
+                times.append(timeIt(func, *arguments))
+            results[name] = min(times)
+            if name in baseline:
+                ratio = results[name] / baseline[name]
+                verdict = 'slower' if ratio > 1 + args.threshold else ('faster' if ratio < 1 / (1 + args.threshold) else '')
+                regressions += verdict == 'slower'
+                print(f"{name:<32} {results[name]:>9.4f} {baseline[name]:>9.4f} {ratio:>6.2f}x {verdict}", flush = True)
+            else:
+                print(f"{name:<32} {results[name]:>9.4f} {'-':>9} {'-':>7}", flush = True)
+    if args.save:
+        with open(args.save, 'w') as out:
+            json.dump({'environment': environment(), 'options': vars(args), 'results': results}, out, indent = 1)
+    if args.baseline:
+        print(f"{regressions} of {len(set(results) & set(baseline))} benchmarks slower than the baseline by more than {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+
+import time
+_START: float = time.perf_counter() # Startup is timed from here, before matplotlib and NumPy are imported.
+
+from typing import List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import argparse
+import copy
+import os
+import shlex
+import sys
+import numpy as np
+import matplotlib
+matplotlib.use('Agg') # Non-interactive backend, has to be chosen before pyplot is imported. Needs no display and no PyQt5.
+import matplotlib.pyplot as plt
+import hmloader
+import hmplot
+import hmexpr
+import hmprofile
+
+#Purpose: Command line entry point of Hypermongo that renders plots straight to image files.
+#Usage: python Hypermongo.py plot --file energy3.sph --x time --y W T U --out w.png
+#       python Hypermongo.py plot --file run1/energy3.sph run2/energy3.sph --compare --x time --y W --out runs.png
+#       python Hypermongo.py batch --file col.sph --range 0 2000 --x radius --y density --out 'frames/{stem}.png'
+#Author: All rights reserved by Jacky Tran, jtran9148@gmail.com
+
+#------------------------------------------------------------------------------------------------#
+# Headless plotting for compute nodes and post-processing pipelines.                             #
+#                                                                                                #
+# Uses the same loader (hmloader) and graphing functions (hmplot.grph, onePlot2D, threeDGrph) as #
+# the GUI, on the Agg backend, and never imports PyQt5. Columns are picked by name or by their   #
+# 1-based number like in the GUI lists. Any number of figures can be rendered in one invocation: #
+# give several files to --file, or list one figure per line in a --batch file, so the startup   #
+# cost is only paid once and repeated plots of a file come out of the column cache.             #
+#                                                                                                #
+# The batch subcommand renders the same plot for every snapshot of a numbered series           #
+# (col0000.sph ... col2000.sph, energy#.sph) into numbered frames. Snapshots are independent, so #
+# they are parsed and rendered in a pool of worker processes, one per CPU core by default       #
+# (--jobs), and the batch scales with the number of cores.                                       #
+#                                                                                                #
+# With --compare every --file goes into one figure instead, the same columns of each file read   #
+# at the same time on threads and overlaid on a common x grid (hmplot.compareGrph).             #
+#                                                                                                #
+# The startup time and the load and render time of every figure are reported on stdout, and the #
+# stage times and counters of hmprofile after each figure when HYPERMONGO_PROFILE is set.        #
+#------------------------------------------------------------------------------------------------#
+
+def buildParser() -> argparse.ArgumentParser: # Arguments of every subcommand.
+    parser = argparse.ArgumentParser(prog='Hypermongo.py', description="Render Hypermongo plots to image files without the GUI.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    plot = commands.add_parser('plot', help="plot columns of one or more files", description="Plot columns of one or more files. Columns are given by name or 1-based number.")
+    plot.add_argument('--file', nargs='+', help="data file(s), one figure each")
+    plot.add_argument('--compare', action='store_true', help="overlay the columns of every --file in one figure, interpolated onto a common x grid")
+    addFigureOptions(plot)
+    plot.add_argument('--batch', help="text file with the options of more figures, one set per line, added on top of the ones given here")
+    addPlotOptions(plot)
+    batch = commands.add_parser('batch', help="plot every snapshot of a numbered series in parallel", description="Render the same plot for every file of a numbered series, i.e. col0000.sph ... col2000.sph, on all CPU cores.")
+    batch.add_argument('--file', required=True, help="series name like in the GUI (col.sph, energy.sph) or a pattern such as 'out{n:03d}.dat'")
+    batch.add_argument('--range', nargs=2, type=int, required=True, metavar=('FIRST', 'LAST'), help="first and last file number, both included")
+    batch.add_argument('--every', type=int, default=1, help="only plot every n-th file number (default: 1)")
+    addFigureOptions(batch)
+    addPlotOptions(batch)
+    return parser
+
+def addFigureOptions(parser: argparse.ArgumentParser): # Which columns go into a figure and where it is saved.
+    parser.add_argument('--x', help="x-axis column")
+    parser.add_argument('--y', nargs='+', help="y-axis column(s), one subplot each, or ranges of column numbers such as 2-40")
+    parser.add_argument('--z', help="z-axis column, makes a 3-D plot of a single --y column")
+    parser.add_argument('--define', action='append', default=[], metavar='NAME=EXPR', help="add a column computed from the others, i.e. 'r=sqrt(x^2+y^2+z^2)', to use in --x, --y and --z (repeatable)")
+    parser.add_argument('--out', default='{stem}.png', help="output file pattern, may use {stem}, {name}, {dir}, {index} and the file number {n} (default: {stem}.png)")
+
+def addPlotOptions(parser: argparse.ArgumentParser): # Styling options shared by every plotting subcommand, same as the GUI's check boxes and spin boxes.
+    parser.add_argument('--step', type=int, default=1, help="read every n-th row (default: 1)")
+    parser.add_argument('--scatter', action='store_true', help="scatter plot instead of lines")
+    parser.add_argument('--size', type=int, default=1, help="scatter point size (default: 1)")
+    parser.add_argument('--density', action='store_true', help="draw 2-D scatter plots as a log scaled density image of the points")
+    parser.add_argument('--share-x', action='store_true', help="share the x-axis between subplots")
+    parser.add_argument('--one-plot', action='store_true', help="draw every y column on the same axes")
+    parser.add_argument('--trendline', type=int, metavar='DEG', help="add a polynomial trendline of this degree")
+    parser.add_argument('--legend', action='store_true', help="show legends")
+    parser.add_argument('--downsample', choices=hmplot.DOWNSAMPLE_METHODS, default='minmax', help="downsampling of long line plots (default: minmax)")
+    parser.add_argument('--mapped', action='store_true', help="memory map the file and parse only the plotted rows")
+    parser.add_argument('--dpi', type=float, help="resolution of the image (default: 100)")
+    parser.add_argument('--jobs', type=int, default=availableCores(), help=f"number of worker processes (default: all {availableCores()} cores)")
+
+def availableCores() -> int: # Cores this process may run on, which on a cluster node can be fewer than os.cpu_count().
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def columnIndex(value: str, names: List[str], filename: str) -> int: # Turns a column name or 1-based number into a 0-based index.
+    if value.isdigit() and 1 <= int(value) <= len(names):
+        return int(value) - 1
+    if value in names:
+        return names.index(value)
+    raise ValueError(f"{filename}: no column '{value}', the columns are: {' '.join(names)}")
+
+def columnIndices(value: str, names: List[str], filename: str) -> List[int]: # Like columnIndex, and also takes a range 'first-last' of 1-based numbers.
+    first, dash, last = value.partition('-')
+    if value not in names and dash and first.isdigit() and last.isdigit():
+        return list(range(columnIndex(first, names, filename), columnIndex(last, names, filename) + 1))
+    return [columnIndex(value, names, filename)]
+
+def pageName(out: str, page: int, pages: int) -> str: # File of one page of a figure with more panels than fit on a page: w.png, w-p2.png, ...
+    if page == 0:
+        return out
+    stem, ext = os.path.splitext(out)
+    return f"{stem}-p{page+1}{ext}"
+
+def outputName(pattern: str, filename: str, index: int, number: Optional[int] = None) -> str: # Fills in the --out pattern for one figure.
+    name = os.path.basename(filename)
+    stem, extension = os.path.splitext(name)
+    if extension in [suffix for magic, suffix in hmloader.COMPRESSIONS.values()]: # energy3.sph.gz gives energy3 like energy3.sph.
+        stem = os.path.splitext(stem)[0]
+    return pattern.format(stem=stem, name=name, dir=os.path.dirname(filename) or '.', index=index, n=index if number is None else number)
+
+def loadFigure(options: argparse.Namespace, filename: str) -> Tuple[List[str], List[np.ndarray]]: # Reads the --x, --y and --z columns of one file. Returns their labels and data.
+    schema = hmloader.fileSchema(filename)
+    derived = hmexpr.DerivedColumns(len(schema.names))
+    for text in options.define: # Numbered after the columns of the file, like in the GUI.
+        derived.add(hmexpr.Expression(text, schema.names))
+    names = schema.names + derived.names()
+    columns = [columnIndex(options.x, names, filename)] + [i for y in options.y for i in columnIndices(y, names, filename)]
+    if options.z:
+        columns.append(columnIndex(options.z, names, filename))
+    data = derived.load(filename, columns, options.step, schema.headerLines, cache = hmloader.CACHE, mapped = options.mapped) # Derived columns only read their source columns.
+    return [hmplot.subscriptName([names[i]], 1)[0] if i < derived.ncols else derived.label(i) for i in columns], data
+
+def renderPlot(options: argparse.Namespace, filename: str, out: str) -> Tuple[float, float, List[str]]:
+    """Loads the selected columns of one file, draws them with the GUI's graphing functions
+    and saves the figure to out, one file per page (pageName) when there are more y columns than
+    fit on a page. Returns the load and render times in seconds and a line with
+    the coefficients and residuals of every trendline.
+    """
+    start = time.perf_counter()
+    labels, data = loadFigure(options, filename)
+    loaded = time.perf_counter()
+    if options.z:
+        fig = hmplot.threeDGrph(data, labels, options.scatter, filename, options.size, show = False)
+    else:
+        graph = hmplot.onePlot2D if options.one_plot else hmplot.grph
+        fig = graph(labels, data, filename, len(data) - 1, options.share_x, options.scatter, options.size, options.trendline is not None, options.trendline or 1, options.legend, options.downsample, show = False, density = options.density)
+    pager = getattr(fig, 'pager', None) # More y columns than PANELS_PER_PAGE: every page is saved.
+    pages = pager.pages if pager is not None else 1
+    fits: List[str] = []
+    try:
+        for page in range(pages):
+            if page:
+                pager.showPage(page) # Draws from the columns already loaded.
+            fits += [artist.fit.describe() for artist in hmplot.figureArtists(fig, 'trendline')]
+            with hmprofile.stage('draw'):
+                fig.savefig(pageName(out, page, pages), dpi = options.dpi or 'figure')
+            hmprofile.count('points drawn', hmplot.pointsDrawn(fig))
+    finally:
+        plt.close(fig) # Frees the figure, otherwise hundreds of figures pile up in pyplot.
+    return loaded - start, time.perf_counter() - loaded, fits
+
+def renderCompare(options: argparse.Namespace, filenames: Tuple[str, ...], out: str) -> Tuple[float, float, List[str]]:
+    """Loads the same columns of several files on one thread each, overlays them with
+    hmplot.compareGrph and saves the figure to out. Returns the load and render times like renderPlot.
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers = min(len(filenames), 32)) as pool: # Reading mostly waits on the disk, so the files load in about the time of the slowest one.
+        runs = list(pool.map(hmprofile.bind(hmprofile.current(), lambda filename: loadFigure(options, filename)), filenames))
+    loaded = time.perf_counter()
+    grid, aligned = hmplot.alignRuns([data for labels, data in runs])
+    names = hmplot.runNames(filenames)
+    fig = hmplot.compareGrph(runs[0][0], grid, aligned, names, ", ".join(names), len(runs[0][1]) - 1, options.share_x, options.scatter, options.size, options.downsample, options.one_plot, show = False)
+    try:
+        with hmprofile.stage('draw'):
+            fig.savefig(out, dpi = options.dpi or 'figure')
+        hmprofile.count('points drawn', hmplot.pointsDrawn(fig))
+    finally:
+        plt.close(fig)
+    return loaded - start, time.perf_counter() - loaded, []
+
+def renderFrame(options: argparse.Namespace, filename: str, out: str) -> Tuple[str, float, float, str, List[str], str]: # Runs renderPlot in a worker process.
+    """Renders one figure and returns (out, load time, render time, error message, trendlines,
+    hmprofile summary). Errors are returned instead of raised so one bad snapshot does not stop
+    the rest of the batch. The summary is empty unless profiling is on.
+    """
+    profile = hmprofile.begin(out)
+    try:
+        draw = renderCompare if isinstance(filename, tuple) else renderPlot # --compare hands in every file of the figure.
+        with hmprofile.use(profile):
+            load, render, fits = draw(options, filename, out)
+    except (OSError, ValueError) as error: # Missing files, unknown columns, ColumnMismatchError and TrendlineError only skip that figure.
+        plt.close('all') # A trendline error leaves its half drawn figure open.
+        return out, 0.0, 0.0, str(error), [], ''
+    return out, load, render, '', fits, hmprofile.finish(profile) if profile is not None else ''
+
+def initWorker(): # Runs once in every worker process.
+    hmloader.CACHE.setBudget(0) # Each snapshot is read once, caching its columns would only cost memory in every worker.
+    hmloader.PARSE_JOBS = 1 # The workers already keep every core busy with a snapshot each.
+
+def renderFigures(figures: List[Tuple[argparse.Namespace, str, str]], jobs: int = 1) -> int:
+    """Renders (options, filename, out) figures, in this process or in a pool of jobs worker
+    processes, and prints each one as it finishes. Returns the number of failed figures.
+    """
+    failed: int = 0
+    if jobs > 1 and len(figures) > 1:
+        with ProcessPoolExecutor(max_workers = min(jobs, len(figures)), initializer = initWorker) as pool:
+            results = [pool.submit(renderFrame, *figure) for figure in figures]
+            for result in as_completed(results): # Printed in the order they finish, not in file order.
+                failed += report(*result.result())
+    else:
+        for figure in figures:
+            failed += report(*renderFrame(*figure))
+    return failed
+
+def report(out: str, load: float, render: float, error: str, fits: List[str] = (), profile: str = '') -> int: # Prints the outcome of one figure, returns 1 if it failed.
+    if error:
+        print(f"{out}: {error}", file = sys.stderr)
+        return 1
+    print(f"{out}  load {load:.3f} s  render {render:.3f} s", flush = True)
+    for fit in fits:
+        print(f"    {fit}", flush = True)
+    if profile:
+        print(f"    {profile}", flush = True)
+    return 0
+
+def readBatch(args: argparse.Namespace) -> List[argparse.Namespace]: # One set of options per figure group: the command line itself plus every line of --batch.
+    jobs = [args] if args.file else []
+    if args.batch:
+        lineParser = argparse.ArgumentParser(prog=f'{args.batch} line', add_help=False)
+        lineParser.add_argument('--file', nargs='+')
+        lineParser.add_argument('--compare', action='store_true')
+        addFigureOptions(lineParser)
+        addPlotOptions(lineParser)
+        with open(args.batch) as Batch:
+            for line in Batch:
+                if line.strip() and not line.lstrip().startswith('#'):
+                    jobs.append(lineParser.parse_args(shlex.split(line), namespace = copy.copy(args))) # Options missing from the line keep their command line values.
+    return jobs
+
+def checkOptions(parser: argparse.ArgumentParser, options: argparse.Namespace): # Stops with a usage error for options argparse cannot check on its own.
+    if not options.file or not options.x or not options.y:
+        parser.error("every figure needs --file, --x and --y")
+    if options.z and len(options.y) != 1:
+        parser.error("a 3-D plot (--z) takes exactly one --y column")
+    if options.step < 1:
+        parser.error("--step must be at least 1")
+    if options.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if getattr(options, 'compare', False) and (options.z or options.trendline is not None or options.density):
+        parser.error("--compare draws 2-D line or scatter plots, without --z, --trendline or --density")
+
+def plotCommand(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int: # Runs the 'plot' subcommand and reports the time of every figure.
+    figures: List[Tuple[argparse.Namespace, str, str]] = []
+    for options in readBatch(args):
+        checkOptions(parser, options)
+        if options.compare: # One figure for all of the files.
+            figures.append((options, tuple(options.file), outputName(options.out, options.file[0], len(figures))))
+            continue
+        for filename in options.file:
+            figures.append((options, filename, outputName(options.out, filename, len(figures))))
+    if not figures:
+        parser.error("nothing to plot, give --file or --batch")
+    return renderAndTime(parser, figures, args.jobs)
+
+def batchCommand(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int: # Runs the 'batch' subcommand over a range of file numbers.
+    checkOptions(parser, args)
+    first, last = args.range
+    if args.every < 1:
+        parser.error("--every must be at least 1")
+    figures: List[Tuple[argparse.Namespace, str, str]] = []
+    missing: int = 0
+    for number in range(first, last + 1, args.every):
+        filename = hmloader.findFile(hmloader.numberedFilename(args.file, number)) # col0042.sph or its compressed col0042.sph.gz.
+        if not os.path.isfile(filename): # Gaps in the series are skipped, like the GUI refuses file numbers that do not exist.
+            missing += 1
+            continue
+        figures.append((args, filename, outputName(args.out, filename, len(figures), number)))
+    if missing:
+        print(f"{missing} file numbers between {first} and {last} do not exist and are skipped", file = sys.stderr)
+    if not figures:
+        parser.error(f"no files of {args.file} between {first} and {last}")
+    return renderAndTime(parser, figures, args.jobs)
+
+def renderAndTime(parser: argparse.ArgumentParser, figures: List[Tuple[argparse.Namespace, str, str]], jobs: int) -> int: # Renders the figures and reports the startup, per-figure and total times.
+    outs = [out for options, filename, out in figures]
+    if len(set(outs)) < len(outs):
+        parser.error("several figures would be saved to the same file, add {stem}, {n} or {index} to --out")
+    for folder in set(os.path.dirname(out) for out in outs):
+        if folder:
+            os.makedirs(folder, exist_ok = True)
+    startup = time.perf_counter() - _START
+    print(f"startup {startup:.3f} s")
+    failed = renderFigures(figures, jobs)
+    total = time.perf_counter() - _START
+    print(f"{len(figures) - failed} of {len(figures)} figures in {total:.3f} s ({total - startup:.3f} s after startup, {jobs} jobs)")
+    return 1 if failed else 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = buildParser()
+    args = parser.parse_args(argv)
+    if args.command == 'plot':
+        return plotCommand(parser, args)
+    if args.command == 'batch':
+        return batchCommand(parser, args)
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(main())
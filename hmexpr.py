@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+from typing import Dict, List, Sequence
+import ast
+import os
+import re
+import numpy as np
+import hmloader
+
+#Purpose: Derived columns of Hypermongo, computed with NumPy from the columns of a file.
+#Author: All rights reserved by Jacky Tran, jtran9148@gmail.com
+
+#------------------------------------------------------------------------------------------------#
+# Quantities such as E/W, T+U or sqrt(x^2+y^2+z^2) are typed as an expression over the column    #
+# names and become a column of their own, next to the ones in the file. An Expression is parsed  #
+# and checked once: only numbers, column names, arithmetic and the functions in FUNCTIONS are    #
+# allowed, so nothing typed into the box can run other Python code. It is then evaluated on the  #
+# whole column arrays at NumPy speed, CHUNK_ROWS rows at a time so the temporaries of a long     #
+# expression stay small next to the columns themselves. Columns are named as in the lists, by   #
+# number ($3 is the third column) or in back quotes (`x-pos`) when the name is not a plain word. #
+#                                                                                                #
+# DerivedColumns numbers the expressions after the columns of the file and reads only the source #
+# columns they use, in the same single pass and from the same cache as every other column.       #
+#------------------------------------------------------------------------------------------------#
+
+class ExpressionError(ValueError): # Raised for an expression that cannot be used: bad syntax, unknown names or functions.
+    pass
+
+FUNCTIONS: Dict[str, np.ufunc] = {'sqrt': np.sqrt, 'abs': np.abs, 'exp': np.exp, 'log': np.log, 'log10': np.log10, 'log2': np.log2,
+                                  'sin': np.sin, 'cos': np.cos, 'tan': np.tan, 'arcsin': np.arcsin, 'arccos': np.arccos, 'arctan': np.arctan,
+                                  'arctan2': np.arctan2, 'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh, 'hypot': np.hypot,
+                                  'minimum': np.minimum, 'maximum': np.maximum, 'floor': np.floor, 'ceil': np.ceil, 'sign': np.sign} # Functions an expression may call.
+CONSTANTS: Dict[str, float] = {'pi': np.pi} # Names that are numbers, unless a column has the same name.
+CHUNK_ROWS: int = int(os.environ.get('HYPERMONGO_EXPR_ROWS', 1 << 16)) # Rows evaluated at a time, 512 kB per temporary array.
+
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub)
+_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Constant, ast.Load) + _OPERATORS
+
+class Expression(object): # A derived column: text over column names, compiled once and evaluated on whole columns.
+    """Parses 'expression' or 'name = expression' over the column names of a file.
+    columns lists the 0-based file columns the expression reads, in the order evaluate wants them.
+    """
+
+    def __init__(self, text: str, names: Sequence[str]):
+        self.text: str = text.strip()
+        name, equals, body = self.text.partition('=')
+        if equals and re.fullmatch(r'\s*\w+\s*', name) and not body.startswith('='): # 'r = sqrt(...)' names the column.
+            self.name, body = name.strip(), body
+            if self.name in names:
+                raise ExpressionError(f"'{self.text}': the file already has a column named {self.name}")
+        else:
+            self.name, body = self.text, self.text
+        self.columns: List[int] = []
+        self._refs: set = set() # Variable names the column references were turned into.
+        body = re.sub(r'`([^`]*)`', lambda match: self._ref(list(names).index(match.group(1)) if match.group(1) in names else -1, match.group(0), names), body) # `x-pos`
+        body = re.sub(r'\$(\d+)', lambda match: self._ref(int(match.group(1)) - 1, match.group(0), names), body) # $3
+        try:
+            tree = ast.parse(body.strip().replace('^', '**'), mode = 'eval') # ^ is a power like in SM, with the precedence of ** so x^2+y^2 means what it says.
+        except SyntaxError as error:
+            raise ExpressionError(f"'{self.text}' is not a valid expression: {error.msg}") from None
+        for node in ast.walk(tree):
+            if not isinstance(node, _NODES):
+                raise ExpressionError(f"'{self.text}': {type(node).__name__.lower()} is not allowed, only numbers, columns, + - * / ^ and functions")
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+                raise ExpressionError(f"'{self.text}': {node.value!r} is not a number")
+            if isinstance(node, ast.Constant):
+                node.value = float(node.value) # Python would work out 10^10^10 as an exact integer forever.
+            if isinstance(node, ast.Call) and (not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords):
+                raise ExpressionError(f"'{self.text}': unknown function, the functions are: {' '.join(FUNCTIONS)}")
+        called = {id(node.func) for node in ast.walk(tree) if isinstance(node, ast.Call)}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and node.id in FUNCTIONS and id(node) not in called:
+                raise ExpressionError(f"'{self.text}': {node.id} is a function, write {node.id}(...)")
+            if isinstance(node, ast.Name) and not (id(node) in called or node.id in self._refs):
+                if node.id in names:
+                    node.id = self._ref(list(names).index(node.id), node.id, names)
+                elif node.id not in CONSTANTS:
+                    raise ExpressionError(f"'{self.text}': no column '{node.id}', the columns are: {' '.join(names)}")
+        if not self.columns:
+            raise ExpressionError(f"'{self.text}' does not use any column")
+        self._code = compile(tree, '<expression>', 'eval')
+        try:
+            self.evaluate([np.ones(1)] * len(self.columns)) # Wrong numbers of arguments only show when the code runs.
+        except (TypeError, ValueError, ArithmeticError) as error: # ArithmeticError: 1/0 or an overflow between numbers only.
+            raise ExpressionError(f"'{self.text}': {error}") from None
+
+    def _ref(self, col: int, text: str, names: Sequence[str]) -> str: # Variable name of file column col in the compiled code.
+        if not 0 <= col < len(names):
+            raise ExpressionError(f"'{self.text}': no column {text}, the columns are 1 to {len(names)}")
+        if col not in self.columns:
+            self.columns.append(col)
+        self._refs.add(f'_c{col}')
+        return f'_c{col}'
+
+    @property
+    def label(self) -> str: # Axis label, with $ kept away from matplotlib's mathtext.
+        return self.name.replace('$', r'\$')
+
+    def evaluate(self, arrays: Sequence[np.ndarray], chunkRows: int = 0) -> np.ndarray:
+        """Computes the column from the arrays of self.columns, in that order. Returns a float64 array."""
+        arrays = [np.asarray(a) for a in arrays]
+        rows = len(arrays[0])
+        chunkRows = chunkRows or CHUNK_ROWS
+        out = np.empty(rows, dtype = np.float64)
+        space = {'__builtins__': {}, **FUNCTIONS, **CONSTANTS}
+        with np.errstate(all = 'ignore'): # Division by zero and logs of negative numbers give inf and NaN, which the plots leave out.
+            for start in range(0, rows, chunkRows):
+                for col, array in zip(self.columns, arrays):
+                    space[f'_c{col}'] = array[start:start + chunkRows]
+                out[start:start + chunkRows] = eval(self._code, space)
+        return out
+
+    def __repr__(self) -> str:
+        return f"Expression({self.text!r})"
+
+class DerivedColumns(object): # The derived columns of a plot window, numbered after the ncols columns of the file.
+    """Column indices below ncols are columns of the file, ncols and up are the expressions in
+    the order they were added. load() reads any mix of them like hmloader.loadColumns.
+    """
+
+    def __init__(self, ncols: int):
+        self.ncols: int = ncols
+        self.expressions: List[Expression] = []
+
+    def add(self, expression: Expression) -> int: # Returns the column index of the new column.
+        self.expressions.append(expression)
+        return self.ncols + len(self.expressions) - 1
+
+    def names(self) -> List[str]:
+        return [expression.name for expression in self.expressions]
+
+    def label(self, col: int) -> str: # Axis label of a derived column.
+        return self.expressions[col - self.ncols].label
+
+    def sources(self, columns: Sequence[int]) -> List[int]: # File columns to read for columns, each once.
+        needed: List[int] = []
+        for col in columns:
+            for source in (self.expressions[col - self.ncols].columns if col >= self.ncols else [col]):
+                if source not in needed:
+                    needed.append(source)
+        return needed
+
+    def assemble(self, columns: Sequence[int], sources: Sequence[int], arrays: Sequence[np.ndarray]) -> List[np.ndarray]: # Columns from the arrays read for sources(columns).
+        read = dict(zip(sources, arrays))
+        data = []
+        for col in columns:
+            if col < self.ncols:
+                data.append(read[col])
+            else:
+                expression = self.expressions[col - self.ncols]
+                data.append(expression.evaluate([read[source] for source in expression.columns]))
+        return data
+
+    def load(self, filename: str, columns: Sequence[int], stepsize: int = 1, skiprows: int = 0, **kwargs) -> List[np.ndarray]:
+        """Same as hmloader.loadColumns, and derived columns are computed from their source columns,
+        which are read in the same pass as the rest.
+        """
+        sources = self.sources(columns)
+        return self.assemble(columns, sources, hmloader.loadColumns(filename, sources, stepsize, skiprows, **kwargs))
@@ -0,0 +1,1243 @@
+#!/usr/bin/env python3
+
+import time
+_START: float = time.perf_counter() # Startup is timed from here, see startupReport().
+from typing import List, Optional, Tuple
+import functools
+import sys
+from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5.QtWidgets import *
+import importlib.util
+import re
+import os
+import hmprofile
+
+STARTUP: List[Tuple[str, float]] = [] # (stage, seconds since _START at its end), printed by startupReport() when HYPERMONGO_STARTUP is set.
+
+def startupStage(stage: str): # Marks the end of a stage of the startup.
+    STARTUP.append((stage, time.perf_counter() - _START))
+
+startupStage('import PyQt5')
+
+def startupReport() -> str: # One line per stage with its own time and the time since the start.
+    lines, last = [f"{'stage':<28}{'time':>9}{'total':>10}"], 0.0
+    for stage, end in STARTUP:
+        lines.append(f"{stage:<28}{end - last:7.3f} s{end:8.3f} s")
+        last = end
+    return '\n'.join(lines)
+
+def lazyImport(name: str): # Returns the module, which only runs its own imports the first time one of its attributes is used.
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+# matplotlib (with mpl_toolkits.mplot3d) and pyqtgraph take over a second to import, several from
+# the unpacked HypermongoLinux.exe on a cold disk, and nothing in the main window needs them. The
+# plotting modules are therefore imported by importPlotting() once the main window is on screen,
+# or by the first use of one of their names, whichever comes first. hmloader goes first so that
+# hmplot's own 'import hmloader' finds it.
+hmloader = lazyImport('hmloader')
+hmexpr = lazyImport('hmexpr')
+hmplot = lazyImport('hmplot')
+hmview = lazyImport('hmview')
+
+def importPlotting(): # Imports the plotting modules one at a time for the startup report. Runs from the event loop after the main window is shown.
+    QtWidgets.QApplication.processEvents() # Paints the window before the imports hold up the event loop.
+    startupStage('main window shown')
+    for module in (hmloader, hmexpr, hmplot, hmview): # On the GUI thread: the lazy modules of Python 3.11 must not be loaded from two threads at once.
+        module.__file__ # Any attribute runs the deferred import.
+        startupStage('import ' + module.__name__)
+    if os.environ.get('HYPERMONGO_STARTUP'):
+        print(startupReport())
+
+#Purpose: Uses pyplot and PyQt5 GUI to improve SM plots. This is the GUI, Hypermongo.py starts it.
+#Author: All rights reserved by Jacky Tran, jtran9148@gmail.com
+#Version: 2.9.2
+#Date: 11/15/2022
+
+#------------------------------------------------------------------------------------------------#
+# Reads energy#.sph + massAndMore.out + anyfile, computes and graphs time versus plots           #
+#                                                                                                #
+# New Features:                                                                                  #
+#              - Graphs now properly display scientific notation on the top-right corner         #
+#              - Can plot any file you choose that has tablature data format                     #
+#              - Can plot any 1 x-column you wish, vs. up to 6 y-columns at once                 #
+#              - Can make scatter plots with adjustable point sizes                              #
+#              - 3-Dimensional plots with an extra z-axis list.                                  #
+#              - Can also read col.sph files but doesn't match with parent.sph currently         #
+#              - Added new trendline option with degree of polynomial fitting.                   #
+#              - Legends added to each subplot, first degree polynomial displays linear equation.#
+# Changes&Bugs:                                                                                  #
+#              - Removed x-axis numbers for all other subplots except the bottom-most plot when  #
+#                using the shareax checked box                                                   #
+#              - Updated informational text to explain the new functions                         #
+#              - Changed massAndMore and energy plots to use the same user-input file.           #
+#              - Changed file number checking, numbering of columns, and counting columns        #
+# Future ideas:                                                                                  #
+#              - Implement additional output file reader for MESA simulations                    #
+#              - User customization for graphs instead of default look (seaborn?)                #
+#              - Complete col.sph plots with simultaneous plots of parent.sph                    #
+#              - Look into importing pandas to read and store data instead of while and for loops#
+#              - Add keypress function for 'Enter' key to speed up making plots                  #
+#------------------------------------------------------------------------------------------------#
+
+#---------------------------------------------------------------#
+# Below here are the two classes made for the GUI of Hypermongo #
+#---------------------------------------------------------------#
+
+class Ui_MainWindow(object): # Creates a class object for the main window of Hypermongo
+
+    def openWindow(self):  # Opens second window for energy/mass&more plots
+        self.window = QtWidgets.QDialog()
+        global FILENAME
+        if self.radioButton.isChecked():
+            FILENAME = 'energy.sph'
+        elif self.radioButton_2.isChecked(): # Creates error window for mass&more.out when button is selected
+            FILENAME = hmloader.findFile("massAndMore.out") # Archived runs may only have massAndMore.out.gz.
+            if not os.path.isfile(FILENAME): # Gives error message if 'massAndMore.out' is not in the current directory
+                self.show_popupM()
+                return
+        elif self.radioButton_3.isChecked():
+            FILENAME = hmloader.findFile(self.lineEdit.text()) # Also finds the file compressed with gzip, xz or zstd.
+            if not os.path.isfile(FILENAME): # Gives error message if 'massAndMore.out' is not in the current directory
+                self.show_popupUser(FILENAME)
+                return
+        elif self.radioButton_4.isChecked():
+            FILENAME = "col.sph"
+        self.ui = Ui_Dialog_User()
+        self.ui.setupUi(self.window)
+        self.window.show() 
+        return
+
+    def show_popupM(self): #Gives user warning popup for massAndMore.out if not found in current directory
+        msg = QMessageBox()
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        msg.setWindowTitle("Hold on there, Jethro!")
+        msg.setText("\nError: massAndMore.out could not be found in the directory.\n")
+        msg.setInformativeText("Make sure your file is in your current directory before proceeding!\n")
+        msg.setDetailedText(f"Your current directory path is: \n" + "_"*43 + "\n" + str(os.getcwd()))
+        msg.setIcon(QMessageBox.Warning)
+        msg.setFont(font)
+        showMessage = msg.exec_()
+        return
+
+    def show_popupUser(self, file): #Gives user warning popup for user-specified file if not found in current directory
+        msg = QMessageBox()
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        msg.setWindowTitle("Hold on there, Jethro!")
+        if file == "":
+            msg.setText(f"\nError: No file name was specified!")
+            msg.setInformativeText("Make sure to add your desired file name to the text line!\n")
+        else:
+            msg.setText(f"\nError: {file} could not be found in the directory.\n")
+            msg.setInformativeText("Make sure your file is in your current directory before proceeding!\n")
+            msg.setDetailedText(f"Your current directory path is: \n" + "_"*39 + "\n" + str(os.getcwd()))
+        msg.setIcon(QMessageBox.Warning)
+        msg.setFont(font)
+        showMessage = msg.exec_()
+        return
+
+    def changeDir(self): #Changes current directory to new directory.
+        _translate = QtCore.QCoreApplication.translate
+        newPath = str(QFileDialog.getExistingDirectory(None, "Select Directory")) #Opens new window asking to select directory, sets it as a string.
+        if newPath != '': 
+            os.chdir(newPath) #Changes current directory text to the string received from the new selected path
+            self.textBrowser_2.setHtml(_translate("MainWindow", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
+"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
+"p, li { white-space: pre-wrap; }\n"
+"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:10pt; font-weight:400; font-style:normal;\">\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">" + str(os.getcwd()) + "</span></p></body></html>"))
+        return
+
+    def setupUi(self, MainWindow): #Creates widgets and buttons on the main window
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1200, 1000)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        MainWindow.setFont(font)
+
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.gridLayout = QtWidgets.QGridLayout(self.centralwidget)
+        self.gridLayout.setObjectName("gridLayout")
+
+        #set up radio btn 1 - energy.sph plots
+        self.radioButton = QtWidgets.QRadioButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(20)
+        self.radioButton.setFont(font)
+        self.radioButton.setObjectName("radioButton")
+        self.radioButton.setMaximumWidth(400)
+        self.gridLayout.addWidget(self.radioButton, 3, 0, 1, 1)
+
+        #Set up radio btn 2 - Mass&More plots
+        self.radioButton_2 = QtWidgets.QRadioButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(20)
+        self.radioButton_2.setFont(font)
+        self.radioButton_2.setObjectName("radioButton_2")
+        self.radioButton_2.setMaximumWidth(400)
+        self.gridLayout.addWidget(self.radioButton_2, 3, 1, 1, 1)
+
+        #Set up radio btn 3 - user-specified file
+        self.radioButton_3 = QtWidgets.QRadioButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(20)
+        self.radioButton_3.setFont(font)
+        self.radioButton_3.setObjectName("radioButton_3")
+        self.radioButton_3.setMaximumWidth(400)
+        self.gridLayout.addWidget(self.radioButton_3, 3, 2, 1, 1)
+
+        #Set up radio btn 4 - col.sph file
+        self.radioButton_4 = QtWidgets.QRadioButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(20)
+        self.radioButton_4.setFont(font)
+        self.radioButton_4.setObjectName("radioButton_4")
+        self.radioButton_4.setMaximumWidth(400)
+        self.gridLayout.addWidget(self.radioButton_4, 3, 3, 1, 1)
+
+        #Set up line edit bar for user to input name of a file they wish to read and plot.
+        self.lineEdit = QtWidgets.QLineEdit(self.centralwidget)
+        self.lineEdit.setObjectName("lineEdit")
+        self.gridLayout.addWidget(self.lineEdit, 5, 0, 1, 3)
+
+        #Set up txtbrwsr 1 - Info on program
+        self.textBrowser = QtWidgets.QTextBrowser(self.centralwidget)
+        self.textBrowser.setObjectName("textBrowser")
+        self.gridLayout.addWidget(self.textBrowser, 2, 0, 1, 0)
+
+        #Set up txtbrwsr 2 - Current directory info
+        self.textBrowser_2 = QtWidgets.QTextBrowser(self.centralwidget)
+        self.textBrowser_2.setObjectName("textBrowser_2")
+        self.textBrowser_2.setMaximumHeight(85)
+        self.gridLayout.addWidget(self.textBrowser_2, 1, 0, 1, 0)
+
+        #Set up pshbtn 1 - Next button
+        self.pushButton = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton.setObjectName("pushButton")
+        self.pushButton.clicked.connect(self.openWindow)
+        self.pushButton.setMaximumWidth(150)
+        self.gridLayout.addWidget(self.pushButton, 5, 3, 1, 1)
+
+        #set up tlbtn - Access directory folders
+        self.toolButton = QtWidgets.QToolButton(self.centralwidget)
+        self.toolButton.setObjectName("toolButton")
+        self.toolButton.clicked.connect(self.changeDir)
+        self.gridLayout.addWidget(self.toolButton, 0, 4, 1, 1)
+
+        #Set up label - "Current Directory" label
+        self.label = QtWidgets.QLabel(self.centralwidget)
+        self.label.setObjectName("label")
+        self.gridLayout.addWidget(self.label, 0, 1, 1, 1)
+
+        #Set up label_2 - "Input the file name below" label
+        self.label_2 = QtWidgets.QLabel(self.centralwidget)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout.addWidget(self.label_2, 4, 1, 1, 1)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 739, 26))
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.actionExit = QtWidgets.QAction(MainWindow)
+        self.actionExit.setObjectName("actionExit")
+        self.actionExit.triggered.connect(self.exit)
+        self.menuFile.addAction(self.actionExit)
+        self.menubar.addAction(self.menuFile.menuAction())
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+        return
+
+    def exit(self, MainWindow): #Closes the main window and quits out of Hypermongo when "Exit" is triggered
+        return sys.exit()
+
+    def retranslateUi(self, MainWindow): #Translates default text into more useful information in the main window.
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Hypermongo"))
+        self.radioButton.setText(_translate("MainWindow", "energy.sph    "))
+        self.radioButton_2.setText(_translate("MainWindow", "massAndMore.out     "))
+        self.radioButton_3.setText(_translate("MainWindow", "User-specified file     "))
+        self.radioButton_4.setText(_translate("MainWindow", "col.sph"))
+        self.textBrowser.setHtml(_translate("MainWindow", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
+"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
+"p, li { white-space: pre-wrap; }\n"
+"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:16pt; font-weight:400; font-style:normal;\">\n"
+"<p align=\"center\" style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:20pt; font-weight:600;\"\n>Welcome to Hypermongo! </span></p>\n"
+"<p align=\"center\" style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">________________________________________________________</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt200;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">This python program is a designed read and create plots for any table formatted data files. The first row of your data file must contain the names of the columns separated by spaces. Every row following is reserved for numbers only.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Start by selecting a file you wish to plot, then press the &quot;Next&quot; button. You may choose one of the default options or select your own file by select the user-specified button and typing the name of the file below.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Make sure you are in the correct directory where your file(s) are located.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Files compressed with gzip, xz or zstd (energy3.sph.gz, col0042.sph.zst, massAndMore.out.xz) are read as they are, there is no need to unpack them first.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">You can change your directory by pressing the &quot;...&quot; button.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">If you have any questions, suggestions, or bugs to report, you can contact me with my information below. Have fun!</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Author: Jacky Tran @Allegheny College 2022</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Email: jtran9148@gmail.com</span></p></body></html>"))
+        self.pushButton.setText(_translate("MainWindow", "Next"))
+        self.toolButton.setText(_translate("MainWindow", "..."))
+        self.textBrowser_2.setHtml(_translate("MainWindow", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
+"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
+"p, li { white-space: pre-wrap; }\n"
+"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:16pt; fo200nt-weight:400; font-style:normal;\">\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">" + str(os.getcwd()) + "</span></p></body></html>"))
+        self.label.setText(_translate("MainWindow", "Current Directory:"))
+        self.label_2.setText(_translate("MainWindow", "Enter the file name below:"))
+        self.menuFile.setTitle(_translate("MainWindow", "File"))
+        self.actionExit.setText(_translate("MainWindow", "Exit"))
+        self.actionExit.setStatusTip(_translate("MainWindow", "Exit the program"))
+        self.actionExit.setShortcut(_translate("MainWindow", "Esc"))
+        return
+
+class LoadSignals(QtCore.QObject): # Signals of a LoadTask. QRunnable is not a QObject, so it cannot have its own.
+    progress = QtCore.pyqtSignal(object, int, int) # task, bytes read, rows parsed
+    loaded = QtCore.pyqtSignal(object) # list of column arrays
+    failed = QtCore.pyqtSignal(object) # the exception that stopped the load
+    finished = QtCore.pyqtSignal(object) # task, sent last whether the load worked, failed or was cancelled
+
+class LoadTask(QtCore.QRunnable): # Reads the columns of one plot on a QThreadPool thread so the dialog never freezes.
+    """Runs hmloader.loadColumns off the GUI thread. The signals are delivered on the GUI thread,
+    where the plot is built. cancel() stops the read at the next block of the file. Derived
+    columns in columns are computed from their source columns (hmexpr.DerivedColumns). With a
+    reader, its first poll is run instead and the columns it has read so far are sent.
+    """
+
+    def __init__(self, filename: str, columns: List[int], stepsize: int, skiprows: int, mapped: bool, derived: Optional['hmexpr.DerivedColumns'] = None, reader: Optional[hmloader.TailReader] = None):
+        super().__init__()
+        self.filename: str = filename
+        self.columns: List[int] = columns
+        self.stepsize: int = stepsize
+        self.skiprows: int = skiprows
+        self.mapped: bool = mapped
+        self.derived: Optional[hmexpr.DerivedColumns] = derived
+        self.reader: Optional[hmloader.TailReader] = reader
+        self.profile: Optional[hmprofile.Profile] = hmprofile.current() # Profile of the plot the load is for, None when profiling is off.
+        self.size: int = os.path.getsize(filename)
+        self.cancelled: bool = False
+        self.signals = LoadSignals() # Created on the GUI thread, so connected slots run there.
+
+    def cancel(self):
+        self.cancelled = True
+
+    def report(self, done: int, rows: int): # Progress callback of loadColumns, called on the worker thread after every block.
+        if self.cancelled:
+            raise hmloader.LoadCancelled(self.filename)
+        self.signals.progress.emit(self, done, rows)
+
+    def run(self):
+        with hmprofile.use(self.profile), hmprofile.stage('load'): # The disk and parse times of hmloader go to the plot's Profile.
+            try:
+                self.report(0, 0)
+                if self.reader is not None: # Followed files keep their reader, the GUI thread polls it for new rows afterwards.
+                    self.reader.poll(progress = self.report)
+                    data = self.reader.data()
+                else:
+                    load = self.derived.load if self.derived is not None else hmloader.loadColumns # Only the source columns of derived columns are read.
+                    data = load(self.filename, self.columns, self.stepsize, self.skiprows, cache = hmloader.CACHE, mapped = self.mapped, progress = self.report) # Columns parsed by an earlier plot of the same file are reused from the cache.
+            except hmloader.LoadCancelled:
+                pass
+            except (OSError, ValueError) as error: # ValueError covers hmloader.ColumnMismatchError.
+                self.signals.failed.emit(error)
+            else:
+                if not self.cancelled:
+                    self.signals.loaded.emit(data)
+            finally:
+                self.signals.finished.emit(self)
+
+class Ui_Dialog_User(Ui_MainWindow): #Defines class creating dialog window for user specified file
+    
+    def readFile(self, filenames: Optional[List[str]] = None):
+        """Reads user-specified file and allows user to create plots of any number of columns vs. time. Can also read third axis for 3-d plots
+        When filenames are given, the selected columns of every one of them are overlaid in one 2-D plot instead.
+        """
+        # Instantiating objects
+        global FILENAME
+        stepsize: int = self.spinBox.value() # These variables are tied to the values the user inputs into the spinbox widget on the GUI window.
+        scatsize: int = self.spinBox2.value()
+        fileNum: int = self.spinBox3.value()
+        polyDeg: int = self.spinBox4.value()
+
+        share_ax: bool = self.checkBox.isChecked() # True/False for shared-x axis turned on
+        is_scatter: bool = self.checkBox2.isChecked() # True/False for Scatter plots turned on
+        is_3D: bool = self.checkBox3.isChecked() # True/False for 3-D plots turned on
+        is_trendline: bool = self.checkBox4.isChecked()
+        legend: bool = self.checkBox5.isChecked()
+        onePlot: bool = self.checkBox6.isChecked()
+        downsample: str = hmplot.DOWNSAMPLE_METHODS[self.comboBox.currentIndex()] # 'off', 'minmax' or 'lttb' downsampling of line plots
+        mapped: bool = self.checkBox7.isChecked() # True/False for memory mapped reading of huge files
+        animate: bool = self.checkBox8.isChecked() # True/False for playing energy#.sph/col####.sph files as an animation
+        follow: bool = self.checkBox9.isChecked() # True/False for following a file that is still being written
+        gpu: bool = self.checkBox10.isChecked() and is_scatter # True/False for showing scatter plots in the OpenGL view
+        density: bool = self.checkBox11.isChecked() # True/False for drawing 2-D scatter plots as a density image of the points
+
+        ### Note: If you wish to read in a specific file that includes a numbering system to differentiate the files (i.e. energy#.sph or col####.sph),
+        ### you can write your exception as an if-statement below in a similar fashion. Make sure that you tie it to the fileNum variable.
+
+        if filenames: # Compare picks its own files.
+            new_filename = filenames[0]
+        elif "energy.sph" in FILENAME:
+            new_filename = hmloader.findFile(hmloader.numberedFilename(FILENAME, fileNum)) # Renames the FILENAME for energy.sph to the specific filenumber, or its archived energy#.sph.gz/.xz/.zst.
+            if os.path.isfile(new_filename) == False: # If the user tries to read a energy.sph file with a number that doesn't exist in the directory, display an error message.
+                self.show_popupE(new_filename)
+                return 
+        elif "col.sph" in FILENAME:
+            new_filename = hmloader.findFile(hmloader.numberedFilename(FILENAME, fileNum)) # Renames col.sph to the zero padded file the user wants to read with the 'File Number' spinbox, i.e. col0042.sph or col0042.sph.zst.
+            if os.path.isfile(new_filename) == False: # If the user tries to read a col.sph file with a number that doesn't exist in the directory, display an error message.
+                self.show_popupE(new_filename)
+                return
+        else:
+            new_filename = FILENAME
+        profile = hmprofile.begin(new_filename) # Times the stages of this plot when HYPERMONGO_PROFILE is set, None otherwise.
+
+        text_list_x: list = self.listWidget.selectedItems() # Stores objects of items selected in listWidgets
+        text_list_y: list = self.listWidget2.selectedItems()
+        text_list_z: list = self.listWidget3.selectedItems()
+        xObjects: list = [] # Used to store column number for selected listWidget items.
+        yObjects: list = []
+        zObjects: list = []
+
+        # This searches the selected object(s) in listWidget for the first number in the string. Used to determine selected column number.
+        # it also appends the name of the column into the respective x, y, or z list columns.
+        for i in list(text_list_x):  
+            xObjects.append(int(re.search(r'\d+', i.text()).group())-1)
+        for i in list(text_list_y):
+            yObjects.append(int(re.search(r'\d+', i.text()).group())-1)
+        for i in list(text_list_z):
+            zObjects.append(int(re.search(r'\d+', i.text()).group())-1)
+
+        numCol = len(yObjects) # This is the number of selected y-columns user wants to read. For 2-D Plots only.
+        if numCol < 1 or len(xObjects) != 1: # Checks that one x column and at least one y column are selected, more than six are tiled or paged by grph. Gives error popup then stops.
+            self.show_popupOutOfBounds()
+            return
+        if is_3D and not filenames and (len(xObjects) < 1 or len(xObjects) > 1 or len(yObjects) < 1 or len(yObjects) > 1 or len(zObjects) < 1 or len(zObjects) > 1): #shows error when 3-D plot is selected and number or selected axis is not the required amount.
+            self.show_popupOutOfBounds3D()
+            return
+
+        energy_or_col: bool = False 
+        if ("energy.sph" in FILENAME) or ("col.sph" in FILENAME):
+            energy_or_col = True
+        skiprows: int = 0 if energy_or_col else self.schema().headerLines # energy#.sph and col####.sph have no header row, other files have as many as were detected.
+
+        # This checks if 3-D graph is checked and plots with the threeDGrph function.
+        if is_3D and not filenames: # Comparisons are always 2-D.
+            threeDlabels: list = self.columnLabels([xObjects[0], yObjects[0], zObjects[0]]) # Axis labels of the x, y and z columns, with subscripts from subscriptName().
+            def plot3D(threeDplots: list): # Runs on the GUI thread once the x, y and z columns are read.
+                export = lambda: self.session.plot3D(threeDplots, threeDlabels, is_scatter, new_filename, scatsize) # Draws into the dialog's plot window with hmplot.threeDGrph, or only swaps the data.
+                if gpu:
+                    self.openView(hmview.ScatterWindow(threeDplots, threeDlabels, new_filename, True, False, scatsize, export))
+                else:
+                    export()
+            self.startLoad(new_filename, [xObjects[0], yObjects[0], zObjects[0]], stepsize, skiprows, mapped, plot3D) # Reads the x, y and z columns in one pass in the background.
+            return 
+
+        # This is for 2-D plots only.    
+        labels: list = self.columnLabels([xObjects[0]] + yObjects) # Takes the selected columns to create the x and y axis labels, with subscripts added by subscriptName() if a number is found.
+        if filenames: # Overlays the same columns of every chosen file, put on a common x grid.
+            names: List[str] = hmplot.runNames(filenames)
+            def plotRuns(runs: list): # Runs on the GUI thread once the last file is read.
+                grid, aligned = hmplot.alignRuns(runs)
+                self.session.compare2D(labels, grid, aligned, names, ", ".join(names), numCol, share_ax, is_scatter, scatsize, downsample, onePlot)
+            self.startCompare(filenames, [xObjects[0]] + yObjects, stepsize, mapped, plotRuns)
+            return
+        if animate: # Plays every existing file from the 'File Number' onwards in one figure.
+            numbers: List[int] = [n for n in hmloader.seriesNumbers(FILENAME) if n >= fileNum]
+            try:
+                player = hmplot.SnapshotPlayer(FILENAME, numbers, [xObjects[0]] + yObjects, labels, stepsize, skiprows, onePlot, share_ax, is_scatter, scatsize, legend, downsample, density = density, derived = self.derived) # The figure keeps the player alive.
+            except hmloader.ColumnMismatchError:
+                self.show_popupMismatch()
+                return
+            self.reportProfile(profile, player.fig)
+            return
+        if follow: # Keeps the window open on the file and adds the rows a running simulation appends.
+            columns = [xObjects[0]] + yObjects
+            reader = hmloader.TailReader(new_filename, self.derived.sources(columns) if self.derived is not None else columns, stepsize, skiprows)
+            def live(data: list): # The first poll has read the file so far in the background, the view polls for new rows from here on.
+                hmplot.LiveView(new_filename, columns, labels, stepsize, skiprows, onePlot, share_ax, is_scatter, scatsize, legend, downsample, density = density, derived = self.derived, reader = reader) # The figure keeps the view alive.
+            self.startLoad(new_filename, columns, stepsize, skiprows, False, live, reader)
+            return
+        def plot2D(yplot: list): # Runs on the GUI thread once the columns are read.
+            def export():
+                try:
+                    self.session.plot2D(labels, yplot, new_filename, numCol, share_ax, is_scatter, scatsize, is_trendline, polyDeg, legend, downsample, onePlot, density = density) # Draws into the dialog's plot window with hmplot.grph or hmplot.onePlot2D, or only swaps the data.
+                except hmplot.TrendlineError:
+                    self.show_popupRegression()
+            if gpu: # Trendlines and legends are left to the matplotlib export.
+                self.openView(hmview.ScatterWindow(yplot, labels, new_filename, False, onePlot, scatsize, export))
+            else:
+                export()
+        self.startLoad(new_filename, [xObjects[0]] + yObjects, stepsize, skiprows, mapped, plot2D) # Reads the x column followed by every selected y column in one pass, in the background.
+        return
+
+    def startLoad(self, filename: str, columns: List[int], stepsize: int, skiprows: int, mapped: bool, plot, reader: Optional[hmloader.TailReader] = None): # Queues a background read of the columns and calls plot(columns) on the GUI thread when it is done.
+        """Starts a LoadTask on the dialog's thread pool. Several plots can load at once, so a quick
+        file is never stuck behind a slow one. Progress shows in the progress bar until every load is done.
+        """
+        task = LoadTask(filename, columns, stepsize, skiprows, mapped, self.derived, reader)
+        task.signals.progress.connect(self.showProgress)
+        task.signals.loaded.connect(hmprofile.bind(task.profile, plot)) # The plot counts towards the same Profile as its load.
+        task.signals.failed.connect(self.loadFailed)
+        task.signals.finished.connect(self.loadFinished)
+        self.tasks[task] = (0, 0)
+        self.pushButton2.setEnabled(True)
+        self.pool.start(task)
+        return
+
+    def startCompare(self, filenames: List[str], columns: List[int], stepsize: int, mapped: bool, plot): # Reads the same columns of several files at once and calls plot(runs) when all of them are read.
+        """Starts one LoadTask per file, all at the same time, so comparing many runs takes about as
+        long as reading the slowest of them. plot gets the columns of every file in the order of
+        filenames. If any file fails or is cancelled nothing is plotted.
+        """
+        for filename in filenames:
+            if not os.path.isfile(filename):
+                self.show_popupE(filename)
+                return
+        runs: list = [None] * len(filenames)
+        pending: set = set(range(len(filenames)))
+        def loaded(i: int, data: list):
+            runs[i] = data
+            pending.discard(i)
+            if not pending:
+                plot(runs)
+        self.pool.setMaxThreadCount(min(max(self.pool.maxThreadCount(), len(filenames)), 32)) # Room for every file, reads mostly wait on the disk.
+        for i, filename in enumerate(filenames):
+            skiprows: int = hmloader.fileSchema(filename).headerLines # Each file may have its own header.
+            self.startLoad(filename, columns, stepsize, skiprows, mapped, functools.partial(loaded, i))
+        return
+
+    def compareFiles(self): # Asks for the files to compare and overlays the selected columns of all of them.
+        filenames, _ = QFileDialog.getOpenFileNames(None, "Select the files to compare", os.getcwd())
+        if filenames:
+            self.readFile(filenames)
+        return
+
+    def showProgress(self, task: LoadTask, done: int, rows: int): # Shows the bytes read and rows parsed of every running load.
+        if task not in self.tasks:
+            return
+        self.tasks[task] = (done, rows)
+        size = sum(t.size for t in self.tasks) or 1
+        read = sum(d for d, r in self.tasks.values())
+        parsed = sum(r for d, r in self.tasks.values())
+        self.progressBar.setValue(int(1000 * read / size))
+        self.progressBar.setFormat(f"Reading {len(self.tasks)} file(s): {read/2**20:.0f} of {size/2**20:.0f} MB, {parsed:,} rows")
+        return
+
+    def loadFailed(self, error: Exception): # Turns the error of a background load into the matching popup.
+        if isinstance(error, hmloader.ColumnMismatchError):
+            self.show_popupMismatch()
+        else:
+            self.show_popupE(getattr(error, 'filename', '') or '')
+        return
+
+    def loadFinished(self, task: LoadTask): # Forgets a finished load and resets the progress bar when none are left.
+        self.tasks.pop(task, None)
+        if task.profile is not None and not any(t.profile is task.profile for t in self.tasks): # The last file of the plot is in.
+            self.reportProfile(task.profile, self.session.fig)
+        if not self.tasks:
+            self.progressBar.setValue(0)
+            self.progressBar.setFormat("")
+            self.pushButton2.setEnabled(False)
+        return
+
+    def reportProfile(self, profile: Optional[hmprofile.Profile], fig): # Draws the plot right away, timed, and shows where the time of the plot went under the progress bar.
+        if profile is None:
+            return
+        if fig is not None and ('figure' in profile.stages or 'update' in profile.stages): # A matplotlib plot was made, not only an OpenGL view or a popup.
+            with hmprofile.use(profile), hmprofile.stage('draw'):
+                fig.canvas.draw()
+            profile.count('points drawn', hmplot.pointsDrawn(fig))
+        summary: str = hmprofile.finish(profile)
+        self.label9.setText(summary)
+        self.label9.setToolTip(summary) # The whole line, when the label is too narrow for it.
+        return
+
+    def openView(self, view): # Shows an OpenGL scatter window and keeps it alive until it is closed.
+        self.views = [v for v in self.views if v.isVisible()] + [view] # Closed windows have already freed their points.
+        view.show()
+        return
+
+    def cancelLoads(self): # Cancels every load that is still running. Their plots are never made.
+        for task in self.tasks:
+            task.cancel()
+        return
+
+    def subscriptName(self, ylabel: List[str], numCol: int) -> List[str]: #Changes the names of yplots to add subscripts if it contains a number. Returns new list with subcripted names.
+        """This function takes a string and changes it to add a subscript
+        for the massAndMore.out file, only if it contains a number. i.e m1 or x2...
+        """
+        return hmplot.subscriptName(ylabel, numCol) # Shared with the command line so both label plots the same way.
+
+    def columnLabels(self, columns: List[int]) -> List[str]: # Axis labels of columns: file columns through subscriptName, derived columns as they were typed.
+        names: List[str] = self.setName()
+        return [self.subscriptName([names[i]], 1)[0] if i < self.derived.ncols else self.derived.label(i) for i in columns]
+
+    def addColumn(self): # Adds the expression typed into the box as a new column of all three lists.
+        try:
+            expression = hmexpr.Expression(self.lineEdit.text(), self.setName()[:self.derived.ncols])
+        except hmexpr.ExpressionError as error:
+            self.show_popupExpression(str(error))
+            return
+        col: int = self.derived.add(expression)
+        for listWidget in (self.listWidget, self.listWidget2, self.listWidget3):
+            listWidget.addItem(f"{col+1}. {expression.name}")
+        self.lineEdit.clear()
+        return
+
+    def countCol(self): # Counts the number of header columns in the file, separated by spaces in a single line.
+        """Counts the number of header columns in user file"""
+        numCol = len(self.setName())
+        return numCol
+
+    def schema(self) -> 'hmloader.TableSchema': # Returns the cached schema (names, header lines, delimiter) of a user file.
+        """Returns the TableSchema of FILENAME shared by setName, countCol, retranslateUi and readFile."""
+        global FILENAME
+        return hmloader.readSchema(FILENAME)
+
+    @hmprofile.timed('setName')
+    def setName(self) -> List[str]: # This function returns a list of all the header names in the user file.
+        """Returns a list of names for the list widget in Ui_Dialog_User class."""
+        global FILENAME
+        if "energy.sph" in FILENAME: # Column headers for the energy.sph file
+            names = list(hmloader.ENERGY_NAMES)
+        elif "col.sph" in FILENAME: # Column headers for the col.sph file
+            names = list(hmloader.COL_NAMES)
+        else: # Uses the column names from the header of the file. The header is only read again if the file changes.
+            names = self.schema().names
+        derived = getattr(self, 'derived', None) # Typed in columns come after the ones of the file.
+        return names + derived.names() if derived is not None else names
+    
+    def setupUi(self, Dialog): #Sets up Dialog GUI window for all plots.
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(1250, 700)
+        self.gridLayout = QtWidgets.QGridLayout(Dialog)
+        self.gridLayout.setObjectName("gridLayout")
+
+        #Set up pshbtn - "Create Plot"; links to readFile()
+        self.pushButton = QtWidgets.QPushButton(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.pushButton.setFont(font)
+        self.gridLayout.addWidget(self.pushButton, 4, 5, 1, 1)
+        self.pushButton.setObjectName("pushButton")
+        self.pushButton.clicked.connect(lambda: self.readFile()) #connects button press to 'readFile' function, without the checked flag of the signal
+
+        #Set up pshbtn2 - "Cancel"; stops the plots that are still being read
+        self.pushButton2 = QtWidgets.QPushButton(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.pushButton2.setFont(font)
+        self.gridLayout.addWidget(self.pushButton2, 5, 5, 1, 1)
+        self.pushButton2.setObjectName("pushButton2")
+        self.pushButton2.setEnabled(False)
+        self.pushButton2.clicked.connect(self.cancelLoads)
+
+        #Set up prgrssbr - Bytes read and rows parsed of the plots being read in the background
+        self.progressBar = QtWidgets.QProgressBar(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.progressBar.setFont(font)
+        self.progressBar.setRange(0, 1000)
+        self.progressBar.setValue(0)
+        self.progressBar.setFormat("")
+        self.progressBar.setTextVisible(True)
+        self.gridLayout.addWidget(self.progressBar, 5, 2, 1, 3)
+        self.progressBar.setObjectName("progressBar")
+        self.tasks: dict = {} # Running LoadTasks and their (bytes read, rows parsed), also keeps them from being garbage collected.
+        self.pool = QtCore.QThreadPool() # Own pool with room for several loads at once, even on machines with few cores.
+        self.pool.setMaxThreadCount(max(4, QtCore.QThread.idealThreadCount()))
+        self.session = hmplot.PlotSession() # Every plot of the dialog goes into the same window, a closed window is opened again.
+        self.views: list = [] # Open OpenGL scatter windows.
+        self.derived = hmexpr.DerivedColumns(self.countCol()) # Columns computed from expressions, numbered after the ones of the file.
+
+        #Set up spnbx - stepsize input for user-specified file
+        self.spinBox = QtWidgets.QSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.spinBox.setFont(font)
+        self.gridLayout.addWidget(self.spinBox, 2, 0, 1, 1)
+        self.spinBox.setObjectName("spinBox")
+        self.spinBox.setRange(1, 999999)
+
+        #Set up spnbx2 - Size of scatter plot points
+        self.spinBox2 = QtWidgets.QSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.spinBox2.setFont(font)
+        self.gridLayout.addWidget(self.spinBox2, 3, 0, 1, 1)
+        self.spinBox2.setMinimumWidth(100)
+        self.spinBox2.setObjectName("spinBox2")
+        self.spinBox2.setRange(1, 100)
+
+        #Set up spnbx3 - Determines filenumber for energy.sph and col.sph 
+        self.spinBox3 = QtWidgets.QSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.spinBox3.setFont(font)
+        self.gridLayout.addWidget(self.spinBox3, 2, 2, 1, 1)
+        self.spinBox3.setMaximumWidth(200)
+        self.spinBox3.setObjectName("spinBox3")
+        self.spinBox3.setRange(0, 999999)
+
+        #Set up spnbx4 - Determines trendline type (1 for linear regression, 2 for quadratic, 3 for) 
+        self.spinBox4 = QtWidgets.QSpinBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.spinBox4.setFont(font)
+        self.gridLayout.addWidget(self.spinBox4, 3, 2, 1, 1)
+        self.spinBox4.setMaximumWidth(200)
+        self.spinBox4.setObjectName("spinBox4")
+        self.spinBox4.setRange(1, 30)
+
+        #Set up cmbbx - Downsampling of line plots to the screen resolution (Off, Min/Max, LTTB)
+        self.comboBox = QtWidgets.QComboBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.comboBox.setFont(font)
+        self.gridLayout.addWidget(self.comboBox, 4, 0, 1, 1)
+        self.comboBox.setObjectName("comboBox")
+        for i in range(len(hmplot.DOWNSAMPLE_METHODS)): # Items are named in retranslateUi() further below.
+            self.comboBox.addItem("")
+        self.comboBox.setCurrentIndex(1) # Min/Max keeps every peak, so it is on by default.
+
+        #Set up lbl - "Stepsize"
+        self.label = QtWidgets.QLabel(Dialog)
+        self.gridLayout.addWidget(self.label, 2, 1, 1, 1)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label.setFont(font)
+        self.label.setObjectName("label")
+
+        #Set up lbl8 - "Downsample"
+        self.label8 = QtWidgets.QLabel(Dialog)
+        self.gridLayout.addWidget(self.label8, 4, 1, 1, 1)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label8.setFont(font)
+        self.label8.setObjectName("label8")
+
+        #Set up lbl2 - "X-Axis"
+        self.label2 = QtWidgets.QLabel(Dialog)
+        self.gridLayout.addWidget(self.label2, 0, 3, 1, 1)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label2.setFont(font)
+        self.label2.setObjectName("label2")
+
+        #Set up lbl3 - "Y-Axis"
+        self.label3 = QtWidgets.QLabel(Dialog)
+        self.gridLayout.addWidget(self.label3, 0, 4, 1, 1)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label3.setFont(font)
+        self.label3.setObjectName("label3")
+
+        #Set up lbl4 - "Scatter size"
+        self.label4 = QtWidgets.QLabel(Dialog)
+        self.gridLayout.addWidget(self.label4, 3, 1, 1, 1)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label4.setFont(font)
+        self.label4.setObjectName("label4")
+
+        #Set up lbl5 - "Z-axis column"
+        self.label5 = QtWidgets.QLabel(Dialog)
+        self.gridLayout.addWidget(self.label5, 0, 5, 1, 1)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label5.setFont(font)
+        self.label5.setObjectName("label5")
+
+        #Set up lbl6 - "File Number"
+        self.label6 = QtWidgets.QLabel(Dialog)
+        self.gridLayout.addWidget(self.label6, 2, 3, 1, 1)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label6.setFont(font)
+        self.label6.setObjectName("label6")
+
+        #Set up lbl6 - "Trend type"
+        self.label7 = QtWidgets.QLabel(Dialog)
+        self.gridLayout.addWidget(self.label7, 3, 3, 1, 1)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label7.setFont(font)
+        self.label7.setObjectName("label7")
+
+        #Set up list - list of columns in user-specified file for x-axis
+        self.listWidget = QtWidgets.QListWidget(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.listWidget.setFont(font)
+        self.listWidget.setObjectName("listWidget")
+        self.listWidget.setMaximumWidth(250)
+        for i in range(self.countCol()): #Creates items to list widget.
+            item = QtWidgets.QListWidgetItem()
+            self.listWidget.addItem(item)
+        self.gridLayout.addWidget(self.listWidget, 1, 3, 1, 1)
+        self.listWidget.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+
+        #Set up list2 - list of columns in user-specified file for y-axis
+        self.listWidget2 = QtWidgets.QListWidget(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.listWidget2.setFont(font)
+        self.listWidget2.setObjectName("listWidget2")
+        self.listWidget2.setMaximumWidth(250)
+        for i in range(self.countCol()): #Creates items to list widget.
+            item2 = QtWidgets.QListWidgetItem()
+            self.listWidget2.addItem(item2)
+        self.gridLayout.addWidget(self.listWidget2, 1, 4, 1, 1)
+        self.listWidget2.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+
+        #Set up list3 - list of columns in user-specified file for z-axis - 3-D Plots only!
+        self.listWidget3 = QtWidgets.QListWidget(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.listWidget3.setFont(font)
+        self.listWidget3.setObjectName("listWidget3")
+        self.listWidget3.setMaximumWidth(250)
+        for i in range(self.countCol()): # Creates items to list widget. Items are then retranslated in the retranslateUi() further below.
+            item3 = QtWidgets.QListWidgetItem()
+            self.listWidget3.addItem(item3)
+        self.gridLayout.addWidget(self.listWidget3, 1, 5, 1, 1)
+        self.listWidget3.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+
+        #Set up txtbrwsr - Info for how to use window
+        self.textBrowser = QtWidgets.QTextBrowser(Dialog)
+        self.gridLayout.addWidget(self.textBrowser, 0, 0, 2, 3)
+        self.textBrowser.setObjectName("textBrowser")
+    
+        #Set up chkbox - Enables sharing axis for plots.
+        self.checkBox = QtWidgets.QCheckBox(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.checkBox.setFont(font)
+        self.checkBox.setObjectName("checkBox")
+        self.gridLayout.addWidget(self.checkBox, 4, 3, 1, 1)
+
+        #Set up chkbox2 - Change between line plots to scatter plots.
+        self.checkBox2 = QtWidgets.QCheckBox(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.checkBox2.setFont(font)
+        self.checkBox2.setObjectName("checkBox2")
+        self.gridLayout.addWidget(self.checkBox2, 3, 4, 1, 1)
+
+        #Set up chkbox3 - Change between 2-D to 3-D plots.
+        self.checkBox3 = QtWidgets.QCheckBox(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.checkBox3.setFont(font)
+        self.checkBox3.setObjectName("checkBox3")
+        self.gridLayout.addWidget(self.checkBox3, 2, 5, 1, 1)
+
+        #Set up chkbox4 - Add trendline to subplots.
+        self.checkBox4 = QtWidgets.QCheckBox(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.checkBox4.setFont(font)
+        self.checkBox4.setObjectName("checkBox4")
+        self.gridLayout.addWidget(self.checkBox4, 3, 5, 1, 1)
+
+        #Set up chkbox5 - Add legends to subplots.
+        self.checkBox5 = QtWidgets.QCheckBox(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.checkBox5.setFont(font)
+        self.checkBox5.setObjectName("checkBox5")
+        self.gridLayout.addWidget(self.checkBox5, 4, 4, 1, 1)
+
+        #Set up chkbox6 - Fit all y-columns into one plot
+        self.checkBox6 = QtWidgets.QCheckBox(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.checkBox6.setFont(font)
+        self.checkBox6.setObjectName("checkBox6")
+        self.gridLayout.addWidget(self.checkBox6, 2, 4, 1, 1)
+
+        #Set up chkbox7 - Memory maps huge user files and only parses the rows that get plotted.
+        self.checkBox7 = QtWidgets.QCheckBox(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.checkBox7.setFont(font)
+        self.checkBox7.setObjectName("checkBox7")
+        self.checkBox7.setEnabled(not (("energy.sph" in FILENAME) or ("col.sph" in FILENAME))) # Only user files (and massAndMore.out) can be memory mapped.
+        self.checkBox7.setChecked(self.checkBox7.isEnabled() and os.path.getsize(FILENAME) >= hmloader.MAPPED_MIN_BYTES) # Turned on by default for very large files.
+        self.gridLayout.addWidget(self.checkBox7, 4, 2, 1, 1)
+
+        #Set up chkbox8 - Plays the numbered energy#.sph/col####.sph files as an animation.
+        self.checkBox8 = QtWidgets.QCheckBox(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.checkBox8.setFont(font)
+        self.checkBox8.setObjectName("checkBox8")
+        self.checkBox8.setEnabled(("energy.sph" in FILENAME) or ("col.sph" in FILENAME)) # Only numbered files can be played.
+        self.gridLayout.addWidget(self.checkBox8, 5, 0, 1, 1)
+
+        #Set up chkbox9 - Follows a file while the simulation is still writing it.
+        self.checkBox9 = QtWidgets.QCheckBox(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.checkBox9.setFont(font)
+        self.checkBox9.setObjectName("checkBox9")
+        self.gridLayout.addWidget(self.checkBox9, 5, 1, 1, 1)
+
+        #Set up chkbox10 - Shows scatter plots in an OpenGL window for millions of points.
+        self.checkBox10 = QtWidgets.QCheckBox(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.checkBox10.setFont(font)
+        self.checkBox10.setObjectName("checkBox10")
+        self.checkBox10.setEnabled(hmview.AVAILABLE) # Needs pyqtgraph and PyOpenGL.
+        self.gridLayout.addWidget(self.checkBox10, 6, 0, 1, 1)
+
+        #Set up chkbox11 - Draws 2-D scatter plots as a density image of the points.
+        self.checkBox11 = QtWidgets.QCheckBox(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.checkBox11.setFont(font)
+        self.checkBox11.setObjectName("checkBox11")
+        self.gridLayout.addWidget(self.checkBox11, 6, 1, 1, 1)
+
+        #Set up pshbtn3 - "Compare..."; overlays the selected columns of several files, links to compareFiles()
+        self.pushButton3 = QtWidgets.QPushButton(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.pushButton3.setFont(font)
+        self.gridLayout.addWidget(self.pushButton3, 6, 5, 1, 1)
+        self.pushButton3.setObjectName("pushButton3")
+        self.pushButton3.clicked.connect(self.compareFiles)
+
+        #Set up lnedt - Expression of a new column over the column names, i.e. r = sqrt(x^2+y^2+z^2)
+        self.lineEdit = QtWidgets.QLineEdit(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.lineEdit.setFont(font)
+        self.gridLayout.addWidget(self.lineEdit, 7, 0, 1, 5)
+        self.lineEdit.setObjectName("lineEdit")
+        self.lineEdit.returnPressed.connect(self.addColumn)
+
+        #Set up pshbtn4 - "Add column"; adds the expression as a new column, links to addColumn()
+        self.pushButton4 = QtWidgets.QPushButton(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.pushButton4.setFont(font)
+        self.gridLayout.addWidget(self.pushButton4, 7, 5, 1, 1)
+        self.pushButton4.setObjectName("pushButton4")
+        self.pushButton4.clicked.connect(self.addColumn)
+
+        #Set up lbl9 - Stage times and counters of the last plot, only shown when profiling is on (hmprofile)
+        self.label9 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(10)
+        self.label9.setFont(font)
+        self.label9.setObjectName("label9")
+        self.label9.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse) # Can be copied into a bug report.
+        self.label9.setVisible(hmprofile.ENABLED)
+        self.gridLayout.addWidget(self.label9, 6, 2, 1, 3)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+        return
+
+    def show_popupOutOfBounds(self): #Gives user warning popup if no y column or not exactly one x column is selected.
+        """Creates and shows an error popup if the x or y columns selected are not in the correct range"""
+        msg = QMessageBox()
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        msg.setWindowTitle("Hold on there, Jethro!")
+        msg.setText("\nError: Column has not been selected OR more than one x-axis column has been selected.\n")
+        msg.setInformativeText("Please reselect your desired columns - One x-axis column and at least one y-axis column.\n")
+        msg.setIcon(QMessageBox.Warning)
+        msg.setFont(font)
+        showMessage = msg.exec_()
+        return
+
+    def show_popupOutOfBounds3D(self): #Gives user warning popup of multiple selected columns in x, y, and z axis is > 1 or none .
+        """Creates and shows an error popup if number of selected columns is not in the correct range (1-4)"""
+        msg = QMessageBox()
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        msg.setWindowTitle("Hold on there, Jethro!")
+        msg.setText("\nError: Column has not been selected OR the number of columns selected has been exceeded.\n")
+        msg.setInformativeText("Please reselect your desired columns - Only one for each axis!\n")
+        msg.setIcon(QMessageBox.Warning)
+        msg.setFont(font)
+        showMessage = msg.exec_()
+        return
+
+    def show_popupE(self, new_filename: str = ''): #Gives user warning popup for fileNumber not found
+        """Creates and shows an error popup if file number of the file name is not found in the directory"""
+        msg = QMessageBox()
+        msg.setWindowTitle("Hold on there, Jethro!")
+        msg.setText(f"\nError: {new_filename} could not be found in the directory.\n")
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        msg.setInformativeText("Make sure your file is in your current directory before creating the plot!")
+        msg.setDetailedText(f"Your current directory path is: \n" + "_"*44 + "\n" + str(os.getcwd()))
+        msg.setIcon(QMessageBox.Warning)
+        msg.setFont(font)
+        showMessage = msg.exec_() # Shows the popup error message window
+        return
+
+    def show_popupMismatch(self): #Gives user warning popup for mismatched data lengths in selected columns
+        """Gives user warning popup for mismatched data lengths in selected columns"""
+        msg = QMessageBox()
+        msg.setWindowTitle("Hold on there, Jethro!")
+        msg.setText("\nError: One or more of your selected columns do not share the same amount of data values!\n")
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        msg.setInformativeText("Check your data file to make sure every column has the same length!")
+        msg.setIcon(QMessageBox.Warning)
+        msg.setFont(font)
+        showMessage = msg.exec_()
+        return
+
+    def show_popupExpression(self, reason: str = ''): #Gives user warning popup for an expression that cannot be made into a column
+        msg = QMessageBox()
+        msg.setWindowTitle("Hold on there, Jethro!")
+        msg.setText("\nError: Your expression could not be made into a column!\n")
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        msg.setInformativeText(reason + "\n")
+        msg.setDetailedText("Use the column names, or $3 for column 3 and `name` for names with other characters than letters, numbers and _.\n"
+                            "Operators: + - * / ^ and parentheses. Functions: " + " ".join(hmexpr.FUNCTIONS) + ". The constant pi.")
+        msg.setIcon(QMessageBox.Warning)
+        msg.setFont(font)
+        showMessage = msg.exec_()
+        return
+
+    def show_popupRegression(self):
+        msg = QMessageBox()
+        msg.setWindowTitle("Hold on there, Jethro!")
+        msg.setText("\nError: The selected polynomial degree for your trendline did converge with one or more your selected data!\n")
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(16)
+        msg.setInformativeText("Try choosing a smaller poly degree value and try again.")
+        msg.setIcon(QMessageBox.Warning)
+        msg.setFont(font)
+        showMessage = msg.exec_()
+        return 
+
+    def retranslateUi(self, Dialog): # Retranslates various buttons, items in list, and labels from the empty default
+        global FILENAME
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", f"Hypermongo - {FILENAME}"))
+        self.pushButton.setText(_translate("Dialog", "Create Plot"))
+        names: List[str] = self.setName() # Column names are looked up once for all three lists.
+        __sortingEnabled = self.listWidget.isSortingEnabled()
+        self.listWidget.setSortingEnabled(False)
+        for i in range(len(names)):
+            item = self.listWidget.item(i)
+            item.setText(_translate("Dialog", f"{i+1}. {names[i]}"))
+        self.listWidget.setSortingEnabled(__sortingEnabled)
+        __sortingEnabled2 = self.listWidget2.isSortingEnabled()
+        self.listWidget2.setSortingEnabled(False)
+        for i in range(len(names)):
+            item2 = self.listWidget2.item(i)
+            item2.setText(_translate("Dialog", f"{i+1}. {names[i]}"))
+        self.listWidget2.setSortingEnabled(__sortingEnabled2)
+        __sortingEnabled3 = self.listWidget3.isSortingEnabled()
+        self.listWidget3.setSortingEnabled(False)
+        for i in range(len(names)):
+            item3 = self.listWidget3.item(i)
+            item3.setText(_translate("Dialog", f"{i+1}. {names[i]}"))
+        self.listWidget3.setSortingEnabled(__sortingEnabled3)
+        self.textBrowser.setHtml(_translate("Dialog", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
+"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
+"p, li { white-space: pre-wrap; }\n"
+"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:16pt; font-weight:400; font-style:normal;\">\n"
+"<p align=\"center\" style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Hypermongo</span></p>\n"
+"<p align=\"center\" style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">_____________________</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt; font-weight:600;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">You may select one x-axis column and </span><span style=\" font-size:16pt; font-weight:600;\">any number</span><span style=\" font-size:16pt;\"> of y-axis columns on the right. Up to six are stacked, more are tiled side by side, and past 24 the plot window gets pages that you turn with Page Up and Page Down. </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Select multiple items by holding Ctrl then clicking on the items, or holding down the mouse button and dragging.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Stepsize</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Enter the stepsize of the plot. This tells how many lines of data to skip and plot.</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Higher numbers yield faster plotting speeds at the expense of accuracy.</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Minimum number is &quot;1&quot;</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Share x-ax</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Checking this box will enable all plots to reduce the space in between plots and share the same x-axis. </span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">with no whitespace in between.</span></p></body></html>"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Scatter</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Checking this box enables scatter plot mode over the default line plot. The size of data points is adjustable with the Scatter size box. </span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">3-D Plots</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Checking 3-D plots box allows you to create a single 3-D plot by selecting only one item from each axis column. Compatible with the Scatter options.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">File number</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">This is only used for energy.sph files. Allows user to change which numbered energy file to read: Default is 0 for energy0.sph.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Trendline & Poly Degree</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">When the Trendline box is selected, each subplot will display dashed line based on the least squares fit of the data. A poly(nomial) degree of 1 is for linear regressions, degree of 2 is quadratic, and so on.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Memory map</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">For very large user files. The file is read straight from disk and only the rows kept by the stepsize are converted, so the file never has to fit in memory. Turned on automatically for files over 1 GB.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Downsample</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Line plots with more points than the screen can show are reduced to a few points per pixel. Min/Max keeps the highest and lowest point of every pixel, LTTB keeps the points that best preserve the shape. Zooming in redraws the visible part from the full data. Works together with the stepsize.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Animate</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">For energy.sph and col.sph only. Plays every file from the File Number onwards in a single window, looping back at the end. The next few files are read in the background while one is shown. The frame rate and the time spent reading each file are shown in the top-left corner. 2-D plots only, without trendlines.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Follow</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Keeps the plot window on a file that Starsmasher is still writing, i.e. energy#.sph or massAndMore.out. The file is checked every second and only the new rows are read and added to the plot. 2-D plots only, without trendlines.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Cancel</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Files are read in the background, so this window keeps working while a big file loads and you can create more plots in the meantime. The bar shows how much has been read. Cancel stops every plot that is still being read.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">GPU view shows scatter plots (2-D or 3-D) in an OpenGL window that stays smooth with tens of millions of points: drag to rotate or pan, scroll to zoom. Its Export button draws the same plot with matplotlib for saving. Needs the pyqtgraph and PyOpenGL packages.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Density (with Scatter) colors every pixel by how many points fall in it, on a log scale, instead of drawing each point. Crowded regions keep their structure and millions of points draw quickly. Zooming in counts the points again at the new scale.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Compare...</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Pick several files, i.e. energy3.sph and energy7.sph or the same file of different runs, and the selected columns of all of them are drawn in one 2-D plot with a line per file. The files are read at the same time and put on a common x grid, so runs that wrote different times still line up. Columns are picked by their number in the lists, Single plot puts every column on the same axes.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Add column</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Type a formula over the column names in the box at the bottom, i.e. E/W, T+U or r = sqrt(x^2+y^2+z^2), and press Enter. It is added to the end of all three lists and can be plotted like any other column. Only the columns it uses are read from the file. $3 stands for column 3, and names with spaces or dashes go in back quotes. Functions such as sqrt, log10, exp, sin and abs can be used.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:16pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt; font-weight:600;\">Profiling</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:16pt;\">Start Hypermongo with the environment variable HYPERMONGO_PROFILE=1 to see under the progress bar where the time of every plot goes: reading the file, parsing the numbers, fitting trendlines, building the figure and drawing it, with the bytes read, the rows parsed and kept and the points drawn. HYPERMONGO_PROFILE_JSON=file saves the same numbers as JSON, HYPERMONGO_PROFILE_STATS=file saves cProfile statistics of the last plot.</span></p>\n"))
+
+        self.label.setText(_translate("Dialog", "Stepsize"))
+        self.label2.setText(_translate("Dialog", " X-axis column"))
+        self.label3.setText(_translate("Dialog", " Y-axis column"))
+        self.label4.setText(_translate("Dialog", "Scatter size  "))
+        self.label5.setText(_translate("Dialog", " Z-axis column"))
+        self.label6.setText(_translate("Dialog", "File Number"))
+        self.label7.setText(_translate("Dialog", "Poly Degree"))
+        self.label8.setText(_translate("Dialog", "Downsample"))
+        self.comboBox.setItemText(0, _translate("Dialog", "Off"))
+        self.comboBox.setItemText(1, _translate("Dialog", "Min/Max"))
+        self.comboBox.setItemText(2, _translate("Dialog", "LTTB"))
+        self.checkBox.setText(_translate("Dialog", "Share x-ax     "))
+        self.checkBox2.setText(_translate("Dialog", "Scatter   "))
+        self.checkBox3.setText(_translate("Dialog", "3-D plot   "))
+        self.checkBox4.setText(_translate("Dialog", "Trendline"))
+        self.checkBox5.setText(_translate("Dialog", "Legend"))
+        self.checkBox6.setText(_translate("Dialog", "Single plot"))
+        self.checkBox7.setText(_translate("Dialog", "Memory map"))
+        self.checkBox8.setText(_translate("Dialog", "Animate"))
+        self.checkBox9.setText(_translate("Dialog", "Follow"))
+        self.checkBox10.setText(_translate("Dialog", "GPU view"))
+        self.checkBox11.setText(_translate("Dialog", "Density"))
+        self.checkBox10.setToolTip(_translate("Dialog", "" if hmview.AVAILABLE else "Install pyqtgraph and PyOpenGL to use the OpenGL view"))
+        self.pushButton2.setText(_translate("Dialog", "Cancel"))
+        self.pushButton3.setText(_translate("Dialog", "Compare..."))
+        self.pushButton4.setText(_translate("Dialog", "Add column"))
+        self.label9.setText(_translate("Dialog", "Profiling is on, the times of the next plot show here"))
+        self.lineEdit.setPlaceholderText(_translate("Dialog", "New column, i.e. E/W or r = sqrt(x^2+y^2+z^2)"))
+        return
+
+#-----------------------------------------------------------------------------------#
+# The graphing functions which create and show a plot w/ pyplot are kept in hmplot.py #
+#-----------------------------------------------------------------------------------#
+
+# Add your own graphing functions to hmplot.py if you wish to set up your own custom graphing 
+
+#-----------------------------------------------#
+# Initializes the Mainwindow GUI for Hypermongo #
+#-----------------------------------------------#
+
+def main() -> int: # Shows the main window and runs the event loop until it is closed. Started by Hypermongo.py.
+    app = QtWidgets.QApplication(sys.argv)
+    startupStage('QApplication')
+    MainWindow = QtWidgets.QMainWindow()
+    ui = Ui_MainWindow()
+    ui.setupUi(MainWindow)
+    startupStage('main window widgets')
+    MainWindow.show()
+    QtCore.QTimer.singleShot(0, importPlotting) # Plotting is ready a moment after the window appears, before anyone can click on Enter.
+    return app.exec_()
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
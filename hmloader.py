@@ -0,0 +1,1251 @@
+#!/usr/bin/env python3
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+import multiprocessing
+import tempfile
+import threading
+import warnings
+import hashlib
+import json
+import lzma
+import zlib
+import mmap
+import io
+import os
+import re
+import hmprofile
+
+#Purpose: Fast column loader for the table formatted data files plotted by Hypermongo.
+#Author: All rights reserved by Jacky Tran, jtran9148@gmail.com
+
+#------------------------------------------------------------------------------------------------#
+# Reads energy#.sph, col####.sph, massAndMore.out and any user file into NumPy arrays.           #
+#                                                                                                #
+# Only the selected columns are kept and the whole file is converted in one bulk pass by NumPy,  #
+# instead of splitting and converting every line in Python. Fortran 'D' exponents (1.0D+05)      #
+# are converted to 'E' on the raw bytes before parsing.                                          #
+#                                                                                                #
+# Parsed columns are kept in an LRU cache (CACHE) keyed on the file's path, modification time    #
+# and size, so plotting the same file again with different styling never re-reads it. The       #
+# memory budget is set in megabytes with the HYPERMONGO_CACHE_MB environment variable.           #
+#                                                                                                #
+# Every parsed column is also written to a binary sidecar (.hmcache/<file>.h<rows>/col#.npy) and #
+# memory mapped by later sessions as long as the source file has not changed since.              #
+# Blank lines count towards the stepsize like in every other read, through the data line of      #
+# every stored row, which is saved with the columns of files that have blank lines.              #
+#                                                                                                #
+# Files too big to hold in memory are read through MappedTable instead, which memory maps the    #
+# file, indexes its rows once and parses only the rows that are actually plotted. The same table #
+# serves large stepsizes: it seeks straight to every n-th row, using arithmetic for fixed width  #
+# Fortran output (stepsize >= STRIDE_MIN) and a sparse index of every 64th row for anything else #
+# (stepsize >= 64, below that reading the whole file is faster).                                 #
+#                                                                                                #
+# TailReader follows a file that a running simulation is still appending to. It remembers the   #
+# byte offset of the last complete row and every poll only parses the rows added since.          #
+#                                                                                                #
+# Every read takes an optional progress(bytes read, rows parsed) callback, called after each     #
+# block of the file. Raising LoadCancelled from it stops the read.                               #
+#                                                                                                #
+# readSchema() detects the header of a file once (column names, number of header lines,          #
+# delimiter and dtype) and hands out the same TableSchema until the file changes on disk.        #
+#                                                                                                #
+# Files of PARALLEL_MIN_BYTES and more are split into byte ranges that end on a newline and      #
+# parsed by PARSE_JOBS worker processes at once, since converting text to floats is what takes   #
+# the time and one process only runs on one core. The rows of every range are counted first, so  #
+# each worker knows where its rows go and writes them straight into one shared output file in   #
+# memory (/dev/shm), which becomes the returned columns without another copy. If a worker dies,  #
+# the file is parsed on the calling thread instead and the next big file starts new workers.    #
+#                                                                                                #
+# The reads report their disk and parse times and the bytes and rows they went through to the   #
+# Profile of the plot they load for (hmprofile), when profiling is on.                           #
+#                                                                                                #
+# gzip, xz and zstd files (energy3.sph.gz, col0042.sph.zst) are read without unpacking them to   #
+# disk first. The compression is told from the first bytes of the file, and DecompressedFile    #
+# hands the parser the text one block at a time, so memory does not grow with the file. Files   #
+# made of many independently compressed members (bgzip, pigz -i, pzstd) get an index of their    #
+# members on the first read, saved next to the sidecar columns. Later reads start straight at   #
+# the members that hold kept rows, skipping the rest when the stepsize allows, and parse groups #
+# of members in the worker processes. Plain text is still needed for memory mapping and for     #
+# following a file that is being written.                                                       #
+#------------------------------------------------------------------------------------------------#
+
+class ColumnMismatchError(ValueError): # Raised when the rows of the file do not have the same number of columns.
+    """Raised when one or more of the selected columns do not share the same amount of data values."""
+
+    def __init__(self, filename: str, reason: str = ''):
+        self.filename = filename
+        self.reason = reason
+        super().__init__(f"{filename}: mismatched columns ({reason})" if reason else f"{filename}: mismatched columns")
+
+    def __reduce__(self): # Raised in a parse worker, it reaches the loader with its filename and reason intact.
+        return (ColumnMismatchError, (self.filename, self.reason))
+
+def fortranToE(data: bytes) -> bytes: # Converts Fortran double precision exponents (1.0D+05) into ones NumPy can read (1.0E+05)
+    """Replaces every 'D'/'d' exponent marker in a block of raw numeric bytes with 'E'/'e'."""
+    if b'D' in data:
+        data = data.replace(b'D', b'E')
+    if b'd' in data:
+        data = data.replace(b'd', b'e')
+    return data
+
+def normalizeText(data: bytes) -> bytes: # Turns raw rows into plain whitespace separated numbers before parsing.
+    """Converts Fortran exponents and treats commas as whitespace, so comma separated files parse too."""
+    data = fortranToE(data)
+    if b',' in data:
+        data = data.replace(b',', b' ')
+    return data
+
+def parseColumns(src, usecols: Sequence[int], filename: str = '', skiprows: int = 0) -> np.ndarray:
+    """Parses whitespace separated numbers from a file-like object or list of lines
+    into a 2-D float64 array holding only the columns in usecols.
+    """
+    try:
+        table = np.loadtxt(src, dtype=np.float64, usecols=usecols, skiprows=skiprows, ndmin=2, comments=None)
+    except (ValueError, IndexError) as err: # loadtxt raises when a row is short or the column count changes partway through the file
+        raise ColumnMismatchError(filename, str(err)) from err
+    if table.size == 0: # Empty files (or files with only a header) give back empty columns instead of a (0,) array.
+        table = np.empty((0, len(usecols)), dtype=np.float64)
+    return table
+
+def lineBounds(data: bytes):
+    """Returns two int64 arrays with the start and end byte offset of every line in data."""
+    ends = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 10) # Every newline character marks the end of a row.
+    if len(data) > 0 and data[-1:] != b'\n': # The last row may not have a trailing newline.
+        ends = np.append(ends, len(data))
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = ends[:-1] + 1
+    return starts, ends
+
+class LoadCancelled(Exception): # Raised by a progress callback to stop a load that is no longer wanted.
+    """Raised from the progress callback of loadColumns to abandon the read. Nothing of a
+    cancelled read is cached or written to a sidecar.
+    """
+
+Progress = Optional[Callable[[int, int], None]] # Called as progress(bytes read, rows parsed) while a file is read.
+
+COMPRESSIONS: Dict[str, Tuple[bytes, str]] = {'gzip': (b'\x1f\x8b', '.gz'), 'xz': (b'\xfd7zXZ\x00', '.xz'), 'zstd': (b'\x28\xb5\x2f\xfd', '.zst')} # Magic bytes and extension of every compression read transparently.
+
+def compression(filename: str) -> Optional[str]: # 'gzip', 'xz' or 'zstd' for a compressed file, None for plain text.
+    """Tells the compression from the magic bytes at the start of the file, so a file without
+    the usual extension is still read right and a plain file named .gz is read as text.
+    """
+    with open(filename, 'rb') as Data:
+        head = Data.read(6)
+    for kind, (magic, extension) in COMPRESSIONS.items():
+        if head.startswith(magic):
+            return kind
+    return None
+
+def findFile(filename: str) -> str: # filename, or the compressed copy of it that exists (filename.gz, .xz or .zst).
+    if not os.path.isfile(filename):
+        for magic, extension in COMPRESSIONS.values():
+            if os.path.isfile(filename + extension):
+                return filename + extension
+    return filename
+
+def decompressor(kind: str, filename: str = '') -> Tuple[Callable, tuple]:
+    """Returns a function making the decompressor of one gzip member, xz stream or zstd frame and
+    the exceptions it raises on corrupt data. zstd needs Python 3.14 or the zstandard package.
+    """
+    if kind == 'gzip':
+        return (lambda: zlib.decompressobj(wbits = 31)), (zlib.error,) # 31: gzip header and trailer.
+    if kind == 'xz':
+        return lzma.LZMADecompressor, (lzma.LZMAError,)
+    try:
+        from compression import zstd # Standard library from Python 3.14 on.
+        return zstd.ZstdDecompressor, (zstd.ZstdError,)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        return (lambda: zstandard.ZstdDecompressor().decompressobj()), (zstandard.ZstdError,)
+    except ImportError:
+        raise OSError(f"{filename}: reading zstd files needs Python 3.14 or the zstandard package (pip install zstandard)") from None
+
+class DecompressedFile(object): # Reads the text of a gzip, xz or zstd file a block at a time, like a plain file opened with 'rb'.
+    """read(n) decompresses only as much of the file as the n bytes of text need, RAW_BYTES of
+    compressed data at a time, so memory stays at about one block however big the file is. Files
+    made of several members (concatenated .gz files, bgzip, pigz -i, pzstd) are read member after
+    member, and members lists [compressed offset, text bytes, newlines, text ends with a newline]
+    of every member read so far. tell() is the number of compressed bytes read, for progress.
+    start is the compressed offset of a member to begin at instead of the start of the file.
+    """
+    RAW_BYTES: int = 1 << 18
+
+    def __init__(self, filename: str, kind: str, start: int = 0):
+        self.filename: str = filename
+        self.newDecompressor, self.errors = decompressor(kind, filename)
+        self.raw = open(filename, 'rb')
+        self.raw.seek(start)
+        self.offset: int = start # Compressed offset just past the data handed to a decompressor.
+        self.pending: bytes = b'' # Compressed data read but not yet decompressed.
+        self.buffer: bytes = b'' # Text decompressed but not yet returned by read().
+        self.decompressor = None # None between two members.
+        self.members: List[List[int]] = []
+
+    def _decompress(self) -> bytes: # The next piece of text, b'' at the end of the file.
+        while True:
+            if not self.pending:
+                self.pending = self.raw.read(self.RAW_BYTES)
+                self.offset += len(self.pending)
+                if not self.pending:
+                    if self.decompressor is not None:
+                        raise OSError(f"{self.filename}: compressed data ends early, the file is truncated")
+                    return b''
+            if self.decompressor is None:
+                self.pending = self.pending.lstrip(b'\0') # Zero padding between members, as written by some tape and xz tools.
+                if not self.pending:
+                    continue
+                self.decompressor = self.newDecompressor()
+                previous = self.members[-1][3] if self.members else 1 # An empty member does not change where lines start.
+                self.members.append([self.offset - len(self.pending), 0, 0, previous])
+            try:
+                text = self.decompressor.decompress(self.pending)
+            except self.errors as error:
+                raise OSError(f"{self.filename}: corrupt compressed data ({error})") from error
+            if self.decompressor.eof: # The member ends here, what follows it starts the next one.
+                self.pending = self.decompressor.unused_data
+                self.decompressor = None
+            else:
+                self.pending = b''
+            if text:
+                member = self.members[-1]
+                member[1] += len(text)
+                member[2] += text.count(b'\n')
+                member[3] = int(text.endswith(b'\n'))
+                return text
+
+    def read(self, n: int = -1) -> bytes:
+        chunks: List[bytes] = [self.buffer]
+        size = len(self.buffer)
+        while n < 0 or size < n:
+            text = self._decompress()
+            if not text:
+                break
+            chunks.append(text)
+            size += len(text)
+        data = b''.join(chunks)
+        if n < 0:
+            n = len(data)
+        self.buffer = data[n:]
+        return data[:n]
+
+    def readline(self) -> bytes: # Text up to and including the next newline.
+        while b'\n' not in self.buffer:
+            text = self._decompress()
+            if not text:
+                break
+            self.buffer += text
+        end = self.buffer.find(b'\n') + 1 or len(self.buffer)
+        line, self.buffer = self.buffer[:end], self.buffer[end:]
+        return line
+
+    def tell(self) -> int:
+        return self.offset - len(self.pending)
+
+    def close(self):
+        self.raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def openData(filename: str): # Opens a data file for reading bytes, decompressing it on the fly if it is compressed.
+    kind = compression(filename)
+    return open(filename, 'rb') if kind is None else DecompressedFile(filename, kind)
+
+class TableSchema(object): # Layout of a data file: its column names and how many lines of header sit above the data.
+    """Holds the column names, column count, delimiter (None for whitespace), number of
+    header lines and guessed dtype of a data file, along with the (mtime, size) it was read from.
+    """
+
+    def __init__(self, filename: str, names: List[str], headerLines: int = 0, delimiter: Optional[str] = None, dtype: str = 'float64', version: Optional[Tuple[int, int]] = None):
+        self.filename: str = filename
+        self.names: List[str] = names
+        self.headerLines: int = headerLines
+        self.delimiter: Optional[str] = delimiter
+        self.dtype: str = dtype
+        self.version: Optional[Tuple[int, int]] = version
+
+    @property
+    def ncols(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"TableSchema({self.filename!r}, {self.ncols} columns, headerLines={self.headerLines}, delimiter={self.delimiter!r}, dtype={self.dtype!r})"
+
+_SCHEMAS: Dict[str, TableSchema] = {} # Schemas of every file read so far, keyed by absolute path.
+_SCHEMAS_LOCK = threading.Lock()
+
+def _isNumeric(line: bytes) -> bool: # True when every value on the line is a number.
+    values = normalizeText(line).split()
+    try:
+        for value in values:
+            float(value)
+    except ValueError:
+        return False
+    return len(values) > 0
+
+def readSchema(filename: str, sampleBytes: int = 65536) -> TableSchema:
+    """Returns the TableSchema of a data file. The header is detected from the first
+    sampleBytes of the file: the lines above the first all numeric one are header, and
+    the last non-blank header line holds the column names. Bad lines further down are
+    left to the parser, which raises ColumnMismatchError for them. The result is cached until the file's
+    mtime or size changes, so repeated calls only cost one os.stat().
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _SCHEMAS_LOCK:
+        schema = _SCHEMAS.get(path)
+    if schema is not None and schema.version == version:
+        return schema
+    with openData(path) as Data:
+        sample = Data.read(sampleBytes)
+    lines = sample.splitlines()
+    if len(sample) == sampleBytes and not sample.endswith(b'\n'): # The last line of a full sample is probably cut in half.
+        lines = lines[:-1]
+    headerLines: int = 0
+    data = b''
+    for i, line in enumerate(lines): # The header ends at the first line that is all numbers, a repeated header or 1.2-100 further down is not header.
+        if not line.strip():
+            continue
+        if _isNumeric(line):
+            data = line
+            break
+        headerLines = i + 1
+    delimiter = ',' if b',' in data else None
+    if headerLines > 0:
+        names = lines[headerLines-1].decode(errors='replace').replace(',', ' ').split()
+    else: # Files without a header get numbered names, one per value in the first row.
+        names = [f'col{i+1}' for i in range(len(normalizeText(data).split()))]
+    values = normalizeText(data).split()
+    dtype = 'int64' if values and all(value.lstrip(b'+-').isdigit() for value in values) else 'float64'
+    schema = TableSchema(filename, names, headerLines, delimiter, dtype, version)
+    with _SCHEMAS_LOCK:
+        _SCHEMAS[path] = schema
+    return schema
+
+ENERGY_NAMES: Tuple[str, ...] = ('time', 'W', 'T', 'U', 'E', 'S', 'J') # Column headers for the energy#.sph files, which have no header line.
+COL_NAMES: Tuple[str, ...] = ('radius', # Column headers for the col####.sph files, which have no header line.
+                              'pressure',
+                              'density',
+                              'temperature',
+                              'mean_molecular_weight',
+                              'mass',
+                              'smoothing_length',
+                              'neighbor_number',
+                              'gravitational_acceleration',
+                              'hydrodynamical_acceleration',
+                              'x',
+                              'y',
+                              'z',
+                              'specific_potential_energy',
+                              'specific_internal_energy',
+                              'velocity_squared')
+
+def numberedFilename(template: str, number: int) -> str: # Name of one snapshot of a numbered series.
+    """Turns the series name the GUI lists (energy.sph, col.sph) and a file number into the
+    name of that snapshot: energy3.sph, col0042.sph. Templates with a format field such as
+    'out{n:03d}.dat' are filled in with n, any other name is returned unchanged.
+    """
+    folder, base = os.path.split(template)
+    if base == 'energy.sph':
+        base = f'energy{number}.sph'
+    elif base == 'col.sph':
+        base = f'col{number:04d}.sph' # col0000.sph ... col9999.sph, wider numbers are written out in full.
+    elif '{' in base:
+        base = base.format(n=number)
+    return os.path.join(folder, base)
+
+def seriesNumbers(template: str) -> List[int]: # File numbers of a numbered series that exist on disk, in order.
+    """Returns the sorted file numbers n for which numberedFilename(template, n) exists in the
+    template's folder, i.e. [0, 1, 2, 5] for col0000.sph ... col0002.sph and col0005.sph.
+    Compressed files (col0003.sph.gz) count as well, findFile() finds them by the same number.
+    """
+    folder, base = os.path.split(template)
+    numbers: List[int] = []
+    suffix = '|'.join(re.escape(extension) for magic, extension in COMPRESSIONS.values())
+    for name in os.listdir(folder or '.'):
+        name = re.sub(f'({suffix})$', '', name)
+        for digits in re.findall(r'\d+', name): # The number can be any run of digits in the name, the round trip below checks which one.
+            if os.path.basename(numberedFilename(base, int(digits))) == name:
+                numbers.append(int(digits))
+                break
+    return sorted(numbers)
+
+def fileSchema(filename: str) -> TableSchema: # Schema of any data file, numbered Starsmasher outputs included.
+    """Returns the TableSchema of a file. energy#.sph and col####.sph files get their fixed
+    column names and no header lines, every other file goes through readSchema().
+    """
+    base = os.path.basename(filename)
+    if re.fullmatch(r'energy\d*\.sph(\.gz|\.xz|\.zst)?', base):
+        return TableSchema(filename, list(ENERGY_NAMES))
+    if re.fullmatch(r'col\d*\.sph(\.gz|\.xz|\.zst)?', base):
+        return TableSchema(filename, list(COL_NAMES))
+    return readSchema(filename)
+
+class TableCache(object): # Least-recently-used cache of parsed columns shared by every plot window.
+    """Holds parsed column arrays keyed on (path, mtime, size, stepsize, skiprows, column)
+    and evicts the least recently used columns once maxBytes is exceeded.
+    """
+
+    def __init__(self, maxBytes: int = 512 * 2**20):
+        self.maxBytes: int = maxBytes
+        self.nbytes: int = 0 # Total size of every array currently held in the cache.
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: "OrderedDict[tuple, np.ndarray]" = OrderedDict() # Most recently used entries are kept at the end.
+        self._versions: Dict[str, Tuple[int, int]] = {} # Last seen (mtime, size) of every cached file.
+        self._lock = threading.Lock()
+
+    def version(self, filename: str) -> Tuple[str, int, int]: # Returns the absolute path, mtime and size of a file and drops stale columns.
+        """Stats the file and forgets every cached column of it if it has been rewritten since it was cached."""
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if self._versions.get(path, version) != version: # The simulation wrote to the file, so none of the old columns are valid.
+                for key in [key for key in self._entries if key[0] == path]:
+                    self.nbytes -= self._entries.pop(key).nbytes
+            self._versions[path] = version
+        return (path,) + version
+
+    def get(self, key: tuple) -> Optional[np.ndarray]:
+        with self._lock:
+            array = self._entries.get(key)
+            if array is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return array
+
+    def put(self, key: tuple, array: np.ndarray):
+        if array.nbytes > self.maxBytes: # Columns larger than the whole budget are never cached.
+            return
+        array.flags.writeable = False # Cached columns are shared between plots, so nobody may change them in place.
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._entries[key] = array
+            self.nbytes += array.nbytes
+            self._evict()
+
+    def setBudget(self, maxBytes: int): # Changes the memory budget and evicts right away if needed.
+        with self._lock:
+            self.maxBytes = maxBytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self.nbytes = 0
+
+    def _evict(self): # Must be called with the lock held.
+        while self.nbytes > self.maxBytes and self._entries:
+            key, array = self._entries.popitem(last=False)
+            self.nbytes -= array.nbytes
+
+CACHE = TableCache(int(os.environ.get('HYPERMONGO_CACHE_MB', 512)) * 2**20) # Cache shared by the GUI and every other caller that passes cache=CACHE.
+
+SIDECARS: bool = os.environ.get('HYPERMONGO_SIDECAR', '1') != '0' # Set HYPERMONGO_SIDECAR=0 to never read or write sidecar files.
+SIDECAR_DIR: str = os.environ.get('HYPERMONGO_SIDECAR_DIR', '') # Optional shared directory for every sidecar instead of .hmcache next to each file.
+USER_SIDECAR_DIR: str = os.path.join(os.path.expanduser('~'), '.cache', 'hypermongo') # Used when the data directory is read-only.
+
+class Sidecar(object): # Columnar binary copy of an ASCII data file, stored as one .npy file per column.
+    """Stores parsed full resolution columns of a data file as .npy files plus a meta.json
+    holding the source's mtime and size. Valid columns are opened with np.load(mmap_mode='r'),
+    so reopening a file costs a few page faults instead of a full ASCII parse.
+    """
+
+    def __init__(self, filename: str, skiprows: int = 0):
+        self.source: str = os.path.abspath(filename)
+        self.skiprows: int = skiprows
+        self.directory: str = ''
+        self.meta: dict = {}
+        for directory in self._candidates(): # Uses the first existing sidecar, otherwise the first location that can be written.
+            if os.path.isfile(os.path.join(directory, 'meta.json')):
+                self.directory = directory
+                self.meta = self._readMeta()
+                break
+
+    def _candidates(self) -> List[str]: # Possible sidecar locations in order of preference.
+        name = f"{os.path.basename(self.source)}.h{self.skiprows}"
+        tag = hashlib.sha1(self.source.encode()).hexdigest()[:12] # Keeps files with the same name from different run directories apart.
+        if SIDECAR_DIR:
+            return [os.path.join(SIDECAR_DIR, f"{tag}-{name}")]
+        return [os.path.join(os.path.dirname(self.source), '.hmcache', name), os.path.join(USER_SIDECAR_DIR, f"{tag}-{name}")]
+
+    def _readMeta(self) -> dict:
+        try:
+            with open(os.path.join(self.directory, 'meta.json')) as meta:
+                return json.load(meta)
+        except (OSError, ValueError): # A half written or corrupt meta.json is treated the same as no sidecar.
+            return {}
+
+    def columns(self, version: Tuple[int, int]) -> List[int]:
+        """Returns the columns stored in the sidecar if it was written from this (mtime, size) of the source."""
+        if (self.meta.get('mtime_ns'), self.meta.get('size')) != tuple(version):
+            return []
+        return list(self.meta.get('columns', []))
+
+    def load(self, col: int) -> np.ndarray: # Memory maps one stored column, nothing is read until the data is used.
+        return np.load(os.path.join(self.directory, f'col{col}.npy'), mmap_mode='r')
+
+    def loadArray(self, name: str, version: Tuple[int, int]) -> Optional[np.ndarray]:
+        """Returns an extra array saved with saveArray() from the same (mtime, size) of the source, or None."""
+        for directory in self._candidates():
+            try:
+                with open(os.path.join(directory, f'{name}.json')) as meta:
+                    saved = json.load(meta)
+                if (saved.get('mtime_ns'), saved.get('size')) == tuple(version):
+                    return np.load(os.path.join(directory, f'{name}.npy'))
+            except (OSError, ValueError):
+                continue
+        return None
+
+    def saveArray(self, name: str, version: Tuple[int, int], array: np.ndarray):
+        """Saves an extra array (like a row index) of the source under the given name, if any location is writable."""
+        for directory in ([self.directory] if self.directory else self._candidates()):
+            try:
+                os.makedirs(directory, exist_ok=True)
+                tmp = os.path.join(directory, f'{name}.tmp.npy')
+                np.save(tmp, array)
+                os.replace(tmp, os.path.join(directory, f'{name}.npy'))
+                with open(os.path.join(directory, f'{name}.json'), 'w') as meta:
+                    json.dump({'mtime_ns': version[0], 'size': version[1]}, meta)
+                return
+            except OSError:
+                continue
+
+    def save(self, version: Tuple[int, int], arrays: Dict[int, np.ndarray]):
+        """Writes the given full resolution columns, keeping any columns already stored for the same version of the source."""
+        if not arrays:
+            return
+        stored = self.columns(version)
+        for directory in ([self.directory] if self.directory else self._candidates()):
+            try:
+                os.makedirs(directory, exist_ok=True)
+                for col, array in arrays.items():
+                    tmp = os.path.join(directory, f'col{col}.tmp.npy')
+                    np.save(tmp, array)
+                    os.replace(tmp, os.path.join(directory, f'col{col}.npy')) # Readers never see a half written column.
+                meta = {'source': self.source, 'mtime_ns': version[0], 'size': version[1], 'skiprows': self.skiprows,
+                        'rows': int(len(next(iter(arrays.values())))), 'columns': sorted(set(stored) | set(arrays))}
+                tmp = os.path.join(directory, 'meta.json.tmp')
+                with open(tmp, 'w') as out:
+                    json.dump(meta, out)
+                os.replace(tmp, os.path.join(directory, 'meta.json'))
+            except OSError: # Read-only data directories fall through to the next location, and if none work the sidecar is simply skipped.
+                continue
+            self.directory, self.meta = directory, meta
+            return
+
+MAPPED_MIN_BYTES: int = int(os.environ.get('HYPERMONGO_MMAP_MB', 1024)) * 2**20 # Files at least this big are memory mapped by default in the GUI.
+
+def fixedWidth(mm, start: int, size: int) -> int:
+    """Returns the length (newline included) of every line from byte start to size of a memory
+    mapped file whose lines all have the same length, as Fortran fixed format output does, or 0.
+    """
+    sample = mm[start:start + (1 << 20)]
+    ends = np.flatnonzero(np.frombuffer(sample, dtype=np.uint8) == 10)
+    if len(ends) < 2:
+        return 0
+    lengths = np.diff(ends)
+    width = int(ends[0]) + 1
+    if not np.all(lengths == width): # Rows of the sample differ in length.
+        return 0
+    span = size - start
+    if span % width not in (0, width - 1): # The last line may be missing its newline.
+        return 0
+    rows = (span + width - 1) // width
+    for row in np.linspace(0, rows - 2, num=min(rows - 1, 64), dtype=np.int64).tolist(): # Spot checks that rows all through the file end where they should.
+        if mm[start + (row + 1) * width - 1:start + (row + 1) * width] != b'\n':
+            return 0
+    return width
+
+def lineWidth(filename: str, skiprows: int = 0) -> int: # fixedWidth() of the data lines of a file, without indexing it.
+    with _TABLES_LOCK:
+        table = _TABLES.get((os.path.abspath(filename), skiprows))
+    stat = os.stat(filename)
+    if table is not None and table.version == (stat.st_mtime_ns, stat.st_size):
+        return table.lineBytes
+    if stat.st_size == 0:
+        return 0
+    with open(filename, 'rb') as Data:
+        mm = mmap.mmap(Data.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return fixedWidth(mm, dataStart(filename, skiprows), stat.st_size)
+    finally:
+        mm.close()
+
+class MappedTable(object): # Memory mapped data file that only parses the rows it is asked for.
+    """Memory maps a data file and finds its rows through a sparse row index. When every
+    line has the same length (Fortran fixed format output) a row's offset is plain
+    arithmetic and nothing is scanned at all, otherwise the offset of every ROW_GRANULE-th
+    row is indexed once (and saved in the sidecar directory) and the rows in between are
+    found by searching forward from the nearest indexed row. Rows are parsed in blocks
+    of at most BLOCK_ROWS rows and SCAN_BYTES of file, and the pages of each block are
+    released afterwards, so peak memory does not grow with the file size.
+    """
+    BLOCK_ROWS: int = 1 << 18 # Number of selected rows converted to floats at a time.
+    SCAN_BYTES: int = 1 << 24 # Number of bytes of the file scanned or parsed at a time.
+    ROW_GRANULE: int = 64 # Only every 64th row start is kept in the index of variable width files.
+
+    def __init__(self, filename: str, skiprows: int = 0):
+        self.filename: str = filename
+        self.skiprows: int = skiprows
+        with open(filename, 'rb') as Data:
+            stat = os.fstat(Data.fileno())
+            self.version: Tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+            self.mm = mmap.mmap(Data.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b'' # Empty files can not be memory mapped.
+        self.size: int = stat.st_size
+        self.dataStart: int = 0 # Byte offset of the first data row below the header.
+        for i in range(skiprows):
+            newline = self.mm.find(b'\n', self.dataStart)
+            self.dataStart = self.size if newline < 0 else newline + 1
+        self.lineBytes: int = self._fixedWidth() # Length of every line (newline included) of a fixed width file, 0 otherwise.
+        if self.lineBytes:
+            self.starts: Optional[np.ndarray] = None
+            self.nrows: int = (self.size - self.dataStart + self.lineBytes - 1) // self.lineBytes
+        else:
+            self.starts, self.nrows = self._loadIndex()
+        self._cursor: Tuple[int, int] = (0, self.dataStart) # Last (row, offset) found, so walking forward through a file never restarts from the index.
+
+    def _fixedWidth(self) -> int: # Detects files whose lines all have the same length.
+        return fixedWidth(self.mm, self.dataStart, self.size)
+
+    def _loadIndex(self) -> Tuple[np.ndarray, int]: # Reads the sparse index from the sidecar directory, or builds and saves it.
+        sidecar = Sidecar(self.filename, self.skiprows)
+        name = f'rows{self.ROW_GRANULE}'
+        saved = sidecar.loadArray(name, self.version)
+        if saved is not None and len(saved) > 0:
+            return saved[1:], int(saved[0]) # The row count is stored as the first value.
+        starts, nrows = self._buildIndex()
+        sidecar.saveArray(name, self.version, np.concatenate(([nrows], starts)))
+        return starts, nrows
+
+    def _buildIndex(self) -> Tuple[np.ndarray, int]:
+        granule = self.ROW_GRANULE
+        parts: List[np.ndarray] = [np.array([self.dataStart], dtype=np.int64)]
+        count: int = 0 # Number of newlines found so far, i.e. the number of complete rows.
+        for offset in range(self.dataStart, self.size, self.SCAN_BYTES):
+            length = min(self.SCAN_BYTES, self.size - offset)
+            chunk = np.frombuffer(self.mm, dtype=np.uint8, count=length, offset=offset)
+            ends = np.flatnonzero(chunk == 10) + offset
+            del chunk # Releases the buffer export so the memory map can still be closed later.
+            self._release(offset, length)
+            parts.append(ends[(granule - 1 - count) % granule::granule] + 1) # The newline ending row granule*k-1 is where row granule*k starts.
+            count += len(ends)
+        nrows = count + (1 if self.size > self.dataStart and self.mm[self.size-1:self.size] != b'\n' else 0)
+        starts = np.concatenate(parts)
+        return starts[:(nrows + granule - 1) // granule], nrows # Drops a start that points past the last row.
+
+    def _release(self, offset: int = 0, length: int = 0): # Drops already parsed pages of the memory map from this process so RSS stays bounded by the block size.
+        if length > 0 and hasattr(self.mm, 'madvise'): # madvise is not available on Windows, where the OS trims mapped pages on its own.
+            begin = offset - offset % mmap.PAGESIZE
+            self.mm.madvise(mmap.MADV_DONTNEED, begin, offset + length - begin)
+
+    def rowStart(self, row: int) -> int:
+        """Returns the byte offset where a data row starts (the end of the data for row >= nrows)."""
+        if row >= self.nrows:
+            return self.size
+        if self.lineBytes:
+            return self.dataStart + row * self.lineBytes
+        granule = row // self.ROW_GRANULE
+        last, pos = self._cursor
+        if not (last <= row and row - last < row - granule * self.ROW_GRANULE): # Starting from the index is closer than continuing from the cursor.
+            last, pos = granule * self.ROW_GRANULE, int(self.starts[granule])
+        for i in range(row - last):
+            pos = self.mm.find(b'\n', pos) + 1
+        self._cursor = (row, pos)
+        return pos
+
+    def lines(self, start: int, stop: int, step: int = 1) -> bytes:
+        """Returns the text of data rows start:stop:step joined by newlines, without touching any other row."""
+        stop = min(stop, self.nrows)
+        if start >= stop:
+            return b''
+        if step == 1: # Consecutive rows are one slice of the memory map.
+            return self.mm[self.rowStart(start):self.rowStart(stop)]
+        if hasattr(self.mm, 'madvise'): # Without this the kernel's readahead pulls in every page between two selected rows.
+            self.mm.madvise(mmap.MADV_RANDOM)
+        if self.lineBytes: # Fixed width rows are sliced straight out of the map.
+            starts = (self.dataStart + np.arange(start, stop, step, dtype=np.int64) * self.lineBytes).tolist()
+            return b'\n'.join([self.mm[begin:begin + self.lineBytes - 1] for begin in starts])
+        rows: List[bytes] = []
+        for row in range(start, stop, step):
+            begin = self.rowStart(row)
+            end = self.mm.find(b'\n', begin)
+            rows.append(self.mm[begin:end if end >= 0 else self.size])
+        return b'\n'.join(rows)
+
+    def read(self, columns: Sequence[int], stepsize: int = 1, start: int = 0, stop: Optional[int] = None, progress: Progress = None) -> List[np.ndarray]:
+        """Parses columns of data rows start:stop:stepsize and returns one float64 array per column."""
+        stop = self.nrows if stop is None else min(stop, self.nrows)
+        usecols: List[int] = sorted(set(columns))
+        out = np.empty((len(range(start, stop, stepsize)), len(usecols)), dtype=np.float64)
+        k: int = 0
+        lineBytes = self.lineBytes or max((self.size - self.dataStart) // max(self.nrows, 1), 1) # Length of a line, used to keep every block under SCAN_BYTES of the file.
+        steps = max(min(self.BLOCK_ROWS, self.SCAN_BYTES // (lineBytes * stepsize)), 1)
+        for first in range(start, stop, steps * stepsize): # Blocks are a whole number of steps long so the stride never drifts.
+            last = min(first + steps * stepsize, stop)
+            begin = self.rowStart(first)
+            with hmprofile.stage('disk'): # Touching the pages of the memory map is what reads them.
+                text = self.lines(first, last, stepsize)
+            with hmprofile.stage('parse'):
+                table = parseColumns(io.BytesIO(normalizeText(text)), usecols, self.filename)
+            out[k:k+len(table)] = table
+            k += len(table)
+            hmprofile.count('bytes read', len(text))
+            hmprofile.count('rows parsed', len(table))
+            self._release(begin, self.rowStart(last) - begin)
+            if progress:
+                progress(self.rowStart(last), k)
+        out = out[:k] # Blank lines are skipped by the parser, so there may be fewer rows than lines.
+        return [np.ascontiguousarray(out[:, usecols.index(col)]) for col in columns]
+
+    def column(self, col: int) -> "MappedColumn":
+        return MappedColumn(self, col)
+
+class MappedColumn(object): # Lazily parsed column of a MappedTable.
+    """One column of a MappedTable. Slicing it parses only the rows in the slice,
+    e.g. table.column(3)[::1000] reads every 1000th row of the fourth column.
+    """
+
+    def __init__(self, table: MappedTable, col: int):
+        self.table: MappedTable = table
+        self.col: int = col
+
+    def __len__(self) -> int:
+        return self.table.nrows
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step < 1:
+                raise ValueError("MappedColumn only supports forward slices")
+            return self.table.read([self.col], step, start, stop)[0]
+        row = int(key) + (len(self) if int(key) < 0 else 0)
+        if not 0 <= row < len(self):
+            raise IndexError(f"row {key} is out of range for {len(self)} rows")
+        return self.table.read([self.col], 1, row, row + 1)[0][0]
+
+    def __array__(self, dtype=None, copy=None):
+        array = self[:]
+        return array if dtype is None else array.astype(dtype)
+
+class GrowableColumn(object): # float64 column that appends in amortized O(1) time.
+    """Keeps its values in a buffer that doubles in size whenever it runs out of room, so
+    appending n rows costs O(n) over the life of the column instead of a copy per append.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._buffer: np.ndarray = np.empty(capacity, dtype=np.float64)
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def extend(self, values: np.ndarray):
+        needed = self.size + len(values)
+        if needed > len(self._buffer):
+            buffer = np.empty(max(needed, 2 * len(self._buffer)), dtype=np.float64)
+            buffer[:self.size] = self._buffer[:self.size]
+            self._buffer = buffer
+        self._buffer[self.size:needed] = values
+        self.size = needed
+
+    def view(self) -> np.ndarray: # The filled part of the buffer, without copying. Appends never change values already in a view.
+        return self._buffer[:self.size]
+
+class TailReader(object): # Follows a data file that is still being written, i.e. energy#.sph or massAndMore.out during a run.
+    """Reads the selected columns of a growing file. poll() parses only the complete rows
+    appended since the last call, starting from the remembered byte offset, so its cost
+    depends on the new data and not on the length of the file. A row without its newline
+    yet is left for the next poll. A truncated or replaced file is read again from the start.
+    A compressed file is not being written any more: it is read whole, and again if it is replaced.
+    """
+
+    CHUNK_BYTES: int = 1 << 26 # New data is parsed in pieces of at most this many bytes.
+
+    def __init__(self, filename: str, columns: Sequence[int], stepsize: int = 1, skiprows: int = 0):
+        self.filename: str = filename
+        self.columns: List[int] = list(columns)
+        self.usecols: List[int] = sorted(set(columns))
+        self.stepsize: int = max(stepsize, 1)
+        self.skiprows: int = skiprows
+        self.reset()
+
+    def reset(self): # Forgets everything read so far.
+        self.offset: int = 0 # Byte offset just past the last complete row parsed.
+        self.rows: int = 0 # Data rows seen so far, kept or not. Decides which new rows the stepsize keeps.
+        self.inode: Optional[int] = None
+        self.version: Optional[Tuple[int, int]] = None # (mtime, size) of a compressed file when it was read.
+        self._skip: int = self.skiprows # Header lines still to be skipped.
+        self._arrays: Dict[int, GrowableColumn] = {col: GrowableColumn() for col in self.usecols}
+
+    def poll(self, progress: Progress = None) -> int:
+        """Parses the rows appended since the last poll. Returns the number of rows added to the columns.
+        progress(byte offset, rows added) is called after every block of a plain file, the first poll
+        of a big file can take a while.
+        """
+        stat = os.stat(self.filename)
+        if stat.st_size < self.offset or (self.inode is not None and stat.st_ino != self.inode): # Truncated or replaced, i.e. a restarted run.
+            self.reset()
+        self.inode = stat.st_ino
+        added: int = 0
+        kind = compression(self.filename) if stat.st_size else None
+        if kind is not None:
+            if self.version != (stat.st_mtime_ns, stat.st_size):
+                self.reset()
+                self.inode, self.version = stat.st_ino, (stat.st_mtime_ns, stat.st_size)
+                added = self._readAll(kind)
+            return added
+        if stat.st_size == self.offset:
+            return added
+        with open(self.filename, 'rb') as Data:
+            Data.seek(self.offset)
+            while True:
+                block = Data.read(self.CHUNK_BYTES)
+                end = block.rfind(b'\n') + 1 # Only complete rows are parsed, the rest is read again next time.
+                if end == 0:
+                    break
+                added += self._append(block[:end])
+                self.offset += end
+                if progress:
+                    progress(self.offset, added)
+                if len(block) < self.CHUNK_BYTES:
+                    break
+                Data.seek(self.offset)
+        return added
+
+    def _readAll(self, kind: str) -> int: # Parses every row of a compressed file, the last one with or without its newline.
+        added: int = 0
+        rest = b''
+        with DecompressedFile(self.filename, kind) as Data:
+            while True:
+                block = Data.read(self.CHUNK_BYTES)
+                data = rest + block
+                end = data.rfind(b'\n') + 1 if block else len(data)
+                added += self._append(data[:end])
+                rest = data[end:]
+                if not block:
+                    return added
+
+    def _append(self, data: bytes) -> int: # Parses a block of complete rows and appends the kept ones.
+        starts, ends = lineBounds(data)
+        skipped = min(self._skip, len(starts))
+        starts, ends = starts[skipped:], ends[skipped:]
+        first = (-self.rows) % self.stepsize # Keeps the stepsize counting across polls.
+        table = np.empty((0, len(self.usecols)))
+        if first < len(starts):
+            if self.stepsize > 1 or first > 0 or skipped > 0: # Only the kept rows are converted to floats.
+                data = b'\n'.join([data[start:end] for start, end in zip(starts[first::self.stepsize].tolist(), ends[first::self.stepsize].tolist())])
+            table = parseColumns(io.BytesIO(normalizeText(data)), self.usecols, self.filename)
+        self._skip -= skipped # Nothing changes before the rows parsed, so a failed block can be read again on the next poll.
+        self.rows += len(starts)
+        for k, col in enumerate(self.usecols):
+            self._arrays[col].extend(table[:, k])
+        return len(table)
+
+    def data(self) -> List[np.ndarray]: # Views of every column read so far, in the order they were asked for.
+        return [self._arrays[col].view() for col in self.columns]
+
+STRIDE_MIN: int = int(os.environ.get('HYPERMONGO_STRIDE_MIN', 8)) # Stepsizes at least this big seek to every n-th row of a fixed width file instead of reading the whole file.
+
+def seeksRows(filename: str, stepsize: int, skiprows: int = 0) -> bool:
+    """True when reading every stepsize-th row of a plain file is faster by seeking to each of
+    them than by reading the whole file. Fixed width rows are found with arithmetic, so they seek
+    from STRIDE_MIN on. Other rows are found by searching forward from the nearest row of the
+    index, one Python call per row, which only wins once the stepsize reaches its ROW_GRANULE.
+    """
+    return stepsize >= STRIDE_MIN and (stepsize >= MappedTable.ROW_GRANULE or lineWidth(filename, skiprows) > 0)
+
+_TABLES: Dict[Tuple[str, int], MappedTable] = {} # Open MappedTables, so each file is only indexed once per version.
+_TABLES_LOCK = threading.Lock()
+
+def openTable(filename: str, skiprows: int = 0) -> MappedTable:
+    """Returns the MappedTable of a file, reusing its row index unless the file has changed."""
+    key = (os.path.abspath(filename), skiprows)
+    stat = os.stat(filename)
+    with _TABLES_LOCK:
+        table = _TABLES.get(key)
+        if table is None or table.version != (stat.st_mtime_ns, stat.st_size):
+            table = _TABLES[key] = MappedTable(filename, skiprows)
+    return table
+
+def loadColumns(filename: str, columns: Sequence[int], stepsize: int = 1, skiprows: int = 0, cache: Optional[TableCache] = None, sidecar: Optional[bool] = None, mapped: bool = False, progress: Progress = None) -> List[np.ndarray]:
+    """Reads the 0-based column indices in 'columns' from a data file and returns one
+    float64 array per requested column, in the same order they were asked for.
+
+    skiprows is the number of header lines at the top of the file and stepsize keeps
+    every n-th data row, the same way the Stepsize box in the GUI always has. When a
+    cache is given, columns already parsed from the same version of the file are reused
+    and only the missing ones are read. sidecar (default SIDECARS) reads and writes the
+    binary sidecar of the file instead of always parsing the ASCII text. mapped reads
+    the file through its MappedTable, for files that are too big to load whole.
+    progress(bytes read, rows parsed) is called after every block that is parsed.
+    Compressed files are read the same way, mapped is ignored for them.
+    """
+    read = _readSidecarColumns if (SIDECARS if sidecar is None else sidecar) else _readColumns
+    if mapped and compression(filename) is None: # Huge files never get a full resolution sidecar, only the plotted rows are parsed.
+        read = _readMappedColumns
+    if cache is None:
+        data = read(filename, columns, stepsize, skiprows, progress)
+        hmprofile.count('rows kept', len(data[0]) if data else 0)
+        return data
+    version = cache.version(filename)
+    keys = {col: version + (stepsize, skiprows, col) for col in set(columns)}
+    arrays = {col: cache.get(key) for col, key in keys.items()}
+    missing: List[int] = [col for col, array in arrays.items() if array is None]
+    hmprofile.count('cached columns', len(arrays) - len(missing))
+    if missing:
+        for col, array in zip(missing, read(filename, missing, stepsize, skiprows, progress)):
+            cache.put(keys[col], array)
+            arrays[col] = array
+    hmprofile.count('rows kept', len(arrays[columns[0]]) if len(columns) else 0)
+    return [arrays[col] for col in columns]
+
+def _readMappedColumns(filename: str, columns: Sequence[int], stepsize: int = 1, skiprows: int = 0, progress: Progress = None) -> List[np.ndarray]: # Memory mapped read used by loadColumns.
+    return openTable(filename, skiprows).read(columns, stepsize, progress = progress)
+
+def _readSidecarColumns(filename: str, columns: Sequence[int], stepsize: int = 1, skiprows: int = 0, progress: Progress = None) -> List[np.ndarray]: # Sidecar backed read used by loadColumns.
+    stat = os.stat(filename) # Taken before parsing, so a file rewritten during the parse is never saved under its new version.
+    version = (stat.st_mtime_ns, stat.st_size)
+    side = Sidecar(filename, skiprows)
+    stored = set(side.columns(version))
+    need: List[int] = sorted(set(columns) - stored)
+    arrays: Dict[int, np.ndarray] = {}
+    if need and stepsize >= STRIDE_MIN and (compression(filename) is not None or seeksRows(filename, stepsize, skiprows)): # Large steps seek straight to the kept rows (or members of a compressed file) instead of parsing the whole file for the sidecar.
+        arrays.update(zip(need, _readColumns(filename, need, stepsize, skiprows, progress)))
+    elif need: # Missing columns are parsed at full resolution so the sidecar serves every later stepsize.
+        full = dict(zip(need, _readColumns(filename, need, 1, skiprows, progress)))
+        side.save(version, full)
+        lines = _sidecarLines(filename, skiprows, side, version, len(full[need[0]])) if stepsize > 1 else None
+        arrays.update((col, _decimate(array, stepsize, lines)) for col, array in full.items())
+    hmprofile.count('sidecar columns', len(stored.intersection(columns)))
+    if stored.intersection(columns):
+        lines = _sidecarLines(filename, skiprows, side, version, side.meta.get('rows', 0)) if stepsize > 1 else None
+        for col in stored.intersection(columns):
+            arrays[col] = _decimate(side.load(col), stepsize, lines)
+    return [arrays[col] for col in columns]
+
+def _decimate(array: np.ndarray, stepsize: int, lines: Optional[np.ndarray] = None) -> np.ndarray: # Keeps the values of every n-th line from a full resolution column.
+    """lines holds the data line of every value, as _rowLines returns it. Without it (or when it
+    is empty) every line held a value and every n-th value is kept.
+    """
+    if stepsize == 1:
+        return array
+    if lines is not None and len(lines):
+        return np.ascontiguousarray(array[lines % stepsize == 0])
+    return np.ascontiguousarray(array[::stepsize])
+
+BLANK_BYTES = np.frombuffer(b' \t\r\n\v\f,', dtype=np.uint8) # What is left of a line the parser skips: whitespace, and commas as normalizeText treats them.
+
+def _rowLines(filename: str, skiprows: int, rows: int) -> np.ndarray:
+    """Returns the data line (0 is the first line below the skiprows header lines) that each of the
+    rows parsed from a file came from, or an empty array when every line held a row. The parser
+    skips blank lines but stepsize counts them, like the direct, stride and parallel reads do, so
+    full resolution sidecar columns of a file with blank lines are decimated through these.
+    """
+    count: int = 0
+    last = b''
+    with openData(filename) as Data: # A plain count of the lines first, most files have no blank ones.
+        while True:
+            block = Data.read(READ_BLOCK_BYTES)
+            if not block:
+                break
+            count += block.count(b'\n')
+            last = block[-1:]
+    count += 1 if last not in (b'', b'\n') else 0
+    if max(count - skiprows, 0) == rows:
+        return np.empty(0, dtype=np.int64)
+    found: List[np.ndarray] = []
+    count = 0
+    rest = b''
+    with openData(filename) as Data:
+        while True:
+            block = Data.read(1 << 22) # Smaller blocks, the scan below makes 8 bytes of every byte.
+            data = rest + block
+            if block:
+                end = data.rfind(b'\n') + 1
+                data, rest = data[:end], data[end:]
+            starts, ends = lineBounds(data)
+            skipped = min(skiprows, len(starts))
+            skiprows -= skipped
+            starts, ends = starts[skipped:], ends[skipped:]
+            filled = np.concatenate(([0], np.cumsum(~np.isin(np.frombuffer(data, dtype=np.uint8), BLANK_BYTES)))) # Printable bytes before every offset.
+            found.append(np.flatnonzero(filled[ends] > filled[starts]) + count)
+            count += len(starts)
+            if not block:
+                break
+    return np.concatenate(found)
+
+def _sidecarLines(filename: str, skiprows: int, side: Sidecar, version: Tuple[int, int], rows: int) -> np.ndarray: # _rowLines of a file, saved with its sidecar columns.
+    lines = side.loadArray('lines', version)
+    if lines is None:
+        lines = _rowLines(filename, skiprows, rows)
+        side.saveArray('lines', version, lines)
+    return lines
+
+READ_BLOCK_BYTES: int = 1 << 24 # Bulk reads parse the file in blocks of about this size, reporting progress after each.
+
+def _readColumns(filename: str, columns: Sequence[int], stepsize: int = 1, skiprows: int = 0, progress: Progress = None) -> List[np.ndarray]: # Uncached bulk read used by loadColumns.
+    kind = compression(filename)
+    if kind is not None:
+        stat = os.stat(filename)
+        version = (stat.st_mtime_ns, stat.st_size)
+        members = Sidecar(filename).loadArray('members', version)
+        if members is not None: # Indexed on an earlier read, the members can be parsed apart.
+            try:
+                return _readMemberColumns(filename, kind, members, columns, stepsize, skiprows, progress)
+            except BrokenProcessPool as error: # Streamed on this thread below instead.
+                brokenPool(filename, error)
+    elif seeksRows(filename, stepsize, skiprows): # Only the kept rows are read, found through the file's row index.
+        return _readMappedColumns(filename, columns, stepsize, skiprows, progress)
+    elif PARSE_JOBS > 1 and os.path.getsize(filename) >= PARALLEL_MIN_BYTES: # Big enough to be worth starting the workers.
+        try:
+            return _readParallelColumns(filename, columns, stepsize, skiprows, progress)
+        except BrokenProcessPool as error: # Parsed on this thread below instead.
+            brokenPool(filename, error)
+    usecols: List[int] = sorted(set(columns)) # Each column is only parsed once even if it is used for more than one axis.
+    tables: List[np.ndarray] = []
+    rows: int = 0 # Data rows seen so far, decides which rows of the next block the stepsize keeps.
+    parsed: int = 0
+    done: int = 0
+    rest = b''
+    with (open(filename, 'rb') if kind is None else DecompressedFile(filename, kind)) as Data:
+        while True:
+            with hmprofile.stage('disk'): # Includes the decompression of compressed files.
+                block = Data.read(READ_BLOCK_BYTES)
+            hmprofile.count('bytes read', Data.tell() - done)
+            done = Data.tell()
+            data = rest + block
+            if block: # The last, unfinished line of the block waits for the next one.
+                end = data.rfind(b'\n') + 1
+                data, rest = data[:end], data[end:]
+            starts, ends = lineBounds(data)
+            skipped = min(skiprows, len(starts))
+            skiprows -= skipped
+            first = (-rows) % stepsize # Keeps the stepsize counting across blocks.
+            rows += len(starts) - skipped
+            hmprofile.count('rows in file', len(starts) - skipped)
+            if first + skipped < len(starts):
+                if stepsize > 1 or first > 0 or skipped > 0: # Decimate the lines before any float conversion happens, so skipped rows are never parsed.
+                    kept = zip(starts[skipped+first::stepsize].tolist(), ends[skipped+first::stepsize].tolist())
+                    data = b'\n'.join([data[start:end] for start, end in kept])
+                with hmprofile.stage('parse'):
+                    tables.append(parseColumns(io.BytesIO(normalizeText(data)), usecols, filename))
+                parsed += len(tables[-1])
+                hmprofile.count('rows parsed', len(tables[-1]))
+            if progress:
+                progress(done, parsed)
+            if not block:
+                break
+    if kind is not None and len(Data.members) > 1: # Saved like the row index of MappedTable, whether or not columns go to sidecars.
+        Sidecar(filename).saveArray('members', version, np.array(Data.members, dtype=np.int64))
+    table = np.concatenate(tables) if len(tables) > 1 else (tables[0] if tables else np.empty((0, len(usecols))))
+    arrays = {col: np.ascontiguousarray(table[:, k]) for k, col in enumerate(usecols)}
+    return [arrays[col] for col in columns]
+
+PARSE_JOBS: int = int(os.environ.get('HYPERMONGO_PARSE_JOBS', 0)) or ((os.cpu_count() or 1) if os.name == 'posix' else 1) # Worker processes parsing one big file together, 1 parses on the calling thread.
+PARALLEL_MIN_BYTES: int = int(os.environ.get('HYPERMONGO_PARALLEL_MB', 64)) << 20 # Smaller files are parsed before the workers would have started.
+RANGE_BYTES: int = 1 << 25 # Largest byte range a worker parses at once, keeps the memory of every worker bounded.
+
+_POOL: Optional[ProcessPoolExecutor] = None # Parse workers, started on the first big file and kept for the next.
+_POOL_LOCK = threading.Lock()
+
+def parsePool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn' # Forking the GUI would copy its threads mid-flight.
+            _POOL = ProcessPoolExecutor(max_workers = PARSE_JOBS, mp_context = multiprocessing.get_context(method))
+    return _POOL
+
+def brokenPool(filename: str, error: BaseException): # Drops a pool whose workers died, so the next big file starts a new one, and warns that filename is parsed without it.
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait = False, cancel_futures = True)
+        _POOL = None
+    warnings.warn(f"{filename}: parse workers failed ({error}), parsing in this process instead", RuntimeWarning)
+
+def dataStart(filename: str, skiprows: int = 0) -> int: # Byte offset of the first line after skiprows header lines.
+    offset = 0
+    with open(filename, 'rb') as Data:
+        while skiprows > 0:
+            block = Data.read(1 << 16)
+            if not block:
+                break
+            for i in range(skiprows):
+                end = block.find(b'\n', (end + 1) if i else 0)
+                if end < 0:
+                    break
+                skiprows -= 1
+            if skiprows > 0: # The header goes on into the next block.
+                offset += len(block)
+            else:
+                offset += end + 1
+    return offset
+
+def splitRanges(filename: str, start: int, parts: int) -> List[Tuple[int, int]]: # (start, stop) byte ranges from start to the end of the file, each ending just after a newline.
+    size = os.path.getsize(filename)
+    bounds: List[int] = [start]
+    with open(filename, 'rb') as Data:
+        for i in range(1, parts):
+            Data.seek(max(start + (size - start) * i // parts, bounds[-1]))
+            end = -1
+            while end < 0: # Moves on to the end of the line the cut falls into.
+                block = Data.read(1 << 16)
+                if not block:
+                    break
+                end = block.find(b'\n')
+                if end >= 0:
+                    end = Data.tell() - len(block) + end + 1
+            if bounds[-1] < end < size:
+                bounds.append(end)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def _countLines(filename: str, start: int, stop: int) -> int: # Runs in a parse worker: the number of lines in a byte range, as lineBounds counts them.
+    with open(filename, 'rb') as Data:
+        Data.seek(start)
+        data = Data.read(stop - start)
+    return data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+
+def _parseRange(filename: str, start: int, stop: int, usecols: List[int], stepsize: int, first: int, out: str, shape: Tuple[int, int], offset: int) -> int:
+    """Runs in a parse worker: parses every stepsize-th line of a byte range from line first on and
+    writes the columns into rows offset onwards of the (len(usecols), rows) float64 file out.
+    Returns the number of rows parsed, fewer than counted if the range has blank lines.
+    """
+    with open(filename, 'rb') as Data:
+        Data.seek(start)
+        data = Data.read(stop - start)
+    return _writeRows(data, filename, usecols, stepsize, first, out, shape, offset)
+
+def _parseMembers(filename: str, kind: str, start: int, length: int, lineStart: bool, usecols: List[int], stepsize: int, first: int, out: str, shape: Tuple[int, int], offset: int) -> int:
+    """Runs in a parse worker, or on the loading thread: the _parseRange of a run of members of a
+    compressed file, which starts at compressed offset start and holds length bytes of text. The
+    lines that start in the run are its own. Unless lineStart, the first line began in the member
+    before and is left out, and the last line is read on into the next member up to its newline.
+    """
+    with DecompressedFile(filename, kind, start) as Data:
+        data = Data.read(length)
+        if data and not data.endswith(b'\n'):
+            data += Data.readline()
+    if not lineStart:
+        data = data[data.find(b'\n') + 1:]
+    return _writeRows(data, filename, usecols, stepsize, first, out, shape, offset)
+
+def _writeRows(data: bytes, filename: str, usecols: List[int], stepsize: int, first: int, out: str, shape: Tuple[int, int], offset: int) -> int: # Parses lines first::stepsize of data into the shared output file.
+    if stepsize > 1 or first > 0:
+        starts, ends = lineBounds(data)
+        data = b'\n'.join([data[s:e] for s, e in zip(starts[first::stepsize].tolist(), ends[first::stepsize].tolist())])
+    data = normalizeText(data)
+    table = parseColumns(io.BytesIO(data), usecols, filename) if data and not data.isspace() else np.empty((0, len(usecols))) # The kept lines of a short run can all be blank, loadtxt warns about those.
+    columns = np.memmap(out, dtype = np.float64, mode = 'r+', shape = shape)
+    columns[:, offset:offset + len(table)] = table.T
+    del columns # Unmaps, the rows are in the shared pages already.
+    return len(table)
+
+def _readParallelColumns(filename: str, columns: Sequence[int], stepsize: int = 1, skiprows: int = 0, progress: Progress = None) -> List[np.ndarray]: # Bulk read of a big file, split across the parse workers.
+    usecols: List[int] = sorted(set(columns))
+    start = dataStart(filename, skiprows)
+    ranges = splitRanges(filename, start, max(PARSE_JOBS, -(-(os.path.getsize(filename) - start) // RANGE_BYTES)))
+    counts: List[int] = list(parsePool().map(_countLines, *zip(*[(filename, a, b) for a, b in ranges]))) # Cheap next to parsing, and tells every range where its rows go.
+    parts: List[tuple] = []
+    before = 0
+    for (a, b), n in zip(ranges, counts):
+        first = (-before) % stepsize # Keeps the stepsize counting across ranges, like the blocks of _readColumns.
+        parts.append((_parseRange, (filename, a, b, usecols, stepsize, first), b - a, len(range(first, n, stepsize))))
+        before += n
+    hmprofile.count('rows in file', before)
+    return _parseShared(columns, usecols, parts, progress)
+
+def _readMemberColumns(filename: str, kind: str, members: np.ndarray, columns: Sequence[int], stepsize: int = 1, skiprows: int = 0, progress: Progress = None) -> List[np.ndarray]:
+    """Reads a compressed file of many members through the member index DecompressedFile made of
+    it. Members without a kept row are never decompressed, and the rest are parsed in runs of about
+    RANGE_BYTES of text, in the parse workers when PARSE_JOBS > 1.
+    """
+    usecols: List[int] = sorted(set(columns))
+    offsets, lengths, newlines, endsLine = members.T
+    lineStart = np.concatenate(([1], endsLine[:-1])) # Whether a member starts with a new line.
+    bounds = np.append(np.cumsum(newlines) - newlines + 1 - lineStart, newlines.sum() + 1 - endsLine[-1]) # Lines that start before each member, the last value is the number of lines.
+    rows = bounds[:-1] - skiprows # Data row of the first line that starts in each member, negative inside the header.
+    firsts = np.maximum(-rows, 0)
+    firsts += (-(rows + firsts)) % stepsize
+    needed = (firsts < np.diff(bounds)).tolist() # Members where at least one kept row starts.
+    lastNeeded = max([i for i, need in enumerate(needed) if need], default = -1)
+    cuts = np.append(offsets, os.path.getsize(filename)).tolist()
+    budget = max(min(RANGE_BYTES, int(lengths.sum()) // PARSE_JOBS), 1)
+    parts: List[tuple] = []
+    done = 0 # Compressed offset up to which the runs so far account for the file, skipped members included.
+    a = 0
+    while a < len(members):
+        if not needed[a]:
+            a += 1
+            continue
+        b, size = a, 0
+        while b < len(members) and needed[b] and (b == a or size + lengths[b] <= budget):
+            size += int(lengths[b])
+            b += 1
+        first = int(firsts[a]) # Line of the run the stepsize keeps first.
+        last = cuts[-1] if b > lastNeeded else cuts[b] # The last run accounts for the skipped members after it too.
+        parts.append((_parseMembers, (filename, kind, cuts[a], size, bool(lineStart[a]), usecols, stepsize, first), last - done, len(range(first, int(bounds[b] - bounds[a]), stepsize))))
+        done = last
+        a = b
+    hmprofile.count('rows in file', max(int(bounds[-1]) - skiprows, 0))
+    return _parseShared(columns, usecols, parts, progress)
+
+def _parseShared(columns: Sequence[int], usecols: List[int], parts: List[tuple], progress: Progress = None) -> List[np.ndarray]:
+    """Runs every part, (function, arguments, bytes, rows counted), with the output file, its shape
+    and the offset of the part's rows added to the arguments. Each part writes its rows into one
+    shared (len(usecols), rows) table, which becomes the returned columns without another copy.
+    The parts run in the parse workers when PARSE_JOBS > 1, one after the other here otherwise.
+    """
+    offsets = np.cumsum([0] + [rows for function, arguments, size, rows in parts]).tolist()
+    shape = (len(usecols), max(offsets[-1], 1)) # A memory map cannot be empty.
+    fd, out = tempfile.mkstemp(prefix = 'hmparse', suffix = '.f8', dir = '/dev/shm' if os.path.isdir('/dev/shm') else None) # tmpfs: shared memory the workers can open by name.
+    os.close(fd)
+    futures: dict = {}
+    try:
+        table = np.memmap(out, dtype = np.float64, mode = 'w+', shape = shape)
+        if PARSE_JOBS > 1:
+            pool = parsePool()
+            futures = {pool.submit(function, *arguments, out, shape, offset): i for i, ((function, arguments, size, rows), offset) in enumerate(zip(parts, offsets))}
+            finished = ((futures[future], future.result()) for future in as_completed(futures))
+        else:
+            finished = ((i, function(*arguments, out, shape, offset)) for i, ((function, arguments, size, rows), offset) in enumerate(zip(parts, offsets)))
+        parsed: List[int] = [0] * len(parts)
+        done = 0
+        try:
+            with hmprofile.stage('parse'):
+                for i, n in finished:
+                    parsed[i] = n
+                    done += parts[i][2]
+                    hmprofile.count('bytes read', parts[i][2])
+                    hmprofile.count('rows parsed', n)
+                    if progress:
+                        progress(done, sum(parsed))
+        except BaseException: # A cancelled or failed read leaves the parts not yet started alone.
+            for future in futures:
+                future.cancel()
+            raise
+    finally:
+        os.remove(out) # The pages stay mapped until the columns are freed, and are released with them.
+    if parsed != [rows for function, arguments, size, rows in parts]: # Blank lines left gaps, the parsed rows are moved together.
+        table = np.concatenate([table[:, offset:offset + n] for offset, n in zip(offsets, parsed)], axis = 1)
+    arrays = {col: np.asarray(table[k, :sum(parsed)]) for k, col in enumerate(usecols)} # Rows of the column-major table are contiguous already.
+    return [arrays[col] for col in columns]
@@ -0,0 +1,1035 @@
+#!/usr/bin/env python3
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+import re
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation
+from matplotlib.lines import Line2D
+from matplotlib.image import AxesImage
+from matplotlib.colors import ListedColormap, LogNorm
+import hmloader
+import hmprofile
+
+#Purpose: Graphing functions of Hypermongo, shared by the GUI and the command line.
+#Author: All rights reserved by Jacky Tran, jtran9148@gmail.com
+
+#------------------------------------------------------------------------------------------------#
+# Level-of-detail downsampling for line plots.                                                   #
+#                                                                                                #
+# A line with millions of points is reduced to a couple of points per pixel of the axes before  #
+# matplotlib ever sees it, either with a min/max envelope (every peak and dip is kept exactly)   #
+# or with Largest-Triangle-Three-Buckets (LTTB). The full resolution data is kept with the line  #
+# and the visible part is downsampled again every time the x-limits change from a zoom or pan.  #
+#                                                                                                #
+# grph, onePlot2D and threeDGrph live here so they can draw without PyQt5. With show=False they  #
+# only build and return the figure, ready for savefig on the non-interactive Agg backend.        #
+#                                                                                                #
+# SnapshotPlayer plays a numbered series (col0000.sph, col0001.sph, ...) as an animation in one  #
+# figure, updating the existing artists with set_data while a background thread parses the next #
+# few snapshots ahead of time. LiveView follows a file that is still being written and extends   #
+# its lines with the new rows on every poll. PlotSession draws every plot of a dialog into the    #
+# same window and only swaps the data when the layout stays the same.                            #
+#                                                                                                #
+# BlitCursor follows the mouse by blitting only the cursor over a copy of the drawn figure, so   #
+# it stays smooth with millions of points, and shows the nearest value in every subplot.         #
+#                                                                                                #
+# With density=True scatter plots become DensityImages: a log scaled count of the points in      #
+# every screen pixel, counted again from all points on every zoom or pan.                        #
+#                                                                                                #
+# compareGrph overlays the same columns of several runs, e.g. energy3.sph against energy7.sph or #
+# two simulation directories. alignRuns interpolates every run onto one common x grid first, so  #
+# runs that wrote their rows at different times can be compared point by point.                  #
+#                                                                                                #
+# grph takes any number of y columns: up to six are stacked like always, more are tiled in       #
+# columns of six (panelGrid), and more than PANELS_PER_PAGE are split into pages that PanelPager #
+# flips through with Page Up and Page Down without reading the file again.                       #
+#                                                                                                #
+# The graphing functions, trendline fits and data swaps are timed stages of hmprofile when       #
+# profiling is on, and pointsDrawn counts what the renderer was handed.                          #
+#------------------------------------------------------------------------------------------------#
+
+DOWNSAMPLE_METHODS = ('off', 'minmax', 'lttb') # Names accepted by the downsample argument of the graphing functions.
+
+class TrendlineError(ValueError): # Raised when a trendline polynomial cannot be fitted to the data.
+    pass
+
+def minMaxEnvelope(x: np.ndarray, y: np.ndarray, nBuckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Splits the points into nBuckets buckets of equal count and keeps the lowest and highest
+    y value of each bucket, in their original order. At most 2*nBuckets points are returned.
+    """
+    n = len(y)
+    if n <= 2 * nBuckets:
+        return np.asarray(x), np.asarray(y)
+    size = -(-n // nBuckets) # Ceiling division, so every point falls in a bucket.
+    nBuckets = -(-n // size)
+    padded = np.full(nBuckets * size, np.nan)
+    padded[:n] = y
+    buckets = padded.reshape(nBuckets, size)
+    filled = np.isfinite(buckets) # Padding and NaN values never win a bucket.
+    low = np.where(filled, buckets, np.inf).argmin(axis=1)
+    high = np.where(filled, buckets, -np.inf).argmax(axis=1)
+    first = np.minimum(low, high) + np.arange(nBuckets) * size # Each pair is kept in x order so the line does not double back.
+    second = np.maximum(low, high) + np.arange(nBuckets) * size
+    index = np.column_stack((first, second)).ravel()
+    index = index[np.concatenate(([True], np.diff(index) != 0))] # Buckets where the min and max are the same point only keep it once.
+    index = index[index < n]
+    return np.asarray(x)[index], np.asarray(y)[index]
+
+def lttb(x: np.ndarray, y: np.ndarray, nOut: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets: keeps the first and last point and, from each of the
+    nOut-2 buckets in between, the point forming the largest triangle with the point kept
+    from the previous bucket and the average of the next bucket.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if nOut >= n or nOut < 3:
+        return x, y
+    edges = np.linspace(1, n - 1, nOut - 1).astype(np.int64) # Bucket boundaries of the points between the first and the last one.
+    keep = np.empty(nOut, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    previous = 0
+    for i in range(nOut - 2):
+        start, stop = edges[i], max(edges[i+1], edges[i] + 1)
+        if i + 2 < len(edges): # Average point of the next bucket.
+            nextX, nextY = x[edges[i+1]:edges[i+2]].mean(), y[edges[i+1]:edges[i+2]].mean()
+        else:
+            nextX, nextY = x[-1], y[-1]
+        area = np.abs((x[previous] - nextX) * (y[start:stop] - y[previous]) - (x[previous] - x[start:stop]) * (nextY - y[previous]))
+        previous = start + int(np.nanargmax(area)) if np.isfinite(area).any() else start
+        keep[i+1] = previous
+    return x[keep], y[keep]
+
+def downsample(x: np.ndarray, y: np.ndarray, nPoints: int, method: str = 'minmax') -> Tuple[np.ndarray, np.ndarray]:
+    """Reduces a series to roughly nPoints points with the named method ('off', 'minmax' or 'lttb')."""
+    if method == 'lttb':
+        return lttb(x, y, nPoints)
+    if method == 'minmax':
+        return minMaxEnvelope(x, y, max(nPoints // 2, 1))
+    return np.asarray(x), np.asarray(y)
+
+class LODLine(object): # Line that is redrawn from downsampled full resolution data every time its axes are zoomed or panned.
+    """Keeps the full resolution data of a Line2D and hands it a downsampled copy of the
+    visible x range, about pointsPerPixel points per pixel of the axes' width.
+    """
+
+    def __init__(self, ax, line, x, y, method: str = 'minmax', pointsPerPixel: int = 2):
+        self.ax = ax
+        self.line = line
+        self.x: np.ndarray = np.asarray(x)
+        self.y: np.ndarray = np.asarray(y)
+        self.method: str = method
+        self.pointsPerPixel: int = pointsPerPixel
+        self.sorted: bool = isSorted(self.x) # Sorted x lets the visible range be found by binary search.
+        line.lod = self # The line keeps this object alive, matplotlib only holds weak references to callbacks.
+        ax.callbacks.connect('xlim_changed', self.update)
+        self.update(ax)
+
+    def update(self, ax=None): # Called by matplotlib whenever the x-limits change.
+        low, high = self.ax.get_xlim()
+        if low > high:
+            low, high = high, low
+        if self.sorted:
+            first = max(np.searchsorted(self.x, low, side='left') - 1, 0) # One point past each edge keeps the line running off the plot.
+            last = min(np.searchsorted(self.x, high, side='right') + 1, len(self.x))
+            x, y = self.x[first:last], self.y[first:last]
+        else:
+            visible = (self.x >= low) & (self.x <= high)
+            x, y = self.x[visible], self.y[visible]
+        self.line.set_data(*downsample(x, y, pointBudget(self.ax, self.pointsPerPixel), self.method))
+
+    def setData(self, x, y): # Swaps in a new full resolution series, i.e. the next snapshot of an animation.
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.sorted = isSorted(self.x)
+        self.line.set_data(*minMaxEnvelope(self.x, self.y, pointBudget(self.ax, self.pointsPerPixel) // 2)) # Whole range, so autoscaling sees every extreme before the next zoom redraws it.
+
+def isSorted(x: np.ndarray) -> bool: # True when x never decreases.
+    return bool(len(x) < 2 or np.all(x[1:] >= x[:-1]))
+
+def pointBudget(ax, pointsPerPixel: int = 2) -> int: # Number of points worth drawing across the width of an axes.
+    return max(int(ax.get_window_extent().width), 100) * pointsPerPixel
+
+def plotLOD(ax, x, y, *args, downsample: str = 'minmax', **kwargs):
+    """Drop-in replacement for ax.plot(x, y, ...) that downsamples long series to the
+    resolution of the axes. Returns the Line2D like ax.plot does.
+    """
+    budget = pointBudget(ax)
+    if downsample == 'off' or len(y) <= 2 * budget: # Short series are not worth the callback.
+        return ax.plot(x, y, *args, **kwargs)[0]
+    line = ax.plot(*minMaxEnvelope(x, y, budget // 2), *args, **kwargs)[0] # The envelope keeps the extremes, so autoscaling sees the full y range.
+    LODLine(ax, line, x, y, downsample)
+    return line
+
+DENSITY_CMAPS = ('Blues', 'Oranges', 'Greens', 'Reds', 'Purples', 'Greys') # One per y column, close to matplotlib's color cycle C0, C1, ...
+
+class DensityImage(AxesImage): # Scatter plot drawn as a 2-D histogram of the points at the resolution of the screen.
+    """Counts the points that fall in every pixel of the visible part of the axes and shows the
+    counts with a log color scale. Pixels without points stay transparent. The counting is done
+    again from the full data whenever the view changes, so zooming in reveals the detail of the
+    region instead of blowing up the pixels, and drawing costs one pass over the points instead
+    of one matplotlib marker per point.
+    """
+
+    def __init__(self, ax, x, y, cmap: str = 'Blues', label: str = '', pixelsPerBin: int = 1, **kwargs):
+        full = plt.get_cmap(cmap)
+        cmap = ListedColormap(full(np.linspace(0.35, 1, 256)), name = cmap) # The palest colors would vanish on the white background.
+        super().__init__(ax, cmap = cmap, norm = LogNorm(), origin = 'lower', interpolation = 'nearest', **kwargs)
+        self.pixelsPerBin: int = pixelsPerBin
+        self.view = None # Extent of the view while drawing, get_extent gives the extent of the data otherwise.
+        self._binned = None # (view, shape, data) of the last counts, so redraws without a zoom reuse them.
+        self.proxy = ax.plot([], [], 's', color = full(0.7), label = label, gid = 'legend')[0] # Legends skip images, so an empty line stands in.
+        self.set_label(label)
+        ax.add_image(self)
+        self.setData(x, y)
+
+    def setData(self, x, y): # Swaps in new points, i.e. the next snapshot of an animation.
+        x, y = np.asarray(x, dtype = float), np.asarray(y, dtype = float)
+        finite = np.isfinite(x) & np.isfinite(y)
+        if not finite.all():
+            x, y = x[finite], y[finite]
+        self.x, self.y = x, y
+        self.bounds = [x.min(), x.max(), y.min(), y.max()] if len(x) else [0.0, 1.0, 0.0, 1.0]
+        self.set_data(np.ma.masked_all((1, 1))) # Placeholder until the next draw counts the points.
+        self._binned = None
+        self.axes.update_datalim([(self.bounds[0], self.bounds[2]), (self.bounds[1], self.bounds[3])])
+
+    def set_label(self, s): # Keeps the legend entry in step when a PlotSession renames the column.
+        super().set_label(s)
+        if getattr(self, 'proxy', None) is not None:
+            self.proxy.set_label(s)
+
+    def get_extent(self):
+        return self.view if self.view is not None else self.bounds
+
+    def counts(self, view, nx: int, ny: int) -> np.ndarray: # Number of points in each of ny x nx bins covering view, NaN-free.
+        x0, x1, y0, y1 = view
+        ix = np.floor((self.x - x0) * (nx / (x1 - x0))).astype(np.int64)
+        iy = np.floor((self.y - y0) * (ny / (y1 - y0))).astype(np.int64)
+        inside = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+        return np.bincount(iy[inside] * nx + ix[inside], minlength = nx * ny).reshape(ny, nx)
+
+    def make_image(self, renderer, magnification = 1.0, unsampled = False): # Counts the points of the current view before matplotlib resamples the image.
+        (x0, x1), (y0, y1) = self.axes.get_xlim(), self.axes.get_ylim()
+        self.view = [x0, x1, y0, y1]
+        box = self.axes.get_window_extent()
+        shape = (max(int(box.height * magnification) // self.pixelsPerBin, 1), max(int(box.width * magnification) // self.pixelsPerBin, 1))
+        key = (tuple(self.view), shape, id(self.x))
+        if self._binned != key and x1 != x0 and y1 != y0:
+            counts = self.counts((min(x0, x1), max(x0, x1), min(y0, y1), max(y0, y1)), shape[1], shape[0])
+            if x1 < x0: # Inverted axes.
+                counts = counts[:, ::-1]
+            if y1 < y0:
+                counts = counts[::-1, :]
+            with self.norm.callbacks.blocked(), self.callbacks.blocked(): # Rescaling the colors must not mark the figure for another draw.
+                self._A = np.ma.masked_less(counts, 1) # Empty bins stay transparent.
+                self._imcache = None
+                self.norm.vmin, self.norm.vmax = 1, max(int(counts.max()), 1)
+            self._binned = key
+        try:
+            return super().make_image(renderer, magnification, unsampled)
+        finally:
+            self.view = None
+
+def plotScatter(ax, x, y, scatsize: int = 1, label: str = '', density: bool = False, index: int = 0, **kwargs):
+    """Scatter plot of y over x in ax, as points or as a DensityImage in the index-th colormap
+    of DENSITY_CMAPS when density is True. Returns the artist.
+    """
+    if density:
+        return DensityImage(ax, x, y, cmap = DENSITY_CMAPS[index % len(DENSITY_CMAPS)], label = label, **kwargs)
+    return ax.scatter(x, y, s = scatsize, label = label, **kwargs)
+
+def subscriptName(ylabel: List[str], numCol: int) -> List[str]: #Changes the names of yplots to add subscripts if it contains a number. Returns new list with subcripted names.
+    """This function takes a string and changes it to add a subscript
+    for the massAndMore.out file, only if it contains a number. i.e m1 or x2...
+    """
+    for i in range(0, numCol):
+        if any(i.isdigit() for i in ylabel[i]) == True:
+            changeName: List[str] = re.split(r"(\d+)", ylabel[i]) #the re.split splits a string if a number is found.
+            if len(changeName) == 3:
+                ylabel[i] = "$" + changeName[0] +"_{" + changeName[1] + "}$" + changeName[2]
+            else:
+                ylabel[i] = "$" + changeName[0] +"_{" + changeName[1] + "}$"
+    return ylabel 
+
+class Trendline(object): # A fitted polynomial: callable on x, with its coefficients and residuals.
+    """Legendre series on the x-domain scaled onto [-1, 1], the form np.polynomial.Polynomial.fit
+    uses. coefficients gives the ordinary power series, highest power first like np.polyfit.
+    """
+
+    def __init__(self, legendre: np.ndarray, domain: Tuple[float, float], rss: float, count: int, name: str = ''):
+        self.series = np.polynomial.Legendre(legendre, domain = domain)
+        self.degree: int = len(legendre) - 1
+        self.rss: float = rss # Sum of the squared residuals.
+        self.count: int = count # Number of points fitted.
+        self.name: str = name
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        return self.series(np.asarray(x, dtype = float))
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        return self.series.convert(kind = np.polynomial.Polynomial, domain = self.series.window).coef[::-1] # Unscaled, in powers of x.
+
+    @property
+    def rms(self) -> float: # Root mean square of the residuals.
+        return float(np.sqrt(self.rss / self.count)) if self.count else 0.0
+
+    @property
+    def label(self) -> str: # Legend text: the equation y= mx + b for linear regressions, 'Degree n' otherwise, and the rms of the residuals.
+        if self.degree == 1:
+            m, b = self.coefficients
+            return f'y= {format(m, ".4g")}x + {format(b, ".4g")}, rms {format(self.rms, ".3g")}' # .4g rounds to 4 significant figures and stays in either exponential or regular form.
+        return f'Degree {self.degree}, rms {format(self.rms, ".3g")}'
+
+    def describe(self) -> str: # One line with every coefficient, for printing.
+        terms = ' '.join(format(c, '+.6g') for c in self.coefficients)
+        return f'{self.name}: degree {self.degree} coefficients (highest power first) {terms}, rms residual {self.rms:.6g} over {self.count} points'
+
+class PolyFit(object): # Least squares polynomials of several y columns over one x column, built up a block of rows at a time.
+    """Accumulates the normal equations of a Legendre series on domain, which add() maps onto
+    [-1, 1]. Legendre polynomials are close to orthogonal there, so the equations stay well
+    conditioned even at degree 30, while the design matrix only ever exists for one block of
+    rows. Each y column keeps its own matrix, since a NaN in one column only takes that row out
+    of its own fit, but columns with the same finite rows share the work of building it. fit()
+    can solve any degree up to the one accumulated without another pass over the data.
+    """
+
+    def __init__(self, degree: int, domain: Tuple[float, float], nColumns: int):
+        self.degree: int = degree
+        low, high = float(domain[0]), float(domain[1])
+        self.domain: Tuple[float, float] = (low, high) if high > low else (low - 0.5, low + 0.5) # A single x value still needs a width.
+        self.gram = np.zeros((nColumns, degree + 1, degree + 1)) # Sum of P_i(x) P_j(x) over the rows of each column.
+        self.moments = np.zeros((degree + 1, nColumns)) # Sum of P_i(x) (y - shift).
+        self.squares = np.zeros(nColumns) # Sum of (y - shift)^2.
+        self.shift = np.full(nColumns, np.nan) # y values are taken relative to the mean of their first finite block, so the residuals do not drown in a large offset.
+        self.count = np.zeros(nColumns, dtype = np.int64)
+
+    def add(self, x: np.ndarray, ys: Sequence[np.ndarray]): # Adds a block of rows. A NaN or inf in x leaves the row out of every fit, one in y only out of that column's fit.
+        x = np.asarray(x, dtype = float)
+        y = np.column_stack([np.asarray(column, dtype = float) for column in ys])
+        finite = np.isfinite(y) & np.isfinite(x)[:, None]
+        counts = finite.sum(axis = 0)
+        first = np.isnan(self.shift) & (counts > 0)
+        if first.any():
+            self.shift[first] = np.where(finite, y, 0.0)[:, first].sum(axis = 0) / counts[first]
+        y = np.where(finite, y - np.nan_to_num(self.shift), 0.0) # Left out values add nothing to the moments or squares.
+        low, high = self.domain
+        t = (2 * np.where(np.isfinite(x), x, low) - (low + high)) / (high - low)
+        if (finite == finite[:, :1]).all(): # Usually every column has the same finite rows.
+            masks, groups = finite[:, :1], np.zeros(finite.shape[1], dtype = int)
+        else:
+            masks, groups = np.unique(finite, axis = 1, return_inverse = True)
+            groups = groups.reshape(-1)
+        for g in range(masks.shape[1]):
+            mask, columns = masks[:, g], np.flatnonzero(groups == g)
+            if not mask.any():
+                continue
+            A = np.polynomial.legendre.legvander(t[mask], self.degree)
+            self.gram[columns] += A.T @ A
+            self.moments[:, columns] += A.T @ y[mask][:, columns]
+        self.squares += np.einsum('ij,ij->j', y, y)
+        self.count += counts
+
+    def fit(self, degree: Optional[int] = None, names: Sequence[str] = ()) -> List[Trendline]: # One Trendline per y column.
+        n = (self.degree if degree is None else degree) + 1
+        few = np.flatnonzero(self.count < n)
+        if len(few):
+            raise np.linalg.LinAlgError(f'{self.count[few[0]]} points cannot fix a degree {n - 1} polynomial')
+        fits = []
+        for j in range(self.moments.shape[1]):
+            gram, moments = self.gram[j, :n, :n], self.moments[:n, j]
+            scale = 1 / np.sqrt(np.diag(gram)) # Equal weight for every basis function before solving.
+            legendre = np.linalg.lstsq(gram * np.outer(scale, scale), moments * scale, rcond = None)[0] * scale
+            rss = max(self.squares[j] - legendre @ moments, 0.0) # |y|^2 - c.A'y is the residual at the least squares solution.
+            legendre[0] += self.shift[j] # P_0 is 1, so the shift goes back into the constant.
+            fits.append(Trendline(legendre, self.domain, float(rss), int(self.count[j]), names[j] if j < len(names) else ''))
+        return fits
+
+FIT_BLOCK_ROWS: int = 1 << 16 # Rows per block of PolyFit.add, keeps the design matrix of a degree 30 fit at 16 MB.
+
+@hmprofile.timed('fit')
+def fitTrendlines(x: np.ndarray, ys: Sequence[np.ndarray], polyDeg: int, names: Sequence[str] = ()) -> List[Trendline]: # Polynomial trendlines of several columns in one pass.
+    """Fits a polynomial of degree polyDeg to every y(x) of ys with one PolyFit pass over the rows."""
+    x = np.asarray(x, dtype = float)
+    finite = x[np.isfinite(x)]
+    if len(finite) == 0: # Nothing to fit, an empty or all NaN x column.
+        raise TrendlineError(f'Could not fit a degree {polyDeg} polynomial to {", ".join(names) or "the data"}: no finite x values')
+    fitter = PolyFit(polyDeg, (finite.min(), finite.max()), len(ys))
+    for start in range(0, len(x), FIT_BLOCK_ROWS):
+        fitter.add(x[start:start + FIT_BLOCK_ROWS], [y[start:start + FIT_BLOCK_ROWS] for y in ys])
+    try:
+        return fitter.fit(names = names)
+    except np.linalg.LinAlgError as error: # Too few points for the degree, or a singular system. Anything else is a bug and is raised as it is.
+        raise TrendlineError(f'Could not fit a degree {polyDeg} polynomial to {", ".join(names) or "the data"}') from error
+
+def nearestIndex(x: np.ndarray, value: float) -> int: # Index of the value of a sorted array closest to value, -1 for an empty array.
+    if len(x) == 0:
+        return -1
+    i = int(np.searchsorted(x, value))
+    if i == len(x) or (i > 0 and value - x[i-1] <= x[i] - value): # NaN values sort to the end and never win.
+        i -= 1
+    return i
+
+class BlitCursor(object): # Vertical cursor across several axes with a readout of the nearest data point in each.
+    """Replacement for matplotlib's MultiCursor that never redraws the data. The figure is
+    copied after every full draw, and on mouse motion only the cursor line, the crosshair, the
+    markers on the nearest points and the readouts are drawn over that copy and blitted, so the
+    cost of following the mouse does not grow with the number of points. The nearest point is
+    found by binary search on the full resolution x data of every 'data' artist. Text is slow to
+    render, so the readouts are redrawn at most every TEXT_MS and kept in a second copy between.
+    """
+
+    TEXT_MS: int = 100 # Shortest time between two renderings of the readouts, the cursor line itself follows every mouse event.
+
+    def __init__(self, fig, axes: Sequence, color: str = 'r', lw: float = 1):
+        self.fig = fig
+        self.canvas = fig.canvas
+        self.axes: list = list(axes)
+        self.color: str = color
+        self.background = None # Copy of the figure without the cursor, taken after every full draw.
+        self.overlay = None # Copy of the background with the readouts of the last rendering.
+        self.textTime: float = 0.0 # perf_counter of the last rendering of the readouts.
+        self.sources: Optional[list] = None # Per axes: (label, sorted x, y, marker) of every data artist, rebuilt after every full draw.
+        self.cache: Dict[int, tuple] = {} # Sorted data by artist, reused until the artist gets new data.
+        self.last = None # (axes, x, y) of the last mouse position, to redraw the cursor after a full draw.
+        # The cursor artists are not added to the axes, so autoscaling, legends and figureArtists never see them.
+        self.vlines = [self._artist(Line2D([0, 0], [0, 1], color = color, lw = lw, transform = ax.get_xaxis_transform()), ax) for ax in self.axes]
+        self.hlines = [self._artist(Line2D([0, 1], [0, 0], color = color, lw = lw, ls = ':', transform = ax.get_yaxis_transform()), ax) for ax in self.axes]
+        self.readouts = [self._artist(plt.Text(0.01, 0.97, '', transform = ax.transAxes, va = 'top', fontsize = 11,
+                         bbox = dict(facecolor = 'white', alpha = 0.8, edgecolor = 'none')), ax) for ax in self.axes]
+        self.timer = self.canvas.new_timer(interval = self.TEXT_MS) # Renders the readouts of the final position once the mouse stops.
+        self.timer.single_shot = True
+        self.timer.add_callback(self.refreshText)
+        self.cids = [self.canvas.mpl_connect('draw_event', self.onDraw),
+                     self.canvas.mpl_connect('motion_notify_event', self.onMove),
+                     self.canvas.mpl_connect('figure_leave_event', self.onLeave)]
+
+    def _artist(self, artist, ax):
+        artist.set_figure(self.fig)
+        artist.set_clip_box(ax.bbox)
+        return artist
+
+    def findSources(self) -> list: # The full resolution data of every data artist, sorted by x for the binary search.
+        sources = []
+        for ax in self.axes:
+            found = []
+            for artist in ax.lines + ax.collections + ax.images:
+                if artist.get_gid() != 'data':
+                    continue
+                lod = getattr(artist, 'lod', None)
+                if lod is not None:
+                    x, y = lod.x, lod.y
+                elif isinstance(artist, DensityImage):
+                    x, y = artist.x, artist.y
+                elif isinstance(artist, Line2D):
+                    x, y = artist.get_xdata(orig = True), artist.get_ydata(orig = True)
+                else: # Scatter points.
+                    offsets = artist.get_offsets()
+                    x, y = offsets[:, 0], offsets[:, 1]
+                key = (id(x), id(y), len(x))
+                if self.cache.get(id(artist), (None,))[0] != key: # Sorting a few million unsorted points takes a while, so it is only done for new data.
+                    x, y = np.asarray(x, dtype = float), np.asarray(y, dtype = float)
+                    if not (lod.sorted if lod is not None else isSorted(x)):
+                        order = np.argsort(x, kind = 'stable')
+                        x, y = x[order], y[order]
+                    marker = self._artist(Line2D([], [], color = self.color, marker = 'o', mfc = 'none', ls = '', transform = ax.transData), ax)
+                    self.cache[id(artist)] = (key, x, y, marker)
+                key, x, y, marker = self.cache[id(artist)]
+                found.append((artist.get_label(), x, y, marker))
+            sources.append(found)
+        return sources
+
+    def onDraw(self, event): # A full draw: zoom, pan, resize or new data.
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.overlay = None
+        self.sources = None
+        if self.last is not None:
+            self.drawCursor(*self.last)
+
+    def onMove(self, event):
+        if self.canvas.widgetlock.locked(): # The zoom or pan tool is in use.
+            return
+        if event.inaxes not in self.axes:
+            self.onLeave(event)
+            return
+        self.drawCursor(event.inaxes, event.xdata, event.ydata)
+
+    def onLeave(self, event=None): # Takes the cursor off the figure.
+        if self.last is not None and self.background is not None:
+            self.last = None
+            self.overlay = None
+            self.timer.stop()
+            self.canvas.restore_region(self.background)
+            self.canvas.blit(self.fig.bbox)
+
+    def refreshText(self): # Timer callback.
+        if self.last is not None:
+            self.drawCursor(*self.last, text = True)
+
+    def drawCursor(self, inaxes, x: float, y: float, text: bool = False):
+        if self.background is None: # Nothing was drawn yet.
+            return
+        if self.sources is None:
+            self.sources = self.findSources()
+        self.last = (inaxes, x, y)
+        text = text or self.overlay is None or time.perf_counter() - self.textTime >= self.TEXT_MS / 1000
+        nearest = [[(xs, ys, nearestIndex(xs, x), label, marker) for label, xs, ys, marker in found] for found in self.sources]
+        if text:
+            self.canvas.restore_region(self.background)
+            for ax, readout, points in zip(self.axes, self.readouts, nearest):
+                lines = [f'{label} = {ys[i]:.6g}' for xs, ys, i, label, marker in points if i >= 0]
+                if ax is inaxes and lines: # The x of the nearest point only shows where the mouse is.
+                    xs, ys, i = next((xs, ys, i) for xs, ys, i, label, marker in points if i >= 0)
+                    lines.append(f'x = {xs[i]:.6g}')
+                if lines:
+                    readout.set_text('\n'.join(lines))
+                    ax.draw_artist(readout)
+            self.overlay = self.canvas.copy_from_bbox(self.fig.bbox)
+            self.textTime = time.perf_counter()
+            self.timer.stop()
+        else:
+            self.canvas.restore_region(self.overlay)
+            self.timer.start() # Restarted on every move, so it only fires once the mouse rests.
+        for ax, vline, hline, points in zip(self.axes, self.vlines, self.hlines, nearest):
+            vline.set_xdata([x, x])
+            ax.draw_artist(vline)
+            if ax is inaxes: # The horizontal half of the crosshair only shows where the mouse is.
+                hline.set_ydata([y, y])
+                ax.draw_artist(hline)
+            for xs, ys, i, label, marker in points:
+                if i >= 0:
+                    marker.set_data([xs[i]], [ys[i]])
+                    ax.draw_artist(marker)
+        self.canvas.blit(self.fig.bbox)
+
+    def disconnect(self): # Stops following the mouse, i.e. before the figure is cleared.
+        for cid in self.cids:
+            self.canvas.mpl_disconnect(cid)
+        self.cids = []
+        self.cache = {}
+        self.timer.stop()
+
+def reuseFigure(fig, figsize: Tuple[float, float]): # Clears an open figure so a graphing function can draw into the same window again.
+    plt.figure(fig.number) # Makes it the current figure for the plt.subplot calls that follow.
+    if getattr(fig, 'pager', None) is not None: # A new plot replaces every page.
+        fig.pager.disconnect()
+        fig.pager = None
+    if getattr(fig, 'multi', None) is not None: # The old cursor still listens to the mouse on the removed axes.
+        fig.multi.disconnect()
+        fig.multi = None
+    fig.clf()
+    fig.set_size_inches(figsize)
+    return fig
+
+#-------------------------------------------------------------------------------#
+
+PANEL_ROWS: int = 6 # Panels stacked in one column of a grph figure before a second column is started.
+PANELS_PER_PAGE: int = int(os.environ.get('HYPERMONGO_PANELS', 24)) # grph figures with more y columns than this are split into pages.
+
+def panelGrid(numCol: int) -> Tuple[int, int]: # Rows and columns of panels for numCol subplots: one column of up to PANEL_ROWS like always, tiled side by side after that.
+    cols = -(-numCol // PANEL_ROWS)
+    return -(-numCol // cols), cols
+
+@hmprofile.timed('figure')
+def grph(labels, yplot, file, numCol, share_ax: bool = False, is_scatter: bool = False, scatsize: int = 1, is_trendline: bool = False, polyDeg: int = 1, legend: bool = False, downsample: str = 'off', show: bool = True, fig = None, density: bool = False): #Takes list of y axis labels, values from data file, file name, number of columns selected, and whether shared axis is selected. Creates and shows plot, or only returns the figure when show is False.
+    """Universal graphing function for both data files. Takes labels and data from
+       respective functions creates one data versus time plot per y column. Up to six are
+       stacked, more are tiled side by side, and more than PANELS_PER_PAGE go on pages (PanelPager).
+    """
+    if numCol > PANELS_PER_PAGE: # Too many panels to read on one screen.
+        return PanelPager(labels, yplot, file, numCol, dict(share_ax = share_ax, is_scatter = is_scatter, scatsize = scatsize, is_trendline = is_trendline, polyDeg = polyDeg, legend = legend, downsample = downsample, density = density), show = show, fig = fig).fig
+    if show: # Interactive mode redraws after every pyplot call, which only pays off in a window.
+        plt.ion()
+    fig = plt.figure(figsize=(12,9)) if fig is None else reuseFigure(fig, (12,9)) # A PlotSession hands in its window to be drawn again.
+    plt.style.use('default')
+    plt.rcParams['axes.linewidth'] = 1.5
+    fig.canvas.manager.set_window_title("HM: " + str(file)) # Changes the plot title for the plot window itself.
+    fits = fitTrendlines(yplot[0], yplot[1:numCol+1], polyDeg, labels[1:numCol+1]) if is_trendline else [] # One pass over the rows fits every column.
+    rows, cols = panelGrid(numCol)
+    fontsize = 16 if cols == 1 else 12 # Tiled panels are narrower.
+    newline = '\n' if cols == 1 else '' # The stacked layout keeps its labels clear of the numbers with an empty line, tiles have no room for it.
+    ax_list = []
+    for i in range(numCol):
+        ax = plt.subplot(rows, cols, (i % rows) * cols + i // rows + 1, sharex = ax_list[0] if ax_list else None) # Panels fill a column top to bottom before the next one, so each column reads like the stacked layout.
+        bottom = i % rows == rows - 1 or i == numCol - 1 # Lowest panel of its column.
+        if is_scatter:
+            plotScatter(ax, yplot[0], yplot[i+1], scatsize, f'{labels[i+1]}', density, i, gid = 'data') # Sets up scatter plot with point size 's', or a density image of the points
+        else:
+            plotLOD(ax, yplot[0], yplot[i+1], label = f'{labels[i+1]}', downsample = downsample, gid = 'data') # Sets up line plot, downsampled to the screen resolution when asked to
+        if is_trendline: # Adds trendline to the subplot when true
+            plotLOD(ax, yplot[0], fits[i](yplot[0]), "r--", label = fits[i].label, downsample = downsample, gid = 'trendline').fit = fits[i] # plots trendline to the subplot, with a linear equation as label for degree 1.
+        if legend: # Creates legend for the subplot
+            ax.legend(loc='upper right')
+        ax.set_ylabel(labels[i+1]+newline, fontsize = fontsize)
+        ax.yaxis.get_offset_text().set_x(1.005) # This changes the location of the exponential multiplier (if it exists) to the top-right of the subplot.
+        ax.grid(True, which = 'both')
+        if share_ax and not bottom:
+            plt.setp(ax.get_xticklabels(), visible = False) # turns off numbered x-labels for all but the lowest subplot of each column if share_ax is true.
+        if cols > 1:
+            ax.tick_params(labelsize = 8) # Numbers that fit on narrow panels.
+        if bottom:
+            ax.set_xlabel(labels[0], fontsize = fontsize) # Labels the x-axis with respect to entry in the first column and first row of the file
+        ax_list.append(ax)
+    if share_ax: # This adjusts the space in between the subplots to 0 if share_ax is true, otherwise the minimum distance is 0.20.
+        plt.subplots_adjust(hspace = 0)
+    else:
+        plt.subplots_adjust(hspace = 0.20)
+    plt.subplots_adjust(top = 0.97, wspace = 0.45) # Adjustments to the placement of the subplots to better utilize the whitespace
+    plt.subplots_adjust(bottom = 0.07)
+    if show:
+        fig.multi = BlitCursor(fig, ax_list, color = 'r', lw = 1) # Red line on all subplots with the mouse and the nearest value of each. Kept on the figure so it is not garbage collected.
+        plt.show()
+    return fig
+
+class PanelPager(object): # grph figure of more y columns than fit on a page, flipped through with Page Up and Page Down.
+    """Draws PANELS_PER_PAGE columns of yplot at a time into one window with grph. The parsed
+    columns stay in memory, so turning a page only draws, and pages with as many panels as
+    the one on screen only swap the data of the existing artists (PlotSession). options are
+    grph's keyword arguments. setData hands in new columns for every page, i.e. from LiveView.
+    """
+
+    def __init__(self, labels, yplot, file, numCol: int, options: dict, show: bool = True, fig = None, perPage: int = 0):
+        self.labels = labels
+        self.yplot = yplot
+        self.file = file
+        self.numCol: int = numCol
+        self.options: dict = options
+        self.show: bool = show
+        self.perPage: int = perPage or PANELS_PER_PAGE
+        self.pages: int = -(-numCol // self.perPage)
+        self.page: int = 0
+        self.session = PlotSession()
+        self.session.fig = fig # Page 1 is drawn into the window handed in, if any.
+        self.text = None
+        self.showPage(0)
+        self.cid = self.fig.canvas.mpl_connect('key_press_event', self.onKey)
+
+    @property
+    def fig(self):
+        return self.session.fig
+
+    def columns(self, page: int) -> range: # Indices into yplot of the y columns on a page.
+        return range(1 + page * self.perPage, 1 + min((page + 1) * self.perPage, self.numCol))
+
+    def showPage(self, page: int):
+        self.page = page % self.pages
+        shown = self.columns(self.page)
+        if getattr(self.fig, 'pager', None) is self:
+            self.fig.pager = None # Keeps reuseFigure from disconnecting the pager that is drawing.
+        self.session.plot2D([self.labels[0]] + [self.labels[i] for i in shown], [self.yplot[0]] + [self.yplot[i] for i in shown], f"{self.file} (page {self.page+1} of {self.pages})",
+                            len(shown), show = self.show, **self.options)
+        self.fig.pager = self # The figure keeps the pager alive.
+        if self.text is None or self.text not in self.fig.texts: # A redrawn figure lost the old text.
+            self.text = self.fig.text(0.99, 0.995, '', va = 'top', ha = 'right', fontsize = 10)
+        self.text.set_text(f"Page {self.page+1} of {self.pages} (columns {shown[0]}-{shown[-1]} of {self.numCol}), Page Up / Page Down")
+        if self.show:
+            self.fig.canvas.draw_idle()
+
+    def setData(self, yplot): # New columns for every page, the page on screen is updated in place.
+        self.yplot = yplot
+        shown = self.columns(self.page)
+        updateArtists(figureArtists(self.fig), yplot[0], [yplot[i] for i in shown], self.options.get('downsample', 'off'))
+
+    def onKey(self, event):
+        if event.key in ('pagedown', 'pageup') and self.pages > 1:
+            self.showPage(self.page + (1 if event.key == 'pagedown' else -1))
+
+    def disconnect(self): # Stops turning pages, i.e. before the figure is used for another plot.
+        self.fig.canvas.mpl_disconnect(self.cid)
+
+@hmprofile.timed('figure')
+def onePlot2D(labels, yplot, file, numCol, share_ax: bool = False, is_scatter: bool = False, scatsize: int = 1, is_trendline: bool = False, polyDeg: int = 1, legend: bool = False, downsample: str = 'off', show: bool = True, fig = None, density: bool = False): # Condenses all chosen y-columns into one plot
+    if show: # Interactive mode redraws after every pyplot call, which only pays off in a window.
+        plt.ion()
+    fig = plt.figure(figsize=(12,9)) if fig is None else reuseFigure(fig, (12,9)) # A PlotSession hands in its window to be drawn again.
+    plt.style.use('default')
+    plt.rcParams['axes.linewidth'] = 1.5
+    fig.canvas.manager.set_window_title("HM: " + str(file)) # Changes the plot title for the plot window itself.
+    #ax = plt.plot()
+    fits = fitTrendlines(yplot[0], yplot[1:numCol+1], polyDeg, labels[1:numCol+1]) if is_trendline else [] # One pass over the rows fits every column.
+    if is_scatter:
+        plotScatter(plt.gca(), yplot[0], yplot[1], scatsize, f'{labels[1]}', density, 0, gid = 'data') # sets up first subplot as a scatter plot, or a density image of the points
+    else:
+        plotLOD(plt.gca(), yplot[0], yplot[1], label = f'{labels[1]}', downsample = downsample, gid = 'data') # Sets up first subplot as a line plot
+    if is_trendline: # Adds trendline to first subplot when true
+        plotLOD(plt.gca(), yplot[0], fits[0](yplot[0]), "r--", label = fits[0].label, downsample = downsample, gid = 'trendline').fit = fits[0] # plots trendline to the subplot, with a linear equation as label for degree 1.
+    
+    #plt.set_ylabel(labels[1]+'\n', fontsize = 16)
+    
+    plt.grid(True, which = 'both')
+    for i in range(1, numCol):
+        if is_scatter:
+            plotScatter(plt.gca(), yplot[0], yplot[i+1], scatsize, f'{labels[i+1]}', density, i, gid = 'data') # Sets up scatter plot with point size 's', each density image in its own colors
+        else:
+            plotLOD(plt.gca(), yplot[0], yplot[i+1], label = f'{labels[i+1]}', downsample = downsample, gid = 'data')# Sets up line plot
+        if is_trendline: # Adds trendline to other subplots when true
+            plotLOD(plt.gca(), yplot[0], fits[i](yplot[0]), "r--", label = fits[i].label, downsample = downsample, gid = 'trendline').fit = fits[i] # plots trendline to the subplot
+        #ax1.set_ylabel(labels[i+1]+'\n', fontsize = 16)
+        plt.grid(True, which = 'both')
+        #plt.yaxis.get_offset_text().set_x(1.005) # This changes the location of the exponential multiplier (if it exists) to the top-right of the subplot.
+    plt.xlabel(labels[0], fontsize = 16) # Labels the x-axis with respect to entry in the first column and first row of the file
+    if legend: # Creates legend for first subplot
+        plt.legend(loc='upper right') 
+    if share_ax: # This adjusts the space in between the subplots to 0 if share_ax is true, otherwise the minimum distance is 0.20.
+        plt.subplots_adjust(hspace = 0)
+    else:
+        plt.subplots_adjust(hspace = 0.20)
+    plt.subplots_adjust(top = 0.97) # Adjustments to the placement of the subplots to better utilize the whitespace
+    plt.subplots_adjust(bottom = 0.07)
+    if show:
+        fig.multi = BlitCursor(fig, [plt.gca()], color = 'r', lw = 1) # Crosshair with the nearest value of every line.
+        plt.show()
+    return fig
+
+@hmprofile.timed('figure')
+def threeDGrph(threeDplots: list = [], threeDlabels: list = [], is_scatter: bool = False, file: str = '', scatsize: int = 0, show: bool = True, fig = None): # 3-D Graphing functions
+    if show: # Interactive mode redraws after every pyplot call, which only pays off in a window.
+        plt.ion()
+    from mpl_toolkits.mplot3d import Axes3D # Registers the '3d' projection on older matplotlib versions, only imported for the first 3-D plot.
+    fig = plt.figure(figsize=(10,10)) if fig is None else reuseFigure(fig, (10,10))
+    plt.style.use('default') # Changes the visual style of the plot
+    plt.rcParams['axes.linewidth'] = 1.5
+    #plt.rcParams["figure.autolayout"] = True
+    fig.canvas.manager.set_window_title("HM: " + str(file)) # Problem here with tight_layout fix later but not that important right now.
+    ax = fig.add_subplot(projection = '3d') # creates a 3D figure plot object. Axes3D(fig) no longer adds itself to the figure in newer matplotlib.
+    if is_scatter: # Scatter plot with variable point sizes as 's', and changes the color of points based on z-axis ('c' and cmap)
+        ax.scatter3D(threeDplots[0], threeDplots[1], threeDplots[2], c = threeDplots[2], cmap = 'cividis', s = scatsize, gid = 'data')
+    else: # Normal 3D line plot with default red line color
+        ax.plot3D(threeDplots[0], threeDplots[1], threeDplots[2], 'red', gid = 'data')
+    ax.set_box_aspect(aspect = (1, 1, 1))#new aspect ratio 1:1
+    ax.set_xlabel(threeDlabels[0], fontsize = 18) # Labels the x, y, and z axis.
+    ax.set_ylabel(threeDlabels[1], fontsize = 18)
+    ax.set_zlabel(threeDlabels[2], fontsize = 18)
+    if show:
+        plt.show()
+    return fig
+
+def alignRuns(runs: Sequence[Sequence[np.ndarray]], points: Optional[int] = None) -> Tuple[np.ndarray, List[List[np.ndarray]]]:
+    """Puts the y columns of several runs, each [x, y1, y2, ...], onto one common x grid spanning
+    all of them. The grid has as many evenly spaced points as the longest run unless points is
+    given, and is the x column itself when every run has the same one. A run's columns are NaN
+    outside its own x range, which matplotlib leaves blank. Returns the grid and the y columns of every run.
+    """
+    xs = [np.asarray(run[0], dtype = np.float64) for run in runs]
+    if points is None and all(len(x) == len(xs[0]) and np.array_equal(x, xs[0]) for x in xs[1:]): # Runs that wrote the same times need no interpolation.
+        return xs[0], [[np.asarray(y, dtype = np.float64) for y in run[1:]] for run in runs]
+    finite = [x[np.isfinite(x)] for x in xs]
+    low = min(x.min() for x in finite if len(x))
+    high = max(x.max() for x in finite if len(x))
+    grid = np.linspace(low, high, points or max(len(x) for x in xs))
+    aligned = []
+    for x, run in zip(xs, runs):
+        keep = np.isfinite(x)
+        order = None if isSorted(x[keep]) else np.argsort(x[keep], kind = 'stable') # np.interp needs increasing x.
+        xp = x[keep] if order is None else x[keep][order]
+        columns = []
+        for y in run[1:]:
+            fp = np.asarray(y, dtype = np.float64)[keep]
+            columns.append(np.interp(grid, xp, fp if order is None else fp[order], left = np.nan, right = np.nan) if len(xp) else np.full(len(grid), np.nan))
+        aligned.append(columns)
+    return grid, aligned
+
+def runNames(filenames: Sequence[str]) -> List[str]: # Short names that tell runs apart: the file names, or the paths below their common folder when file names repeat.
+    names = [os.path.basename(f) for f in filenames]
+    if len(set(names)) < len(names):
+        paths = [os.path.abspath(f) for f in filenames]
+        common = os.path.commonpath(paths)
+        names = [os.path.relpath(p, common) if p != common else os.path.basename(p) for p in paths]
+    return names
+
+def runColors(nRuns: int) -> list: # One color per run: matplotlib's color cycle, or viridis from the first to the last run when there are more runs than cycle colors.
+    if nRuns <= 10:
+        return [f'C{k}' for k in range(nRuns)]
+    return list(plt.get_cmap('viridis')(np.linspace(0, 0.95, nRuns)))
+
+@hmprofile.timed('figure')
+def compareGrph(labels, grid, runs, names, file, numCol, share_ax: bool = False, is_scatter: bool = False, scatsize: int = 1, downsample: str = 'off', onePlot: bool = False, show: bool = True, fig = None):
+    """Overlays the same numCol y columns of several runs, put on the common x grid by alignRuns.
+    Laid out like grph, one subplot per y column with a line in every run's color, or like
+    onePlot2D with every column on one axes, told apart by their line style. The legend
+    names the runs. Returns the figure.
+    """
+    if show:
+        plt.ion()
+    if not onePlot:
+        numCol = min(numCol, PANELS_PER_PAGE) # Comparisons are not paged, the runs of the first page of columns are overlaid.
+    graph = onePlot2D if onePlot else grph
+    fig = graph(labels, [grid] + list(runs[0]), file, numCol, share_ax, is_scatter, scatsize, False, 1, False, downsample, show = False, fig = fig) # Lays out the axes with the first run.
+    axes = fig.axes[:1] * numCol if onePlot else fig.axes
+    colors = runColors(len(runs))
+    styles = ('-', '--', ':', '-.')
+    for k, run in enumerate(runs):
+        for i, ax in enumerate(axes):
+            label = f'{labels[i+1]} ({names[k]})' if onePlot else names[k]
+            if k == 0: # Drawn by the graphing function, only its color and label change.
+                artist = [a for a in ax.lines + ax.collections if a.get_gid() == 'data'][i if onePlot else 0]
+                artist.set_label(label)
+                artist.set_color(colors[k])
+            elif is_scatter:
+                artist = plotScatter(ax, grid, run[i], scatsize, label, color = colors[k], gid = 'data')
+            else:
+                artist = plotLOD(ax, grid, run[i], label = label, downsample = downsample, color = colors[k], gid = 'data')
+            if onePlot and isinstance(artist, Line2D):
+                artist.set_linestyle(styles[i % len(styles)])
+    for ax in axes[:1] if onePlot else axes:
+        ax.legend(loc = 'upper right', fontsize = 'small', ncol = 1 + len(runs) * (numCol if onePlot else 1) // 12) # Without a legend the runs cannot be told apart.
+    rescale(fig) # The limits so far only cover the first run.
+    fig.canvas.manager.set_window_title("HM: " + str(file))
+    if show:
+        fig.multi = BlitCursor(fig, axes[:1] if onePlot else axes, color = 'r', lw = 1) # The nearest value of every run.
+        plt.show()
+    return fig
+
+def figureArtists(fig, gid: str = 'data') -> list: # The artists the graphing functions tagged with gid, one per y column: 'data' or 'trendline'.
+    return [artist for ax in fig.axes for artist in ax.lines + ax.collections + ax.images if artist.get_gid() == gid]
+
+def pointsDrawn(fig) -> int: # Points the last draw of fig handed to the renderer: line vertices after downsampling, scatter points and the points counted into density images.
+    points = 0
+    for ax in fig.axes:
+        points += sum(len(line.get_xdata()) for line in ax.lines)
+        points += sum(len(collection.get_offsets()) for collection in ax.collections)
+        points += sum(len(image.x) for image in ax.images if isinstance(image, DensityImage))
+    return points
+
+def updateArtists(artists: list, x: np.ndarray, ys: Sequence[np.ndarray], method: str = 'off'): # Gives every artist its new data in place.
+    for artist, y in zip(artists, ys):
+        if isinstance(artist, Line2D):
+            if hasattr(artist, 'lod'):
+                artist.lod.method = method # 'off' hands the full data to the line.
+                artist.lod.setData(x, y)
+            elif method != 'off' and len(y) > 2 * pointBudget(artist.axes): # A line that was short before gets downsampled from now on.
+                LODLine(artist.axes, artist, x, y, method)
+            else:
+                artist.set_data(x, y)
+        elif isinstance(artist, DensityImage):
+            artist.setData(x, y)
+        else: # Scatter points.
+            artist.set_offsets(np.column_stack((x, y)))
+
+def updateFigure(fig, x: np.ndarray, ys: Sequence[np.ndarray], method: str = 'off'): # New data for every y column of a grph or onePlot2D figure, of which a paged one only shows some.
+    pager = getattr(fig, 'pager', None)
+    if pager is not None:
+        pager.setData([x] + list(ys))
+    else:
+        updateArtists(figureArtists(fig), x, ys, method)
+
+def rescale(fig): # Fits the axes of a figure to the new data. relim() skips scatter points, so those are added by hand.
+    for ax in fig.axes:
+        ax.relim()
+        for artist in ax.collections:
+            ax.update_datalim(artist.get_offsets())
+        ax.autoscale_view()
+
+class SnapshotPlayer(object): # Animation of a numbered series of snapshots in a single figure.
+    """Plays the snapshots numbers of a series such as col.sph in one figure made by grph or
+    onePlot2D. Every frame only swaps the data of the existing lines and scatter points. A
+    background thread parses the next `prefetch` snapshots into the column cache while the
+    current one is on screen. Frame rate and parse latency are shown in the top-left corner.
+    """
+
+    INTERVAL_MS: int = 50 # Time between frames, caps playback at 20 frames per second.
+
+    def __init__(self, template: str, numbers: Sequence[int], columns: Sequence[int], labels: List[str], stepsize: int = 1, skiprows: int = 0,
+                 onePlot: bool = False, share_ax: bool = False, is_scatter: bool = False, scatsize: int = 1, legend: bool = False, downsample: str = 'off',
+                 prefetch: int = 3, interval: Optional[int] = None, show: bool = True, density: bool = False, derived = None):
+        self.template: str = template
+        self.numbers: List[int] = list(numbers)
+        self.columns: List[int] = list(columns)
+        self.stepsize: int = stepsize
+        self.skiprows: int = skiprows
+        self.prefetch: int = prefetch
+        self.downsample: str = downsample
+        self.load = derived.load if derived is not None else hmloader.loadColumns # hmexpr.DerivedColumns computes typed in columns from the ones it reads.
+        self._pending: Dict[int, Future] = {} # Snapshots queued or parsed by the prefetch thread, by position in numbers.
+        self._executor = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = 'hm-prefetch')
+        self._lastFrame: Optional[float] = None
+        self.fps: float = 0.0 # Moving averages shown in the counters.
+        self.parseTime: float = 0.0
+        self.waitTime: float = 0.0
+        data, parse = self._load(0)
+        graph = onePlot2D if onePlot else grph
+        self.fig = graph(labels, data, self.filename(0), len(self.columns) - 1, share_ax, is_scatter, scatsize, False, 1, legend, downsample, show = False, density = density) # No trendlines, refitting them every frame would stall playback.
+        self.counters = self.fig.text(0.01, 0.995, '', va = 'top', ha = 'left', family = 'monospace', fontsize = 10)
+        self.fig.player = self # The figure keeps the player and its animation alive.
+        self.fig.canvas.mpl_connect('close_event', self.stop)
+        self.animation = FuncAnimation(self.fig, self.showFrame, frames = len(self.numbers), interval = interval or self.INTERVAL_MS, repeat = True, cache_frame_data = False)
+        if show:
+            plt.ion() # Keeps plt.show() from blocking the GUI's event loop.
+            plt.show()
+
+    def filename(self, frame: int) -> str:
+        return hmloader.findFile(hmloader.numberedFilename(self.template, self.numbers[frame])) # Compressed snapshots play like plain ones.
+
+    def _load(self, frame: int) -> Tuple[List[np.ndarray], float]: # Parses one snapshot, on the prefetch thread or the GUI thread. Returns the columns and the parse time.
+        start = time.perf_counter()
+        data = self.load(self.filename(frame), self.columns, self.stepsize, self.skiprows, cache = hmloader.CACHE)
+        return data, time.perf_counter() - start
+
+    def _take(self, frame: int) -> Tuple[List[np.ndarray], float]: # Returns a snapshot and queues the next ones on the prefetch thread.
+        future = self._pending.pop(frame, None) or self._executor.submit(self._load, frame)
+        for ahead in range(1, self.prefetch + 1):
+            upcoming = (frame + ahead) % len(self.numbers)
+            if upcoming != frame and upcoming not in self._pending:
+                self._pending[upcoming] = self._executor.submit(self._load, upcoming)
+        return future.result() # Only blocks when playback is faster than parsing.
+
+    def showFrame(self, frame: int): # Called by the animation timer for every frame.
+        now = time.perf_counter()
+        if self._lastFrame is not None:
+            self.fps = 0.8 * self.fps + 0.2 / max(now - self._lastFrame, 1e-6)
+        self._lastFrame = now
+        (x, *ys), parse = self._take(frame)
+        wait = time.perf_counter() - now
+        self.parseTime = 0.8 * self.parseTime + 0.2 * parse
+        self.waitTime = 0.8 * self.waitTime + 0.2 * wait
+        updateFigure(self.fig, x, ys, self.downsample)
+        rescale(self.fig)
+        self.fig.canvas.manager.set_window_title("HM: " + self.filename(frame))
+        self.counters.set_text(f"{os.path.basename(self.filename(frame))}  {self.fps:5.1f} fps  parse {self.parseTime*1e3:6.1f} ms  wait {self.waitTime*1e3:6.1f} ms")
+        return figureArtists(self.fig) + [self.counters]
+
+    def stop(self, event=None): # Stops playback and the prefetch thread when the window closes.
+        self.animation.event_source.stop()
+        self._executor.shutdown(wait = False, cancel_futures = True)
+        self._pending.clear()
+
+class LiveView(object): # Figure that follows a file while a running simulation appends to it.
+    """Plots a file made by grph or onePlot2D and polls it every POLL_MS milliseconds. Only the
+    rows appended since the last poll are parsed (hmloader.TailReader) and the existing lines or
+    scatter points are extended in place, in the same window. The number of rows and the time
+    of the last refresh are shown in the top-left corner. A reader whose first poll already ran,
+    i.e. on a worker thread so the GUI does not wait for the whole file, is plotted as it is.
+    """
+
+    POLL_MS: int = 1000 # How often the file is checked for new rows.
+
+    def __init__(self, filename: str, columns: Sequence[int], labels: List[str], stepsize: int = 1, skiprows: int = 0,
+                 onePlot: bool = False, share_ax: bool = False, is_scatter: bool = False, scatsize: int = 1, legend: bool = False, downsample: str = 'off',
+                 interval: Optional[int] = None, show: bool = True, density: bool = False, derived = None, reader: Optional[hmloader.TailReader] = None):
+        self.columns: List[int] = list(columns)
+        self.derived = derived # hmexpr.DerivedColumns: only their source columns are followed, the rest is computed on every refresh.
+        if reader is None:
+            reader = hmloader.TailReader(filename, derived.sources(columns) if derived is not None else columns, stepsize, skiprows)
+            reader.poll()
+        self.reader = reader
+        self.downsample: str = downsample
+        graph = onePlot2D if onePlot else grph
+        self.fig = graph(labels, self.data(), filename, len(columns) - 1, share_ax, is_scatter, scatsize, False, 1, legend, downsample, show = False, density = density) # No trendlines, they would have to be refitted to the whole file on every poll.
+        self.counters = self.fig.text(0.01, 0.995, '', va = 'top', ha = 'left', family = 'monospace', fontsize = 10)
+        self.showCounters(0, 0.0)
+        self.fig.live = self # The figure keeps the view and its timer alive.
+        self.timer = self.fig.canvas.new_timer(interval = interval or self.POLL_MS)
+        self.timer.add_callback(self.refresh)
+        self.timer.start()
+        self.fig.canvas.mpl_connect('close_event', self.stop)
+        if show:
+            plt.ion() # Keeps plt.show() from blocking the GUI's event loop.
+            plt.show()
+
+    def refresh(self) -> int: # Called by the timer. Returns the number of rows added.
+        start = time.perf_counter()
+        try:
+            added = self.reader.poll()
+        except (OSError, hmloader.ColumnMismatchError): # The file is gone for the moment or a row is only half written, try again on the next poll.
+            return 0
+        if added:
+            x, *ys = self.data()
+            updateFigure(self.fig, x, ys, self.downsample)
+            rescale(self.fig)
+            self.showCounters(added, time.perf_counter() - start)
+            self.fig.canvas.draw_idle()
+        return added
+
+    def data(self) -> List[np.ndarray]: # Every column of the plot, read so far.
+        if self.derived is None:
+            return self.reader.data()
+        return self.derived.assemble(self.columns, self.reader.columns, self.reader.data())
+
+    def showCounters(self, added: int, seconds: float):
+        self.counters.set_text(f"{len(self.reader.data()[0])} rows  +{added} in {seconds*1e3:.1f} ms  (following {os.path.basename(self.reader.filename)})")
+
+    def stop(self, event=None): # Stops polling when the window closes.
+        self.timer.stop()
+
+class PlotSession(object): # One plot window that every new plot of a dialog is drawn into.
+    """Keeps the figure of the last plot. When the next plot has the same layout (graph type,
+    number of y columns, shared axis, scatter, trendline and legend settings) only the data,
+    labels and limits of the existing artists change, which takes milliseconds. Otherwise the
+    figure is cleared and drawn again in the same window. A closed window starts a new one.
+    """
+
+    def __init__(self):
+        self.fig = None
+        self.layout: Optional[tuple] = None # Settings the current figure was built with.
+
+    def alive(self) -> bool: # True while the session's window is still open.
+        return self.fig is not None and plt.fignum_exists(self.fig.number)
+
+    def plot2D(self, labels, yplot, file, numCol, share_ax: bool = False, is_scatter: bool = False, scatsize: int = 1, is_trendline: bool = False, polyDeg: int = 1, legend: bool = False, downsample: str = 'off', onePlot: bool = False, show: bool = True, density: bool = False):
+        """Same arguments as grph (onePlot2D when onePlot is True). Returns the figure."""
+        layout = ('onePlot2D' if onePlot else 'grph', numCol, share_ax, is_scatter, is_trendline, legend, is_scatter and density)
+        if self.alive() and layout == self.layout and (onePlot or numCol <= PANELS_PER_PAGE): # A paged figure is drawn again with its new pages.
+            self._update2D(labels, yplot, file, scatsize, is_trendline, polyDeg, legend, downsample, onePlot)
+            if show: # Headless callers draw when they save, Agg would draw right away here.
+                self.fig.canvas.draw_idle()
+        else:
+            graph = onePlot2D if onePlot else grph
+            self.fig = graph(labels, yplot, file, numCol, share_ax, is_scatter, scatsize, is_trendline, polyDeg, legend, downsample, show = show, fig = self.fig if self.alive() else None, density = density)
+            self.layout = layout
+        return self.fig
+
+    def plot3D(self, threeDplots: list, threeDlabels: list, is_scatter: bool = False, file: str = '', scatsize: int = 0, show: bool = True):
+        """Same arguments as threeDGrph. Returns the figure."""
+        layout = ('threeDGrph', is_scatter)
+        if self.alive() and layout == self.layout and not is_scatter: # 3-D scatter points have no public way to swap their data, so those are drawn again.
+            ax = self.fig.axes[0]
+            figureArtists(self.fig)[0].set_data_3d(*threeDplots[:3])
+            ax.auto_scale_xyz(*threeDplots[:3], had_data = False)
+            ax.set_xlabel(threeDlabels[0], fontsize = 18)
+            ax.set_ylabel(threeDlabels[1], fontsize = 18)
+            ax.set_zlabel(threeDlabels[2], fontsize = 18)
+            self.fig.canvas.manager.set_window_title("HM: " + str(file))
+            if show:
+                self.fig.canvas.draw_idle()
+        else:
+            self.fig = threeDGrph(threeDplots, threeDlabels, is_scatter, file, scatsize, show = show, fig = self.fig if self.alive() else None)
+            self.layout = layout
+        return self.fig
+
+    def compare2D(self, labels, grid, runs, names, file, numCol, share_ax: bool = False, is_scatter: bool = False, scatsize: int = 1, downsample: str = 'off', onePlot: bool = False, show: bool = True):
+        """Same arguments as compareGrph. Always drawn again, the number of runs decides the artists. Returns the figure."""
+        self.fig = compareGrph(labels, grid, runs, names, file, numCol, share_ax, is_scatter, scatsize, downsample, onePlot, show = show, fig = self.fig if self.alive() else None)
+        self.layout = ('compareGrph', len(runs)) # Never equal to a plot2D layout, so the next plain plot draws the figure again.
+        return self.fig
+
+    @hmprofile.timed('update')
+    def _update2D(self, labels, yplot, file, scatsize, is_trendline, polyDeg, legend, downsample, onePlot): # Swaps the data and labels of the existing figure.
+        x, ys = yplot[0], yplot[1:]
+        fits = fitTrendlines(x, ys, polyDeg, labels[1:]) if is_trendline else [] # Fitted first, so a failed fit leaves the old plot untouched.
+        data = figureArtists(self.fig, 'data')
+        trends = figureArtists(self.fig, 'trendline')
+        updateArtists(data, x, ys, downsample)
+        updateArtists(trends, x, [fit(x) for fit in fits], downsample)
+        for artist, label in zip(data, labels[1:]):
+            artist.set_label(label)
+            if not isinstance(artist, (Line2D, DensityImage)): # Scatter points take the new point size.
+                artist.set_sizes([scatsize])
+        for artist, fit in zip(trends, fits):
+            artist.set_label(fit.label)
+            artist.fit = fit
+        if not onePlot: # onePlot2D has no y-axis label.
+            for ax, label in zip(self.fig.axes, labels[1:]):
+                ax.set_ylabel(label + ('\n' if ax.get_ylabel().endswith('\n') else ''), fontsize = ax.yaxis.label.get_size()) # Same look as grph gave the panel.
+        for ax in self.fig.axes:
+            if ax.get_xlabel(): # The lowest panel of every column.
+                ax.set_xlabel(labels[0])
+        if legend:
+            for ax in self.fig.axes:
+                ax.legend(loc='upper right')
+        rescale(self.fig)
+        self.fig.canvas.manager.set_window_title("HM: " + str(file))
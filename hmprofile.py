@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+from typing import Callable, Dict, List, Optional
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+
+#Purpose: Timing and counters of the load-and-plot pipeline of Hypermongo.
+#Author: All rights reserved by Jacky Tran, jtran9148@gmail.com
+
+#------------------------------------------------------------------------------------------------#
+# When a plot is slow, its Profile tells where the time went: reading the file from disk,        #
+# parsing the numbers, fitting trendlines, building the figure or drawing it, next to the bytes  #
+# read, the rows parsed and kept after the stepsize and the points that were drawn. The dialog   #
+# shows it under the progress bar, the command line prints it after every figure.                #
+#                                                                                                #
+# Profiling is switched on with the HYPERMONGO_PROFILE environment variable. Without it timed()   #
+# hands back the very function it was given, and stage() and count() return at their first line, #
+# so nothing is measured and nothing is slowed down.                                             #
+#                                                                                                #
+# HYPERMONGO_PROFILE_JSON=file appends every Profile to file as one line of JSON, and            #
+# HYPERMONGO_PROFILE_STATS=file saves the cProfile statistics of the last plot, of the GUI       #
+# thread and the loading threads together, for pstats or snakeviz. Both switch profiling on.     #
+#------------------------------------------------------------------------------------------------#
+
+JSON_FILE: str = os.environ.get('HYPERMONGO_PROFILE_JSON', '')
+STATS_FILE: str = os.environ.get('HYPERMONGO_PROFILE_STATS', '')
+ENABLED: bool = bool(os.environ.get('HYPERMONGO_PROFILE') or JSON_FILE or STATS_FILE)
+STAGES = ('setName', 'load', 'disk', 'parse', 'fit', 'figure', 'update', 'draw') # Order of the stages in the report, others follow.
+
+class Profile(object): # Wall time per stage and counters of one plot, filled from any thread.
+    """Stage times are inclusive: load contains disk and parse, figure contains fit. Stages of
+    loads running at the same time add up, so they can be longer than the wall time of the plot.
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.start: float = time.perf_counter()
+        self.total: float = 0.0 # Wall time from begin() to finish().
+        self.stages: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.profilers: List[cProfile.Profile] = [] # One per use() when STATS_FILE is set.
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float):
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def count(self, counter: str, n: int):
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + int(n)
+
+    def summary(self) -> str: # One line: the total, every stage and every counter.
+        order = [s for s in STAGES if s in self.stages] + sorted(s for s in self.stages if s not in STAGES)
+        times = ', '.join(f"{stage} {self.stages[stage]:.3f}" for stage in order)
+        counts = ', '.join(f"{n/2**20:.1f} MB read" if counter == 'bytes read' else f"{n:,} {counter}" for counter, n in self.counters.items() if n) # Counters that stayed 0 are only in the JSON.
+        return f"{self.name}: {self.total:.3f} s ({times}) {counts}".rstrip()
+
+    def toDict(self) -> dict:
+        return {'name': self.name, 'time': time.time(), 'total': self.total, 'stages': dict(self.stages), 'counters': dict(self.counters)}
+
+_local = threading.local() # The Profile each thread is working for (profile), the stages it is in (active) and its cProfile (profiler).
+
+def current() -> Optional[Profile]:
+    return getattr(_local, 'profile', None)
+
+def begin(name: str) -> Optional[Profile]: # Starts the Profile of a plot and makes it current on this thread. None when profiling is off.
+    if not ENABLED:
+        return None
+    _local.profile = Profile(name)
+    return _local.profile
+
+class use(object): # with use(profile): counts the work of this thread towards profile, which may be None.
+    def __init__(self, profile: Optional[Profile]):
+        self.profile = profile
+        self.profiler: Optional[cProfile.Profile] = None
+
+    def __enter__(self):
+        if self.profile is None:
+            return self
+        self.previous = current()
+        _local.profile = self.profile
+        if STATS_FILE and not getattr(_local, 'profiler', None): # Only the outermost use() of a thread runs a profiler.
+            self.profiler = cProfile.Profile()
+            try:
+                self.profiler.enable()
+                _local.profiler = self.profiler
+            except ValueError: # Another profiler already runs on this thread.
+                self.profiler = None
+        return self
+
+    def __exit__(self, *exc):
+        if self.profile is None:
+            return
+        if self.profiler is not None:
+            self.profiler.disable()
+            _local.profiler = None
+            with self.profile._lock:
+                self.profile.profilers.append(self.profiler)
+        _local.profile = self.previous
+
+def bind(profile: Optional[Profile], function: Callable) -> Callable: # function, run under use(profile) wherever it is called from.
+    if profile is None:
+        return function
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with use(profile):
+            return function(*args, **kwargs)
+    return wrapper
+
+class _Stage(object): # Times one stage into a Profile. A stage inside itself (grph drawing a PanelPager page) is only timed once.
+    def __init__(self, profile: Profile, name: str):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        active = _local.__dict__.setdefault('active', set())
+        self.outer = self.name not in active
+        active.add(self.name)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        if self.outer:
+            self.profile.add(self.name, time.perf_counter() - self.start)
+            _local.active.discard(self.name)
+
+class _NoStage(object):
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+_NO_STAGE = _NoStage()
+
+def stage(name: str): # with stage('parse'): times the block into the current Profile, if any.
+    profile = current() if ENABLED else None
+    return _NO_STAGE if profile is None else _Stage(profile, name)
+
+def count(counter: str, n: int): # Adds n to a counter of the current Profile, if any.
+    if ENABLED:
+        profile = current()
+        if profile is not None:
+            profile.count(counter, n)
+
+def timed(name: str) -> Callable: # Decorator timing every call of a function as a stage. The function is returned unchanged when profiling is off.
+    def decorate(function: Callable) -> Callable:
+        if not ENABLED:
+            return function
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def finish(profile: Profile) -> str: # Ends a Profile, writes JSON_FILE and STATS_FILE and returns its summary.
+    profile.total = time.perf_counter() - profile.start
+    if JSON_FILE:
+        with open(JSON_FILE, 'a') as out:
+            out.write(json.dumps(profile.toDict()) + '\n')
+    if STATS_FILE and profile.profilers:
+        import pstats
+        stats = pstats.Stats(profile.profilers[0])
+        for profiler in profile.profilers[1:]:
+            stats.add(profiler)
+        stats.dump_stats(STATS_FILE)
+    if current() is profile:
+        _local.profile = None
+    return profile.summary()
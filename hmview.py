@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+from typing import Callable, List, Optional, Sequence
+import numpy as np
+from PyQt5 import QtCore, QtGui, QtWidgets
+import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgba
+try:
+    import pyqtgraph.opengl as gl # Optional, installed with: pip install pyqtgraph PyOpenGL
+except ImportError:
+    gl = None
+import hmplot
+
+#Purpose: OpenGL scatter view of Hypermongo for plots with millions of particles.
+#Author: All rights reserved by Jacky Tran, jtran9148@gmail.com
+
+#------------------------------------------------------------------------------------------------#
+# matplotlib draws every scatter point as its own marker, which stops being interactive long     #
+# before a Starsmasher snapshot runs out of particles. ScatterWindow hands the points to the     #
+# graphics card instead (pyqtgraph's OpenGL items, which also run on Mesa's software renderer),  #
+# so tens of millions of particles can be rotated and zoomed smoothly. Every column is scaled    #
+# into a unit box first, the float32 precision of OpenGL would lose the detail of values such as #
+# 1e33 otherwise. The window is only for looking around: its Export button draws the same data   #
+# with matplotlib, which stays the route to figures for papers.                                  #
+#------------------------------------------------------------------------------------------------#
+
+AVAILABLE: bool = gl is not None # False when pyqtgraph or PyOpenGL is missing, the dialog then disables the option.
+
+def unitScale(values: np.ndarray) -> np.ndarray: # Maps a column onto 0..1 as float32.
+    values = np.asarray(values, dtype = np.float64)
+    low, high = np.nanmin(values), np.nanmax(values)
+    span = high - low if high > low else 1.0
+    return ((values - low) / span).astype(np.float32)
+
+def pointPositions(x: np.ndarray, y: np.ndarray, z: Optional[np.ndarray] = None) -> np.ndarray: # (N,3) float32 positions in the unit box, z is 0 for 2-D plots.
+    pos = np.zeros((len(x), 3), dtype = np.float32)
+    pos[:, 0] = unitScale(x)
+    pos[:, 1] = unitScale(y)
+    if z is not None:
+        pos[:, 2] = unitScale(z)
+    return pos[np.isfinite(pos).all(axis = 1)] # NaN and inf rows cannot be placed.
+
+def colormapColors(values: np.ndarray, cmap: str = 'cividis') -> np.ndarray: # (N,4) float32 colors of a colormap, like scatter3D's c = z.
+    lut = plt.get_cmap(cmap)(np.linspace(0, 1, 256)).astype(np.float32) # Looking up 256 colors keeps the memory at 16 bytes per point.
+    index = np.nan_to_num(np.asarray(values, dtype = np.float32) * 255).clip(0, 255).astype(np.uint8)
+    return lut[index]
+
+def rangeText(values: np.ndarray) -> tuple: # Lowest and highest value of a column for the axis labels.
+    return format(float(np.nanmin(values)), '.4g'), format(float(np.nanmax(values)), '.4g')
+
+AXIS_TEXT = (((0, -0.08, 0), (0.92, -0.08, 0), (0.4, -0.16, 0)), # Positions of the lowest value, highest value and name of the x,
+             ((-0.2, 0, 0), (-0.2, 0.97, 0), (-0.2, 0.5, 0)),   # y and z axes around the unit box.
+             ((-0.1, -0.1, 0.02), (-0.1, -0.1, 1), (-0.1, -0.1, 0.5)))
+
+if gl is not None:
+    class PlaneView(gl.GLViewWidget): # View straight down on a 2-D scatter: dragging pans instead of rotating.
+        def mouseMoveEvent(self, ev):
+            if ev.buttons() == QtCore.Qt.LeftButton: # A flat plot has nothing to rotate.
+                lpos = ev.localPos()
+                diff = lpos - getattr(self, 'mousePos', lpos)
+                self.mousePos = lpos
+                self.pan(diff.x(), diff.y(), 0, relative = 'view')
+            else:
+                super().mouseMoveEvent(ev)
+
+        def resizeGL(self, w: int, h: int): # Called by Qt when the panel changes size.
+            self.fit()
+
+        def fit(self): # Stretches the unit square to the shape of the panel and fills the panel with it.
+            aspect = self.width() / max(self.height(), 1)
+            for item in self.items:
+                item.resetTransform()
+                item.scale(aspect, 1, 1)
+            self.opts['fov'] = ScatterWindow.FOV # A narrow field of view from far away looks like the flat projection of a 2-D plot.
+            distance = 1.35 * aspect / (2 * np.tan(np.radians(self.opts['fov']) / 2)) # Room for the axis text around the square.
+            self.setCameraPosition(pos = QtGui.QVector3D(0.47 * aspect, 0.45, 0), distance = distance, elevation = 90, azimuth = -90)
+
+class ScatterWindow(QtWidgets.QWidget): # Window with OpenGL scatter plots of the columns of one file.
+    """Shows a 3-D scatter of columns [x, y, z] when is_3D is True, otherwise one 2-D panel per
+    y column of [x, y1, y2, ...] stacked and tiled like grph, or a single panel when onePlot is True.
+    export is called by the Export button to draw the same plot with matplotlib.
+    """
+
+    FOV: float = 1.0 # Field of view of the 2-D panels in degrees.
+
+    def __init__(self, columns: List[np.ndarray], labels: List[str], file: str, is_3D: bool = False, onePlot: bool = False,
+                 scatsize: int = 1, export: Optional[Callable[[], None]] = None):
+        super().__init__()
+        if gl is None:
+            raise ImportError('The OpenGL view needs pyqtgraph and PyOpenGL')
+        self.setWindowTitle("HM: " + str(file)) # Same window title as the matplotlib plots.
+        self.resize(1000, 1000 if is_3D else 900)
+        self.views: list = []
+        self.size: float = max(1.0, float(np.sqrt(scatsize))) # matplotlib's s is an area in points^2, OpenGL points are sized by their width in pixels.
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(2)
+        if is_3D:
+            pos = pointPositions(*columns[:3])
+            self.addView(layout, pos, colormapColors(pos[:, 2]), labels[:3], columns[:3])
+        elif onePlot:
+            items = [(pointPositions(columns[0], y), to_rgba(f'C{i}')) for i, y in enumerate(columns[1:])] # matplotlib's color cycle, like onePlot2D.
+            self.addView(layout, *items[0], labels[:2], columns[:2], more = items[1:], legend = labels[1:])
+        else:
+            grid = QtWidgets.QGridLayout()
+            grid.setSpacing(2)
+            rows, cols = hmplot.panelGrid(len(columns) - 1) # Same arrangement as the matplotlib figure, without its pages.
+            for i, y in enumerate(columns[1:]):
+                self.addView(grid, pointPositions(columns[0], y), to_rgba(f'C{i}'), [labels[0], labels[i+1]], [columns[0], y], cell = (i % rows, i // rows))
+            layout.addLayout(grid, 1)
+        bar = QtWidgets.QHBoxLayout()
+        bar.setContentsMargins(6, 2, 6, 4)
+        points = len(columns[0]) * (1 if is_3D else len(columns) - 1)
+        bar.addWidget(QtWidgets.QLabel(f"{points:,} points. Drag to {'rotate' if is_3D else 'pan'}, scroll to zoom."))
+        bar.addStretch()
+        self.exportButton = QtWidgets.QPushButton("Export with matplotlib")
+        self.exportButton.setEnabled(export is not None)
+        if export is not None:
+            self.exportButton.clicked.connect(export)
+        bar.addWidget(self.exportButton)
+        layout.addLayout(bar)
+
+    def addView(self, layout, pos: np.ndarray, color, labels: List[str], columns: List[np.ndarray], more: Sequence = (), legend: Sequence[str] = (), cell: tuple = ()):
+        """Adds one OpenGL panel with a scatter item per (positions, color), a frame around the unit box
+        and the lowest and highest value and the name of each axis. cell is the (row, column) in a grid layout.
+        """
+        is_3D = len(columns) == 3
+        view = gl.GLViewWidget() if is_3D else PlaneView()
+        view.setBackgroundColor('w')
+        for p, c in [(pos, color)] + list(more):
+            view.addItem(gl.GLScatterPlotItem(pos = p, color = c, size = self.size, pxMode = True, glOptions = 'translucent')) # The default additive blending vanishes on white.
+        frame = gl.GLBoxItem(color = (0, 0, 0, 255))
+        frame.setSize(1, 1, 1 if is_3D else 0)
+        view.addItem(frame)
+        black = QtGui.QColor(0, 0, 0)
+        for (low, high, name), label, values in zip(AXIS_TEXT, labels, columns):
+            for where, text in zip((low, high, name), rangeText(values) + (label.replace('$', ''),)): # Plain text, mathtext is matplotlib's.
+                view.addItem(gl.GLTextItem(pos = np.array(where, dtype = float), text = text, color = black, glOptions = 'translucent'))
+        for i, name in enumerate(legend): # onePlot: the names in the colors of their points.
+            view.addItem(gl.GLTextItem(pos = np.array((1.02, 0.95 - 0.06 * i, 0)), text = name.replace('$', ''), color = QtGui.QColor.fromRgbF(*to_rgba(f'C{i}')), glOptions = 'translucent'))
+        if is_3D:
+            view.setCameraPosition(pos = QtGui.QVector3D(0.5, 0.5, 0.5), distance = 2.5, elevation = 20, azimuth = 45)
+        else:
+            view.fit()
+        if cell:
+            layout.addWidget(view, *cell)
+        else:
+            layout.addWidget(view, 1)
+        self.views.append(view)
+
+    def closeEvent(self, event): # Frees the point buffers as soon as the window closes.
+        for view in self.views:
+            view.clear()
+        self.views = []
+        super().closeEvent(event)
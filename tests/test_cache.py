@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the tests import hmloader from the repository root.
+import hmloader
+
+#Purpose: Tests of the column cache of hmloader (TableCache).
+
+def writeTable(filename, rows: int, offset: float = 0.0): # Three columns: row number, its square and offset.
+    data = np.column_stack([np.arange(rows, dtype = float), np.arange(rows, dtype = float) ** 2, np.full(rows, offset)])
+    np.savetxt(filename, data, fmt = '%.6f')
+
+def test_rewritten_file_is_read_again(tmp_path):
+    filename = str(tmp_path / 'run.dat')
+    writeTable(filename, 100, 1.0)
+    cache = hmloader.TableCache()
+    first = hmloader.loadColumns(filename, [0, 2], cache = cache, sidecar = False)
+    again = hmloader.loadColumns(filename, [0, 2], cache = cache, sidecar = False)
+    assert cache.hits == 2 and again[1] is first[1]
+    writeTable(filename, 100, 2.0) # Same size, new values.
+    os.utime(filename, ns = (os.stat(filename).st_atime_ns, os.stat(filename).st_mtime_ns + 10**9)) # Coarse file system clocks may not see the rewrite otherwise.
+    rewritten = hmloader.loadColumns(filename, [0, 2], cache = cache, sidecar = False)
+    assert np.all(rewritten[1] == 2.0)
+    assert len(cache._entries) == 2 # The columns of the old version are gone, not kept next to the new ones.
+    writeTable(filename, 50, 3.0) # Shorter: a new size.
+    assert len(hmloader.loadColumns(filename, [0], cache = cache, sidecar = False)[0]) == 50
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    filename = str(tmp_path / 'run.dat')
+    writeTable(filename, 1000)
+    cache = hmloader.TableCache(maxBytes = 2 * 1000 * 8) # Room for two columns.
+    hmloader.loadColumns(filename, [0], cache = cache, sidecar = False)
+    hmloader.loadColumns(filename, [1], cache = cache, sidecar = False)
+    hmloader.loadColumns(filename, [0], cache = cache, sidecar = False) # Column 0 is now the most recently used.
+    hmloader.loadColumns(filename, [2], cache = cache, sidecar = False)
+    assert cache.nbytes <= cache.maxBytes
+    cols = sorted(key[-1] for key in cache._entries)
+    assert cols == [0, 2]
+    cache.setBudget(1000 * 8)
+    assert [key[-1] for key in cache._entries] == [2]
+    hmloader.loadColumns(filename, [0, 1, 2], stepsize = 1, cache = cache, sidecar = False)
+    assert cache.nbytes <= cache.maxBytes
+
+def test_oversized_columns_are_not_cached(tmp_path):
+    filename = str(tmp_path / 'run.dat')
+    writeTable(filename, 1000)
+    cache = hmloader.TableCache(maxBytes = 100)
+    data = hmloader.loadColumns(filename, [1], cache = cache, sidecar = False)
+    assert len(data[0]) == 1000 and cache.nbytes == 0
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+import os
+import subprocess
+import sys
+import numpy as np
+
+#Purpose: Runs 'python Hypermongo.py plot' with the parse workers forced on and PyQt5 missing.
+
+REPOSITORY: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def plotParallel(tmp_path, script: str) -> subprocess.CompletedProcess: # Runs 'script plot' on a small energy file, with two parse workers and PyQt5 hidden.
+    hidden = tmp_path / 'hidden' / 'PyQt5'
+    hidden.mkdir(parents = True)
+    (hidden / '__init__.py').write_text("raise ImportError('PyQt5 is hidden by this test')\n")
+    data = tmp_path / 'energy3.sph'
+    rows = np.column_stack([np.arange(20000.0)] + [np.random.default_rng(0).standard_normal(20000) for i in range(6)])
+    np.savetxt(data, rows, fmt = '%.14E')
+    env = dict(os.environ, PYTHONPATH = os.pathsep.join([str(tmp_path / 'hidden'), REPOSITORY]), MPLBACKEND = 'Agg', HYPERMONGO_SIDECAR = '0',
+               HYPERMONGO_PARSE_JOBS = '2', HYPERMONGO_PARALLEL_MB = '0') # Every file is parsed by two worker processes.
+    return subprocess.run([sys.executable, script, 'plot', '--file', str(data), '--x', 'time', '--y', 'W', 'T', '--out', str(tmp_path / 'w.png')],
+                          cwd = str(tmp_path), env = env, capture_output = True, text = True, timeout = 300)
+
+def test_parallel_plot_without_pyqt5(tmp_path):
+    """The parse workers import Hypermongo.py again as __mp_main__, which must not need PyQt5."""
+    result = plotParallel(tmp_path, os.path.join(REPOSITORY, 'Hypermongo.py'))
+    out = tmp_path / 'w.png'
+    assert result.returncode == 0, result.stderr
+    assert 'parse workers failed' not in result.stderr # The serial fallback would hide broken workers.
+    assert out.is_file()
+
+def test_dead_workers_fall_back_to_serial_parse(tmp_path):
+    """Workers that die on start break the pool. The file is then parsed in the main process and the figure is still saved."""
+    script = tmp_path / 'dies.py'
+    script.write_text("import sys\n"
+                      "if __name__ != '__main__':\n"
+                      "    raise SystemExit('parse workers import this script and die')\n"
+                      "import hmcli\n"
+                      "sys.exit(hmcli.main(sys.argv[1:]))\n")
+    result = plotParallel(tmp_path, str(script))
+    assert result.returncode == 0, result.stderr
+    assert 'parse workers failed' in result.stderr
+    assert (tmp_path / 'w.png').is_file()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import gzip
+import lzma
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the tests import hmloader from the repository root.
+import hmloader
+
+#Purpose: Tests that gzip, xz and zstd files give the same columns as the plain file they were made from.
+
+def zstdCompress(): # compress(bytes) of zstd, None when neither Python 3.14 nor the zstandard package is there.
+    try:
+        from compression import zstd
+        return zstd.compress
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        return zstandard.ZstdCompressor().compress
+    except ImportError:
+        return None
+
+COMPRESS = {'gzip': gzip.compress, 'xz': lzma.compress, 'zstd': zstdCompress()}
+
+@pytest.fixture
+def sidecars(tmp_path, monkeypatch): # The member index goes to the test's own directory, every read is on the calling thread.
+    monkeypatch.setattr(hmloader, 'SIDECAR_DIR', str(tmp_path / 'sidecars'))
+    monkeypatch.setattr(hmloader, 'PARSE_JOBS', 1)
+    hmloader._TABLES.clear()
+    return tmp_path
+
+def writePair(directory, kind: str, members: int = 1) -> tuple: # A plain table and the same text compressed as members pieces, cut at arbitrary bytes.
+    if COMPRESS[kind] is None:
+        pytest.skip('zstd needs Python 3.14 or the zstandard package')
+    rng = np.random.default_rng(13)
+    lines = ['t a b']
+    for i in range(3000):
+        lines.append(f'{i} {rng.standard_normal():.{rng.integers(2, 12)}E} {i * 0.5}'.replace('E', 'D' if i % 2 else 'E'))
+        if rng.random() < 0.05:
+            lines.append('')
+    text = ('\n'.join(lines) + '\n').encode()
+    plain = str(directory / 'table.dat')
+    with open(plain, 'wb') as out:
+        out.write(text)
+    cuts = [0] + sorted(rng.choice(np.arange(1, len(text)), members - 1, replace = False).tolist()) + [len(text)] # Members end inside lines, one even inside the header.
+    if members > 1:
+        cuts[1] = 3
+    packed = plain + hmloader.COMPRESSIONS[kind][1]
+    with open(packed, 'wb') as out:
+        for a, b in zip(cuts[:-1], cuts[1:]):
+            out.write(COMPRESS[kind](text[a:b]))
+    return plain, packed
+
+def assertSame(plain: str, packed: str, stepsize: int, skiprows: int):
+    expected = hmloader.loadColumns(plain, [0, 1, 2], stepsize, skiprows, sidecar = False)
+    result = hmloader.loadColumns(packed, [0, 1, 2], stepsize, skiprows, sidecar = False)
+    for a, b in zip(expected, result):
+        assert np.array_equal(a, b)
+
+@pytest.mark.parametrize('stepsize', [1, 3, 8, 100])
+@pytest.mark.parametrize('kind', ['gzip', 'xz', 'zstd'])
+def test_compressed_matches_plain(sidecars, kind, stepsize):
+    plain, packed = writePair(sidecars, kind)
+    assert hmloader.compression(packed) == kind and hmloader.compression(plain) is None
+    assertSame(plain, packed, stepsize, 1)
+    assertSame(plain, packed, stepsize, 5)
+
+@pytest.mark.parametrize('jobs', [1, 2])
+@pytest.mark.parametrize('kind', ['gzip', 'xz', 'zstd'])
+def test_member_index_matches_plain(sidecars, monkeypatch, kind, jobs):
+    plain, packed = writePair(sidecars, kind, members = 40)
+    assertSame(plain, packed, 1, 1) # Streams the file and saves its member index.
+    stat = os.stat(packed)
+    members = hmloader.Sidecar(packed).loadArray('members', (stat.st_mtime_ns, stat.st_size))
+    assert members is not None and len(members) == 40
+    monkeypatch.setattr(hmloader, 'PARSE_JOBS', jobs)
+    monkeypatch.setattr(hmloader, 'RANGE_BYTES', 2000) # Runs of a few members each.
+    calls = []
+    read = hmloader._readMemberColumns
+    monkeypatch.setattr(hmloader, '_readMemberColumns', lambda *args, **kwargs: calls.append(args) or read(*args, **kwargs))
+    try:
+        for stepsize in (1, 2, 7, 8, 500):
+            for skiprows in (1, 4):
+                assertSame(plain, packed, stepsize, skiprows)
+    finally:
+        with hmloader._POOL_LOCK:
+            if hmloader._POOL is not None:
+                hmloader._POOL.shutdown()
+            hmloader._POOL = None
+    assert len(calls) == 10
+
+def test_missing_zstd_module_is_an_oserror(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'compression', None) # Makes both imports fail as if neither was installed.
+    monkeypatch.setitem(sys.modules, 'compression.zstd', None)
+    monkeypatch.setitem(sys.modules, 'zstandard', None)
+    filename = str(tmp_path / 'energy3.sph.zst')
+    with open(filename, 'wb') as out:
+        out.write(hmloader.COMPRESSIONS['zstd'][0] + bytes(60))
+    assert hmloader.compression(filename) == 'zstd'
+    with pytest.raises(OSError, match = 'zstandard'):
+        hmloader.loadColumns(filename, [0], sidecar = False)
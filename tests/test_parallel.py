@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the tests import hmloader from the repository root.
+import hmloader
+
+#Purpose: Tests that the parse workers return the same columns as parsing the file on the calling thread.
+
+@pytest.fixture
+def parallel(monkeypatch): # Every file is split into ranges of a few hundred bytes for two workers, and the calls of the parallel read are counted.
+    monkeypatch.setattr(hmloader, 'PARSE_JOBS', 2)
+    monkeypatch.setattr(hmloader, 'PARALLEL_MIN_BYTES', 0)
+    monkeypatch.setattr(hmloader, 'RANGE_BYTES', 300) # The cuts fall inside lines and move on to the next newline.
+    monkeypatch.setattr(hmloader, 'STRIDE_MIN', 1 << 30) # No seeking to rows instead.
+    calls = []
+    read = hmloader._readParallelColumns
+    monkeypatch.setattr(hmloader, '_readParallelColumns', lambda *args, **kwargs: calls.append(args) or read(*args, **kwargs))
+    yield calls
+    with hmloader._POOL_LOCK:
+        if hmloader._POOL is not None:
+            hmloader._POOL.shutdown()
+        hmloader._POOL = None
+
+def serial(monkeypatch, *args) -> list: # The same read on the calling thread.
+    with monkeypatch.context() as patch:
+        patch.setattr(hmloader, 'PARSE_JOBS', 1)
+        return hmloader._readColumns(*args)
+
+def writeTable(filename: str, rows: int = 400): # Header, lines of different lengths, blank lines and Fortran D exponents.
+    rng = np.random.default_rng(11)
+    lines = ['t x y']
+    for i in range(rows):
+        lines.append(f'{i} {rng.standard_normal() * 10.0 ** rng.integers(-5, 30):.{rng.integers(1, 15)}E} {i * 0.25}'.replace('E', 'D' if i % 3 else 'E'))
+        if rng.random() < 0.08:
+            lines.append('' if rng.random() < 0.5 else ' \t  ')
+    with open(filename, 'w') as out:
+        out.write('\n'.join(lines)) # The last line has no newline.
+
+@pytest.mark.parametrize('skiprows', [1, 4])
+@pytest.mark.parametrize('stepsize', [1, 2, 3, 7])
+def test_workers_match_the_calling_thread(tmp_path, monkeypatch, parallel, stepsize, skiprows):
+    filename = str(tmp_path / 'table.dat')
+    writeTable(filename)
+    columns = [2, 0, 1, 0]
+    expected = serial(monkeypatch, filename, columns, stepsize, skiprows)
+    result = hmloader._readColumns(filename, columns, stepsize, skiprows)
+    assert len(parallel) == 1
+    assert len(expected[0]) > 0
+    for a, b in zip(expected, result):
+        assert np.array_equal(a, b)
+
+def test_d_exponents_are_read(tmp_path, parallel):
+    filename = str(tmp_path / 'fortran.dat')
+    with open(filename, 'w') as out:
+        out.write('a b\n' + ''.join(f'{i}.5D+0{i % 10} -2.0d-1{i % 10}\n' for i in range(100)))
+    a, b = hmloader._readColumns(filename, [0, 1], 1, 1)
+    assert len(parallel) == 1
+    assert np.array_equal(a, [(i + 0.5) * 10.0 ** (i % 10) for i in range(100)])
+    assert np.array_equal(b, [-2.0 * 10.0 ** -(10 + i % 10) for i in range(100)])
+
+class DeadPool(object): # Stands in for a pool whose workers died.
+    def map(self, *args, **kwargs):
+        raise BrokenProcessPool('a worker died')
+
+    def shutdown(self, *args, **kwargs):
+        pass
+
+def test_dead_workers_fall_back_to_the_calling_thread(tmp_path, monkeypatch, parallel):
+    filename = str(tmp_path / 'table.dat')
+    writeTable(filename)
+    expected = serial(monkeypatch, filename, [0, 1], 3, 1)
+    monkeypatch.setattr(hmloader, '_POOL', DeadPool())
+    with pytest.warns(RuntimeWarning, match = 'parse workers failed'):
+        result = hmloader._readColumns(filename, [0, 1], 3, 1)
+    assert len(parallel) == 1
+    assert hmloader._POOL is None # The next big file starts new workers.
+    for a, b in zip(expected, result):
+        assert np.array_equal(a, b)
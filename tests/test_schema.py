@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the tests import hmloader from the repository root.
+import hmloader
+
+#Purpose: Tests of the header detection of hmloader (readSchema).
+
+def schemaOf(tmp_path, text: str) -> hmloader.TableSchema:
+    filename = tmp_path / 'table.dat'
+    filename.write_text(text)
+    return hmloader.readSchema(str(filename))
+
+def test_leading_lines_are_header(tmp_path):
+    schema = schemaOf(tmp_path, '# run 7\n\nt x y\n\n1 2 3\n4 5 6\n')
+    assert schema.headerLines == 3 and schema.names == ['t', 'x', 'y']
+
+def test_no_header(tmp_path):
+    schema = schemaOf(tmp_path, '1.0D+00 2 3\n4 5 6\n')
+    assert schema.headerLines == 0 and schema.names == ['col1', 'col2', 'col3']
+
+def test_later_bad_lines_are_not_header(tmp_path):
+    for bad in ('t x y', '1.2-100 5 6'): # A header repeated mid-file, a Fortran exponent without its E.
+        schema = schemaOf(tmp_path, 't x y\n1 2 3\n4 5 6\n' + bad + '\n7 8 9\n')
+        hmloader._SCHEMAS.clear()
+        assert schema.headerLines == 1 and schema.names == ['t', 'x', 'y']
+        with pytest.raises(hmloader.ColumnMismatchError): # Left to the parser instead of silently skipping the rows above it.
+            hmloader.loadColumns(schema.filename, [0, 1], 1, schema.headerLines, sidecar = False)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the tests import hmloader from the repository root.
+import hmloader
+
+#Purpose: Tests that reads through the binary sidecar give the same rows as reads of the text.
+
+@pytest.fixture
+def sidecars(tmp_path, monkeypatch): # Every sidecar of a test goes to its own directory.
+    monkeypatch.setattr(hmloader, 'SIDECAR_DIR', str(tmp_path / 'sidecars'))
+    hmloader._TABLES.clear()
+    return tmp_path
+
+def writeBlankLines(filename: str, rows: int = 5000, header: bool = True): # Rows with blank and whitespace-only lines scattered between them.
+    rng = np.random.default_rng(3)
+    lines = ['t a b'] if header else []
+    for i in range(rows):
+        lines.append(f'{i} {rng.standard_normal():.6e} {i * 0.5:.3f}')
+        if rng.random() < 0.05:
+            lines.append('' if rng.random() < 0.5 else '   \t ')
+    with open(filename, 'w') as out:
+        out.write('\n'.join(lines) + '\n')
+
+@pytest.mark.parametrize('stepsize', [1, 2, 3, 7, 8, 16, 100])
+def test_sidecar_rows_match_the_text(sidecars, stepsize):
+    filename = str(sidecars / 'blank.dat')
+    writeBlankLines(filename)
+    text = hmloader.loadColumns(filename, [0, 2], stepsize, 1, sidecar = False)
+    first = hmloader.loadColumns(filename, [0, 2], stepsize, 1, sidecar = True) # Parses and writes the sidecar (below STRIDE_MIN).
+    hmloader.loadColumns(filename, [0, 1, 2], 1, 1, sidecar = True) # Makes sure every column is stored.
+    stored = hmloader.loadColumns(filename, [0, 2], stepsize, 1, sidecar = True) # Decimates the stored columns.
+    for a, b, c in zip(text, first, stored):
+        assert np.array_equal(a, b) and np.array_equal(a, c)
+    assert np.array_equal(text[0], hmloader.loadColumns(filename, [0], stepsize, 1, mapped = True)[0])
+
+def test_files_without_blank_lines_store_no_line_index(sidecars):
+    filename = str(sidecars / 'plain.dat')
+    np.savetxt(filename, np.arange(300.0).reshape(100, 3))
+    hmloader.loadColumns(filename, [0], 1, sidecar = True)
+    assert np.array_equal(hmloader.loadColumns(filename, [0], 3, sidecar = True)[0], np.arange(0.0, 300.0, 9.0))
+    stat = os.stat(filename)
+    assert len(hmloader.Sidecar(filename).loadArray('lines', (stat.st_mtime_ns, stat.st_size))) == 0
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the tests import hmloader from the repository root.
+import hmloader
+
+#Purpose: Tests that seeking to every n-th row gives the same rows as reading the whole file, and is only done when it is faster.
+
+@pytest.fixture
+def tables(tmp_path, monkeypatch): # Row indexes go to the test's own directory.
+    monkeypatch.setattr(hmloader, 'SIDECAR_DIR', str(tmp_path / 'sidecars'))
+    hmloader._TABLES.clear()
+    return tmp_path
+
+def writeTable(filename: str, fmt: str, rows: int = 3000): # Header line and 3 columns written with fmt.
+    data = np.random.default_rng(5).standard_normal((rows, 3)) * 1e3
+    np.savetxt(filename, data, fmt = fmt, header = 'a b c', comments = '')
+    return data
+
+@pytest.mark.parametrize('stepsize', [8, 16, 63, 64, 100])
+@pytest.mark.parametrize('fmt', ['%22.14E', '%g'])
+def test_seeking_matches_reading(tables, fmt, stepsize):
+    filename = str(tables / 'table.dat')
+    data = writeTable(filename, fmt)
+    read = hmloader.loadColumns(filename, [0, 2], stepsize, 1, sidecar = False)
+    sought = hmloader.loadColumns(filename, [0, 2], stepsize, 1, sidecar = False, mapped = True)
+    for column, a, b in zip([0, 2], read, sought):
+        assert np.array_equal(a, b)
+        assert np.allclose(a, data[::stepsize, column], rtol = 1e-5)
+
+def test_uneven_files_seek_from_the_row_granule(tables):
+    fixed, uneven = str(tables / 'fixed.dat'), str(tables / 'uneven.dat')
+    writeTable(fixed, '%22.14E')
+    writeTable(uneven, '%g')
+    assert hmloader.lineWidth(fixed, 1) > 0 and hmloader.lineWidth(uneven, 1) == 0
+    assert hmloader.seeksRows(fixed, hmloader.STRIDE_MIN, 1)
+    assert not hmloader.seeksRows(uneven, hmloader.MappedTable.ROW_GRANULE - 1, 1)
+    assert hmloader.seeksRows(uneven, hmloader.MappedTable.ROW_GRANULE, 1)
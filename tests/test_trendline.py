@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import numpy as np
+import pytest
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the tests import hmplot from the repository root.
+import hmplot
+
+#Purpose: Tests that the blocked trendline fits give the same polynomials as numpy, one column at a time.
+
+def reference(x: np.ndarray, y: np.ndarray, degree: int) -> np.ndarray: # numpy's fit of the finite rows of one column, highest power first.
+    keep = np.isfinite(x) & np.isfinite(y)
+    return np.polynomial.Polynomial.fit(x[keep], y[keep], degree).convert().coef[::-1]
+
+@pytest.mark.parametrize('degree', [1, 3])
+def test_nan_only_leaves_its_own_column(monkeypatch, degree):
+    monkeypatch.setattr(hmplot, 'FIT_BLOCK_ROWS', 1000) # Several blocks, some with a NaN in one column only.
+    rng = np.random.default_rng(7)
+    x = np.linspace(-3, 5, 5000)
+    ys = [2 * x + 1 + rng.standard_normal(len(x)), x ** 3 - x + 100 + rng.standard_normal(len(x)), 0.5 * x + rng.standard_normal(len(x))]
+    ys[0][rng.random(len(x)) < 0.1] = np.nan
+    ys[1][:1500] = np.nan # No finite value in the first block.
+    x = x.copy()
+    x[::97] = np.nan
+    fits = hmplot.fitTrendlines(x, ys, degree, ['a', 'b', 'c'])
+    for fit, y in zip(fits, ys):
+        assert fit.count == np.count_nonzero(np.isfinite(x) & np.isfinite(y))
+        assert np.allclose(fit.coefficients, reference(x, y, degree), rtol = 1e-8, atol = 1e-8)
+
+def test_column_without_values_cannot_be_fitted():
+    x = np.arange(10.0)
+    with pytest.raises(hmplot.TrendlineError):
+        hmplot.fitTrendlines(x, [x, np.full(10, np.nan)], 1, ['x', 'empty'])